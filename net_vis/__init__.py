@@ -1,4 +1,6 @@
 from ._version import __version__, version_info
+from .adapters import AttributeFilter, BatchMapping, ColorMap, LayoutCache
+from .batch import ExportResult, export_dashboard, export_many
 from .html_exporter import ExportOptions, HTMLExporter
 from .netvis import NetVis
 from .plotter import Plotter
@@ -1,5 +1,9 @@
 """Adapters for converting graph formats to netvis data structures."""
 
+from net_vis.adapters.attributes import AttributeFilter
+from net_vis.adapters.colors import ColorMap
+from net_vis.adapters.layout_cache import LayoutCache
+from net_vis.adapters.mapping import BatchMapping
 from net_vis.adapters.networkx_adapter import NetworkXAdapter
 
-__all__ = ["NetworkXAdapter"]
+__all__ = ["AttributeFilter", "BatchMapping", "ColorMap", "LayoutCache", "NetworkXAdapter"]
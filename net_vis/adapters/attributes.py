@@ -0,0 +1,139 @@
+"""Attribute projection for node/edge metadata export."""
+
+from collections.abc import Collection, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+
+def _is_json_value(value: Any) -> bool:
+    """Check whether a value can be encoded by the standard json module.
+
+    Args:
+        value: Attribute value
+
+    Returns:
+        True if the value (recursively) consists of JSON-compatible types
+    """
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_is_json_value(item) for item in value)
+    if isinstance(value, dict):
+        return all(
+            (key is None or isinstance(key, (str, bool, int, float))) and _is_json_value(item)
+            for key, item in value.items()
+        )
+    return False
+
+
+def _value_size(value: Any) -> int | None:
+    """Return the size of a value for the size cap.
+
+    Args:
+        value: Attribute value
+
+    Returns:
+        Length of strings/bytes/containers, element count of arrays,
+        or None for scalars (which are never capped)
+    """
+    if isinstance(value, (str, bytes, list, tuple, dict, set, frozenset)):
+        return len(value)
+    if isinstance(value, np.ndarray):
+        return int(value.size)
+    return None
+
+
+@dataclass
+class AttributeFilter:
+    """Selects which graph attributes are exported into node/edge metadata.
+
+    Filtering is applied while attributes are extracted from the graph, so
+    rejected attributes are never copied. Derived fields added by netvis
+    ('edge_key', 'directed') are not subject to filtering.
+
+    Attributes:
+        include: Attribute names to export. None exports all attributes.
+        exclude: Attribute names that are never exported.
+        max_size: Drop values longer than this (length of strings and
+            containers, element count of arrays). None disables the cap.
+        json_only: Drop values that are not JSON-serialisable.
+
+    Examples:
+        >>> AttributeFilter(include=["name", "club"])
+        >>> AttributeFilter(exclude=["embedding"], max_size=256, json_only=True)
+    """
+
+    include: Collection[str] | None = None
+    exclude: Collection[str] = ()
+    max_size: int | None = None
+    json_only: bool = False
+
+    def __post_init__(self) -> None:
+        if isinstance(self.include, str) or isinstance(self.exclude, str):
+            raise TypeError("include/exclude must be collections of attribute names, not str")
+        if self.max_size is not None and self.max_size < 0:
+            raise ValueError("max_size must be a non-negative integer")
+        self._include = tuple(self.include) if self.include is not None else None
+        self._exclude = frozenset(self.exclude)
+        self._checks_values = self.json_only or self.max_size is not None
+
+    @classmethod
+    def coerce(cls, spec: "AttributeFilter | Iterable[str] | None") -> "AttributeFilter | None":
+        """Normalise a user-supplied projection to an AttributeFilter.
+
+        Args:
+            spec: AttributeFilter, iterable of attribute names to include,
+                or None (export everything)
+
+        Returns:
+            AttributeFilter instance, or None when no filtering is requested
+        """
+        if spec is None or isinstance(spec, AttributeFilter):
+            return spec
+        if isinstance(spec, str):
+            return cls(include=(spec,))
+        return cls(include=tuple(spec))
+
+    def accepts_value(self, value: Any) -> bool:
+        """Check a value against the type filter and size cap.
+
+        Args:
+            value: Attribute value
+
+        Returns:
+            True if the value may be exported
+        """
+        if self.json_only and not _is_json_value(value):
+            return False
+        if self.max_size is not None:
+            size = _value_size(value)
+            if size is not None and size > self.max_size:
+                return False
+        return True
+
+    def select(self, values: dict[str, Any]) -> list[tuple[str, Any]]:
+        """Select the exported (name, value) pairs from an attribute dict.
+
+        Args:
+            values: Attribute dictionary of one node or edge
+
+        Returns:
+            List of (name, value) pairs that pass the filter
+        """
+        if self._include is not None:
+            items: Iterable[tuple[str, Any]] = [
+                (name, values[name]) for name in self._include if name in values
+            ]
+        else:
+            items = values.items()
+
+        exclude = self._exclude
+        if not self._checks_values:
+            return [(name, value) for name, value in items if name not in exclude]
+        return [
+            (name, value)
+            for name, value in items
+            if name not in exclude and self.accepts_value(value)
+        ]
@@ -0,0 +1,236 @@
+"""Vectorised color scales for numeric and categorical style columns."""
+
+import re
+import zlib
+from collections import Counter
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+from ..models import StringTable
+from .mapping import BatchMapping
+
+# D3.js Category10 palette
+CATEGORY10 = (
+    "#1f77b4",
+    "#ff7f0e",
+    "#2ca02c",
+    "#d62728",
+    "#9467bd",
+    "#8c564b",
+    "#e377c2",
+    "#7f7f7f",
+    "#bcbd22",
+    "#17becf",
+)
+
+# Blue (low) to red (high)
+DEFAULT_GRADIENT = ("#0000ff", "#ff0000")
+
+_COLOR_KINDS = ("auto", "numeric", "categorical")
+
+_HEX_COLOR = re.compile(r"^#[0-9a-fA-F]{6}$")
+
+
+def _is_number_type(kind: type) -> bool:
+    """Return True for int/float/NumPy number types other than booleans."""
+    return issubclass(kind, (int, float, np.number)) and not issubclass(kind, (bool, np.bool_))
+
+
+def detect_color_type(values: Sequence[Any]) -> str:
+    """Detect whether a column of color values is numeric or categorical.
+
+    The column is treated as numeric if the majority of its non-None values
+    are numbers. Counting is done per value type, so the whole column is
+    classified in a single pass.
+
+    Args:
+        values: Color values of all nodes (sequence or NumPy array)
+
+    Returns:
+        'numeric' or 'categorical'
+    """
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iuf":
+        return "numeric" if len(values) else "categorical"
+
+    counts = Counter(map(type, values))
+    counts.pop(type(None), None)
+    total = sum(counts.values())
+    numeric = sum(count for kind, count in counts.items() if _is_number_type(kind))
+    if total > 0 and numeric / total > 0.5:
+        return "numeric"
+    return "categorical"
+
+
+def numeric_values(values: Sequence[Any]) -> np.ndarray:
+    """Convert a color column to floats, with NaN for non-numeric entries.
+
+    Args:
+        values: Color values of all nodes
+
+    Returns:
+        float64 array of the same length
+    """
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iuf":
+        return values.astype(np.float64, copy=False)
+    if all(_is_number_type(kind) for kind in set(map(type, values))):
+        return np.asarray(values, dtype=np.float64)
+    return np.array(
+        [float(value) if _is_number_type(type(value)) else np.nan for value in values],
+        dtype=np.float64,
+    )
+
+
+@lru_cache(maxsize=32)
+def gradient_table(stops: tuple[str, ...], size: int = 256) -> tuple[str, ...]:
+    """Precompute a lookup table of hex colors along a linear gradient.
+
+    Args:
+        stops: Two or more '#rrggbb' colors, evenly spaced from low to high
+        size: Number of table entries
+
+    Returns:
+        Tuple of ``size`` hex color strings
+
+    Raises:
+        ValueError: If fewer than two stops are given or a stop is not '#rrggbb'
+    """
+    if len(stops) < 2:
+        raise ValueError("A color gradient needs at least two stops")
+    if not all(_HEX_COLOR.match(stop) for stop in stops):
+        raise ValueError(f"Gradient stops must be '#rrggbb' colors, got {list(stops)}")
+
+    rgb = np.array([[int(stop[i : i + 2], 16) for i in (1, 3, 5)] for stop in stops])
+
+    positions = np.linspace(0.0, 1.0, len(stops))
+    ratios = np.linspace(0.0, 1.0, size)
+    channels = np.stack([np.interp(ratios, positions, rgb[:, c]) for c in range(3)], axis=1)
+    return tuple(
+        f"#{r:02x}{g:02x}{b:02x}" for r, g, b in np.rint(channels).astype(np.int64).tolist()
+    )
+
+
+def category_index(category: Any, size: int) -> int:
+    """Pick a palette slot for a category, stable across processes.
+
+    Python's built-in hash() of strings is randomised per process, so the
+    CRC-32 of the category's string form is used instead.
+
+    Args:
+        category: Category value
+        size: Palette size
+
+    Returns:
+        Index in [0, size)
+    """
+    return zlib.crc32(str(category).encode("utf-8")) % size
+
+
+@dataclass(frozen=True)
+class ColorMap:
+    """Color scale applied to a whole node column at once.
+
+    Numeric values are normalised to [vmin, vmax] (the column's min/max by
+    default) and mapped through a precomputed gradient lookup table;
+    categorical values are assigned palette colors by a stable hash, so the
+    same category gets the same color in every session.
+
+    Attributes:
+        source: Attribute name, function or BatchMapping producing the raw
+            values to color
+        kind: 'numeric', 'categorical', or 'auto' to detect from the values
+        gradient: Hex color stops of the numeric scale
+        palette: Hex colors of the categorical scale
+        vmin: Value mapped to the first gradient color (None for the minimum)
+        vmax: Value mapped to the last gradient color (None for the maximum)
+        lut_size: Number of precomputed gradient colors
+
+    Examples:
+        >>> plotter.add_networkx(G, node_color=ColorMap("score", vmin=0, vmax=1))
+        >>> plotter.add_networkx(G, node_color=ColorMap("community", kind="categorical"))
+    """
+
+    source: str | Callable | BatchMapping
+    kind: str = "auto"
+    gradient: Sequence[str] = DEFAULT_GRADIENT
+    palette: Sequence[str] = CATEGORY10
+    vmin: float | None = None
+    vmax: float | None = None
+    lut_size: int = 256
+
+    def __post_init__(self) -> None:
+        if self.kind not in _COLOR_KINDS:
+            raise ValueError(f"ColorMap kind must be one of {_COLOR_KINDS}, got {self.kind!r}")
+        if not self.palette:
+            raise ValueError("ColorMap palette must not be empty")
+        if self.lut_size < 2:
+            raise ValueError("ColorMap lut_size must be at least 2")
+        # Validates the gradient stops and warms the lookup table cache
+        gradient_table(tuple(self.gradient), self.lut_size)
+
+    def resolve_kind(self, values: Sequence[Any]) -> str:
+        """Return 'numeric' or 'categorical' for a column of values."""
+        return detect_color_type(values) if self.kind == "auto" else self.kind
+
+    def intern(self, values: Sequence[Any], strings: StringTable) -> np.ndarray:
+        """Map a column of raw values to interned hex colors.
+
+        Args:
+            values: Raw values of all nodes (None leaves a node uncolored)
+            strings: String table shared by the layer
+
+        Returns:
+            int32 array of string table indices (-1 where uncolored)
+        """
+        if self.resolve_kind(values) == "numeric":
+            return self._intern_numeric(values, strings)
+        return self._intern_categorical(values, strings)
+
+    def _intern_numeric(self, values: Sequence[Any], strings: StringTable) -> np.ndarray:
+        """Map numeric values through the gradient lookup table."""
+        data = numeric_values(values)
+        valid = np.isfinite(data)
+        ids = np.full(len(data), -1, dtype=np.int32)
+        if not valid.any():
+            return ids
+
+        vmin = float(data[valid].min()) if self.vmin is None else float(self.vmin)
+        vmax = float(data[valid].max()) if self.vmax is None else float(self.vmax)
+        last = self.lut_size - 1
+        if vmax == vmin:
+            slots = np.full(int(valid.sum()), last // 2, dtype=np.intp)
+        else:
+            ratios = (data[valid] - vmin) / (vmax - vmin)
+            slots = np.rint(np.clip(ratios, 0.0, 1.0) * last).astype(np.intp)
+
+        # Only the table entries in use end up in the string table
+        table = gradient_table(tuple(self.gradient), self.lut_size)
+        used, inverse = np.unique(slots, return_inverse=True)
+        used_ids = np.array([strings.intern(table[slot]) for slot in used.tolist()], np.int32)
+        ids[valid] = used_ids[inverse.reshape(-1)]
+        return ids
+
+    def _intern_categorical(self, values: Sequence[Any], strings: StringTable) -> np.ndarray:
+        """Assign palette colors to categories by stable hash."""
+        if isinstance(values, np.ndarray):
+            values = values.tolist()
+        palette_ids = [strings.intern(color) for color in self.palette]
+        # Hash each distinct category once
+        cache: dict[tuple[type, Any], int] = {}
+        ids: list[int] = []
+        for value in values:
+            if value is None:
+                ids.append(-1)
+                continue
+            try:
+                key = (value.__class__, value)
+                index = cache.get(key)
+                if index is None:
+                    index = cache[key] = palette_ids[category_index(value, len(palette_ids))]
+            except TypeError:
+                index = palette_ids[category_index(value, len(palette_ids))]
+            ids.append(index)
+        return np.array(ids, dtype=np.int32)
@@ -0,0 +1,235 @@
+"""Component-wise layout of disconnected graphs."""
+
+import math
+import os
+import warnings
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import networkx as nx
+import numpy as np
+
+# Gap between packed components, relative to the unit node spacing
+_PADDING = 1.0
+
+# Graphs with fewer nodes are laid out in-process; a pool would not pay off
+_MIN_PARALLEL_NODES = 2000
+
+
+def _connected_components(graph: Any) -> list[list[Any]]:
+    """List the (weakly) connected components of a graph.
+
+    Args:
+        graph: NetworkX graph object
+
+    Returns:
+        Node lists of each component, largest first, nodes in graph order
+    """
+    if graph.is_directed():
+        components = nx.weakly_connected_components(graph)
+    else:
+        components = nx.connected_components(graph)
+    position = {node: i for i, node in enumerate(graph)}
+    ordered = [sorted(component, key=position.__getitem__) for component in components]
+    ordered.sort(key=len, reverse=True)
+    return ordered
+
+
+def _component_graph(graph: Any, nodes: list[Any]) -> Any:
+    """Copy one component with only the attributes layouts read.
+
+    Node 'pos' and edge 'weight' attributes are kept; everything else is
+    dropped so that shipping the component to a worker process stays cheap.
+
+    Args:
+        graph: NetworkX graph object
+        nodes: Nodes of the component
+
+    Returns:
+        New graph of the same type holding the component
+    """
+    component = graph.__class__()
+    positions = graph.nodes(data="pos")
+    component.add_nodes_from(
+        (node, {"pos": positions[node]}) if positions[node] is not None else (node, {})
+        for node in nodes
+    )
+    if graph.is_multigraph():
+        edges = graph.edges(nodes, keys=True, data="weight")
+        component.add_edges_from(
+            (u, v, key, {"weight": w}) if w is not None else (u, v, key, {})
+            for u, v, key, w in edges
+        )
+    else:
+        edges = graph.edges(nodes, data="weight")
+        component.add_edges_from(
+            (u, v, {"weight": w}) if w is not None else (u, v, {}) for u, v, w in edges
+        )
+    return component
+
+
+def _layout_batch(
+    batch: list[Any], layout: str | Callable | None, options: dict[str, Any]
+) -> list[np.ndarray]:
+    """Lay out a batch of components (runs in worker processes).
+
+    Args:
+        batch: Component graphs
+        layout: Layout algorithm name, custom function, or None
+        options: Keyword arguments for the layout algorithm
+
+    Returns:
+        (m, 2) coordinate array of each component
+    """
+    from .networkx_adapter import NetworkXAdapter
+
+    return [
+        NetworkXAdapter._compute_layout(component, layout=layout, layout_options=options)
+        for component in batch
+    ]
+
+
+def _make_batches(components: list[Any], count: int) -> list[list[int]]:
+    """Split components into batches of similar total node count.
+
+    Args:
+        components: Component graphs, largest first
+        count: Number of batches
+
+    Returns:
+        Lists of component indices
+    """
+    batches: list[list[int]] = [[] for _ in range(count)]
+    loads = np.zeros(count)
+    for index, component in enumerate(components):
+        # Greedy longest-processing-time assignment
+        target = int(loads.argmin())
+        batches[target].append(index)
+        loads[target] += component.number_of_nodes() + component.number_of_edges()
+    return [batch for batch in batches if batch]
+
+
+def _normalise_component(coords: np.ndarray) -> np.ndarray:
+    """Translate a component to the origin and scale it to its node count.
+
+    A component of m nodes gets an extent of about sqrt(m), so packed
+    components keep comparable node spacing regardless of the layout's
+    own output scale.
+
+    Args:
+        coords: (m, 2) component coordinates
+
+    Returns:
+        (m, 2) coordinates with minimum (0, 0)
+    """
+    coords = coords - coords.min(axis=0)
+    extent = float(coords.max())
+    if extent > 0:
+        coords *= math.sqrt(len(coords)) / extent
+    return coords
+
+
+def _shelf_pack(sizes: np.ndarray, padding: float = _PADDING) -> np.ndarray:
+    """Pack boxes into rows (shelves) filling a roughly square area.
+
+    Boxes are placed tallest first, left to right, starting a new shelf when
+    a row exceeds the side of a square with the boxes' total area.
+
+    Args:
+        sizes: (c, 2) box widths and heights
+        padding: Gap between boxes
+
+    Returns:
+        (c, 2) lower-left corner of each box
+    """
+    padded = sizes + padding
+    row_width = max(math.sqrt(float(padded.prod(axis=1).sum())), float(padded[:, 0].max()))
+    offsets = np.zeros_like(sizes)
+    x = y = row_height = 0.0
+    for index in np.argsort(-padded[:, 1], kind="stable").tolist():
+        width, height = padded[index]
+        if x > 0 and x + width > row_width:
+            x, y, row_height = 0.0, y + row_height, 0.0
+        offsets[index] = (x, y)
+        x += width
+        row_height = max(row_height, height)
+    return offsets
+
+
+def layout_components(
+    graph: Any,
+    layout: str | Callable | None = None,
+    layout_options: dict[str, Any] | None = None,
+    workers: int | None = None,
+) -> np.ndarray:
+    """Lay out each connected component separately and pack the results.
+
+    Components are laid out independently (in a process pool for large
+    graphs), scaled to their size and packed into non-overlapping shelves,
+    so forests of many small components neither collapse into one blob nor
+    pay for a global layout.
+
+    Args:
+        graph: NetworkX graph object
+        layout: Layout algorithm name, custom function, or None
+        layout_options: Keyword arguments for the layout algorithm (e.g. seed)
+        workers: Number of worker processes. None uses all CPUs, 1 lays out
+            in-process.
+
+    Returns:
+        Array of shape (n, 2) with x/y positions in graph node order,
+        rescaled to [-1, 1]
+    """
+    options = layout_options or {}
+    node_lists = _connected_components(graph)
+
+    # Isolated nodes and pairs need no layout algorithm
+    trivial = {1: np.zeros((1, 2)), 2: np.array([[0.0, 0.0], [1.0, 0.0]])}
+    laid_out: list[np.ndarray | None] = [trivial.get(len(nodes)) for nodes in node_lists]
+    pending = [i for i, coords in enumerate(laid_out) if coords is None]
+    components = [_component_graph(graph, node_lists[i]) for i in pending]
+
+    results: list[np.ndarray] = []
+    parallel = (
+        workers != 1 and len(components) > 1 and graph.number_of_nodes() >= _MIN_PARALLEL_NODES
+    )
+    if parallel:
+        max_workers = workers or os.cpu_count() or 1
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                # Several batches per worker balance uneven component sizes
+                batches = _make_batches(components, 4 * max_workers)
+                futures = [
+                    executor.submit(_layout_batch, [components[i] for i in batch], layout, options)
+                    for batch in batches
+                ]
+                by_index: dict[int, np.ndarray] = {}
+                for batch, future in zip(batches, futures, strict=True):
+                    by_index.update(zip(batch, future.result(), strict=True))
+            results = [by_index[i] for i in range(len(components))]
+        except Exception as e:
+            # e.g. unpicklable custom layout functions or restricted environments
+            warnings.warn(f"Parallel component layout failed: {e}, laying out in-process")
+            parallel = False
+    if not parallel:
+        results = _layout_batch(components, layout, options)
+
+    for index, coords in zip(pending, results, strict=True):
+        laid_out[index] = coords
+
+    # Pack normalised components and scatter them back into graph order
+    normalised = [_normalise_component(coords) for coords in laid_out if coords is not None]
+    sizes = np.array([coords.max(axis=0) for coords in normalised])
+    offsets = _shelf_pack(sizes)
+
+    position = {node: i for i, node in enumerate(graph)}
+    packed = np.empty((graph.number_of_nodes(), 2))
+    for nodes, coords, offset in zip(node_lists, normalised, offsets, strict=True):
+        packed[[position[node] for node in nodes]] = coords + offset
+
+    packed -= (packed.min(axis=0) + packed.max(axis=0)) / 2
+    extent = float(np.abs(packed).max())
+    if extent > 0:
+        packed /= extent
+    return packed
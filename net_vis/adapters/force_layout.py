@@ -0,0 +1,894 @@
+"""NumPy force-directed layouts for large graphs."""
+
+import math
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+import numpy as np
+
+from .components import _normalise_component, _shelf_pack
+
+# Ratio between the natural edge lengths of successive coarsening levels
+_LEVEL_SCALE = math.sqrt(7 / 4)
+
+# Stop coarsening when a level shrinks the graph by less than this factor
+_MIN_REDUCTION = 0.95
+
+# Maximum quadtree depth (Morton codes use 2 bits per level)
+_MAX_DEPTH = 16
+
+# Number of bodies traversing the quadtree at once, bounding memory use
+_TRAVERSAL_CHUNK = 32768
+
+# Barnes-Hut iterations by default, reduced for graphs above _FULL_ITERATION_NODES
+_DEFAULT_ITERATIONS = 50
+_MIN_ITERATIONS = 10
+_FULL_ITERATION_NODES = 10_000
+
+
+def _graph_arrays(
+    graph: Any, weight: str | None = "weight"
+) -> tuple[list[Any], np.ndarray, np.ndarray, np.ndarray]:
+    """Convert a graph to node-index edge arrays.
+
+    Args:
+        graph: NetworkX graph object
+        weight: Edge attribute used as attraction weight (None for unweighted)
+
+    Returns:
+        Tuple of (nodes, source, target, weights). Parallel and reverse
+        edges are merged with summed weights; self-loops are dropped.
+    """
+    nodes = list(graph)
+    index = {node: i for i, node in enumerate(nodes)}
+    if weight is None:
+        rows = [(index[u], index[v], 1.0) for u, v in graph.edges()]
+    else:
+        rows = [(index[u], index[v], w) for u, v, w in graph.edges(data=weight, default=1.0)]
+    edges = np.asarray(rows, dtype=np.float64).reshape(-1, 3)
+    source, target, weights = _merge_edges(
+        edges[:, 0].astype(np.int64), edges[:, 1].astype(np.int64), edges[:, 2], len(nodes)
+    )
+    return nodes, source, target, weights
+
+
+def _merge_edges(
+    source: np.ndarray, target: np.ndarray, weights: np.ndarray, n: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Merge duplicate undirected edges and drop self-loops.
+
+    Args:
+        source: Source node indices
+        target: Target node indices
+        weights: Edge weights
+        n: Number of nodes
+
+    Returns:
+        Tuple of (source, target, weights) with source < target
+    """
+    lo = np.minimum(source, target)
+    hi = np.maximum(source, target)
+    keep = lo != hi
+    keys, inverse = np.unique(lo[keep] * n + hi[keep], return_inverse=True)
+    merged = np.bincount(inverse, weights=weights[keep], minlength=len(keys))
+    return keys // n, keys % n, merged
+
+
+def _coarsen(
+    n: int, source: np.ndarray, target: np.ndarray, weights: np.ndarray, rng: np.random.Generator
+) -> tuple[np.ndarray, int]:
+    """Cluster nodes by heavy-edge matching for one coarsening level.
+
+    Edges are visited heaviest first (random order among equal weights) and
+    both endpoints are matched if neither is matched yet. Nodes left
+    unmatched join the cluster of a matched neighbour, so star-like
+    neighbourhoods collapse instead of stalling the coarsening.
+
+    Args:
+        n: Number of nodes
+        source: Source node indices
+        target: Target node indices
+        weights: Edge weights
+        rng: Random generator
+
+    Returns:
+        Tuple of (cluster index of each node, number of clusters)
+    """
+    order = rng.permutation(len(source))
+    order = order[np.argsort(-weights[order], kind="stable")]
+
+    mate = [-1] * n
+    for u, v in zip(source[order].tolist(), target[order].tolist(), strict=True):
+        if mate[u] < 0 and mate[v] < 0:
+            mate[u] = v
+            mate[v] = u
+
+    mates = np.asarray(mate, dtype=np.int64)
+    unmatched = mates < 0
+    representative = np.arange(n)
+    matched = ~unmatched
+    representative[matched] = np.minimum(representative[matched], mates[matched])
+
+    # Attach unmatched nodes to the cluster of a matched neighbour
+    forward = unmatched[source] & matched[target]
+    representative[source[forward]] = representative[target[forward]]
+    backward = unmatched[target] & matched[source]
+    representative[target[backward]] = representative[source[backward]]
+
+    _, cluster = np.unique(representative, return_inverse=True)
+    return cluster, int(cluster.max()) + 1 if n else 0
+
+
+def _grid_cells(positions: np.ndarray) -> tuple[np.ndarray, int]:
+    """Bin nodes into the finest cells of a square grid pyramid.
+
+    Args:
+        positions: (n, 2) node positions
+
+    Returns:
+        Tuple of ((n, 2) integer cell coordinates, number of pyramid levels).
+        The finest level has 2**levels cells per side, about one cell per
+        two nodes.
+    """
+    n = len(positions)
+    levels = int(np.clip(round(math.log2(math.sqrt(max(n, 1) / 2) or 1)), 2, 10))
+    side = 2**levels
+    lower = positions.min(axis=0)
+    extent = float((positions.max(axis=0) - lower).max()) or 1.0
+    cells = np.floor((positions - lower) * (side / extent)).astype(np.int64)
+    return np.clip(cells, 0, side - 1), levels
+
+
+def _near_repulsion(
+    positions: np.ndarray, mass: np.ndarray, cells: np.ndarray, side: int, k: float
+) -> np.ndarray:
+    """Compute exact repulsion between nodes in the same or adjacent cells.
+
+    Args:
+        positions: (n, 2) node positions
+        mass: Node masses
+        cells: (n, 2) finest-level cell coordinates
+        side: Number of cells per side
+        k: Natural edge length
+
+    Returns:
+        (n, 2) displacement array
+    """
+    n = len(positions)
+    # Pad the grid by one cell on each side so neighbour keys stay in range
+    height = side + 2
+    keys = (cells[:, 0] + 1) * height + cells[:, 1] + 1
+    order = np.argsort(keys, kind="stable")
+    counts = np.bincount(keys, minlength=height * height)
+    starts = np.cumsum(counts) - counts
+
+    displacement = np.zeros_like(positions)
+    nodes = np.arange(n)
+    # Visit each pair of adjacent cells once and apply equal and opposite
+    # forces; pairs within a cell are visited in both orders
+    for dx, dy in ((0, 0), (0, 1), (1, -1), (1, 0), (1, 1)):
+        neighbour_keys = keys + dx * height + dy
+        per_node = counts[neighbour_keys]
+        total = int(per_node.sum())
+        if total == 0:
+            continue
+        i = np.repeat(nodes, per_node)
+        offsets = np.arange(total) - np.repeat(np.cumsum(per_node) - per_node, per_node)
+        j = order[np.repeat(starts[neighbour_keys], per_node) + offsets]
+
+        delta = positions[i] - positions[j]
+        dist2 = np.einsum("ij,ij->i", delta, delta)
+        apart = dist2 > 0
+        i, j, delta = i[apart], j[apart], delta[apart] * (k * k / dist2[apart])[:, None]
+
+        for axis in (0, 1):
+            displacement[:, axis] += np.bincount(i, weights=delta[:, axis] * mass[j], minlength=n)
+            if dx or dy:
+                displacement[:, axis] -= np.bincount(
+                    j, weights=delta[:, axis] * mass[i], minlength=n
+                )
+    return displacement
+
+
+def _far_repulsion(
+    positions: np.ndarray, mass: np.ndarray, cells: np.ndarray, levels: int, k: float
+) -> np.ndarray:
+    """Approximate repulsion from well-separated cells of a grid pyramid.
+
+    On each pyramid level, a cell interacts with the children of its
+    parent's neighbours that are not its own neighbours (at most 27 cells),
+    treating both as point masses at their centroids. The resulting force
+    on a cell applies to every node in it. Together with the near field of
+    adjacent finest cells this covers every pair of nodes exactly once.
+
+    Args:
+        positions: (n, 2) node positions
+        mass: Node masses
+        cells: (n, 2) finest-level cell coordinates
+        levels: Number of pyramid levels
+        k: Natural edge length
+
+    Returns:
+        (n, 2) displacement array
+    """
+    displacement = np.zeros_like(positions)
+    for level in range(2, levels + 1):
+        side = 2**level
+        level_cells = cells >> (levels - level)
+        keys = level_cells[:, 0] * side + level_cells[:, 1]
+
+        cell_mass = np.bincount(keys, weights=mass, minlength=side * side)
+        occupied = cell_mass > 0
+        centroid = np.zeros((side * side, 2))
+        for axis in (0, 1):
+            weighted = np.bincount(keys, weights=mass * positions[:, axis], minlength=side * side)
+            centroid[occupied, axis] = weighted[occupied] / cell_mass[occupied]
+        cell_mass = cell_mass.reshape(side, side)
+        centroid = centroid.reshape(side, side, 2)
+
+        # Pad by two cells so every source slice below stays in range; the
+        # zero-mass padding contributes no force
+        padded_mass = np.pad(cell_mass, 2)
+        padded_centroid = np.pad(centroid, ((2, 2), (2, 2), (0, 0)))
+        # View targets as (parent x, child x, parent y, child y)
+        half = side // 2
+        targets = centroid.reshape(half, 2, half, 2, 2)
+        force = np.zeros_like(targets)
+        child = np.arange(2)
+        for a in range(6):
+            # Source x = 2 * parent x - 2 + a; adjacent to child c if |a - 2 - c| <= 1
+            near_x = np.abs(a - 2 - child) <= 1
+            for b in range(6):
+                near_y = np.abs(b - 2 - child) <= 1
+                interacts = ~np.outer(near_x, near_y)
+                if not interacts.any():
+                    continue
+                source_mass = padded_mass[a : a + side : 2, b : b + side : 2]
+                source_centroid = padded_centroid[a : a + side : 2, b : b + side : 2]
+                delta = targets - source_centroid[:, None, :, None, :]
+                dist2 = np.maximum(np.einsum("...k,...k->...", delta, delta), 1e-12)
+                strength = source_mass[:, None, :, None] * interacts[None, :, None, :] / dist2
+                force += delta * (k * k * strength)[..., None]
+
+        displacement += force.reshape(-1, 2)[keys]
+    return displacement
+
+
+def _repulsion(positions: np.ndarray, mass: np.ndarray, k: float) -> np.ndarray:
+    """Compute repulsive displacements (force k^2 * mass / d) on all nodes.
+
+    Args:
+        positions: (n, 2) node positions
+        mass: Node masses (cluster sizes on coarse levels)
+        k: Natural edge length
+
+    Returns:
+        (n, 2) displacement array
+    """
+    cells, levels = _grid_cells(positions)
+    displacement = _near_repulsion(positions, mass, cells, 2**levels, k)
+    displacement += _far_repulsion(positions, mass, cells, levels, k)
+    return displacement
+
+
+def _attraction(
+    positions: np.ndarray, source: np.ndarray, target: np.ndarray, weights: np.ndarray, k: float
+) -> np.ndarray:
+    """Compute attractive displacements (force w * d^2 / k along each edge).
+
+    Args:
+        positions: (n, 2) node positions
+        source: Source node indices
+        target: Target node indices
+        weights: Edge weights
+        k: Natural edge length
+
+    Returns:
+        (n, 2) displacement array
+    """
+    n = len(positions)
+    delta = positions[source] - positions[target]
+    strength = weights * np.hypot(delta[:, 0], delta[:, 1]) / k
+    force = delta * strength[:, None]
+
+    displacement = np.empty_like(positions)
+    for axis in (0, 1):
+        displacement[:, axis] = np.bincount(
+            target, weights=force[:, axis], minlength=n
+        ) - np.bincount(source, weights=force[:, axis], minlength=n)
+    return displacement
+
+
+def _spread_bits(values: np.ndarray) -> np.ndarray:
+    """Insert a zero bit between each of the low 16 bits of each value."""
+    values = (values | (values << 8)) & 0x00FF00FF
+    values = (values | (values << 4)) & 0x0F0F0F0F
+    values = (values | (values << 2)) & 0x33333333
+    return (values | (values << 1)) & 0x55555555
+
+
+@dataclass
+class _QuadTree:
+    """Flattened quadtree over bodies sorted by Morton code.
+
+    Cells of all levels are stored in one set of arrays, level by level;
+    the root is cell 0. The bodies of a cell occupy a contiguous range of
+    the sorted order, and so do the children of a cell.
+
+    Attributes:
+        order: Body indices in Morton order
+        mass: Total mass of each cell
+        centroid: (cells, 2) centre of mass of each cell
+        size: Side length of each cell
+        body_start: First sorted body of each cell
+        body_end: One past the last sorted body of each cell
+        child_start: First child cell of each cell
+        child_end: One past the last child cell of each cell
+        leaf: Whether a cell is a leaf (one body, or at maximum depth)
+    """
+
+    order: np.ndarray
+    mass: np.ndarray
+    centroid: np.ndarray
+    size: np.ndarray
+    body_start: np.ndarray
+    body_end: np.ndarray
+    child_start: np.ndarray
+    child_end: np.ndarray
+    leaf: np.ndarray
+
+    @classmethod
+    def build(cls, positions: np.ndarray, mass: np.ndarray) -> "_QuadTree":
+        """Build the quadtree of a set of bodies.
+
+        Args:
+            positions: (n, 2) body positions
+            mass: Body masses
+
+        Returns:
+            Quadtree with cells down to single bodies or _MAX_DEPTH
+        """
+        n = len(positions)
+        lower = positions.min(axis=0)
+        extent = float((positions.max(axis=0) - lower).max()) or 1.0
+        side = 2**_MAX_DEPTH
+        grid = np.clip(np.floor((positions - lower) * (side / extent)), 0, side - 1)
+        grid = grid.astype(np.int64)
+        codes = (_spread_bits(grid[:, 0]) << 1) | _spread_bits(grid[:, 1])
+
+        order = np.argsort(codes, kind="stable")
+        codes = codes[order]
+        sorted_mass = mass[order]
+        weighted = positions[order] * sorted_mass[:, None]
+
+        levels = []
+        for depth in range(_MAX_DEPTH + 1):
+            prefix = codes >> (2 * (_MAX_DEPTH - depth))
+            starts = np.flatnonzero(np.r_[True, prefix[1:] != prefix[:-1]])
+            ends = np.r_[starts[1:], n]
+            leaf = (ends - starts == 1) | (depth == _MAX_DEPTH)
+            levels.append((depth, starts, ends, leaf))
+            if leaf.all():
+                break
+
+        offsets = np.cumsum([0] + [len(starts) for _, starts, _, _ in levels])
+        child_start, child_end = [], []
+        for index, (_, starts, ends, leaf) in enumerate(levels):
+            if index + 1 < len(levels):
+                finer = levels[index + 1][1]
+                first = np.searchsorted(finer, starts) + offsets[index + 1]
+                last = np.searchsorted(finer, ends) + offsets[index + 1]
+            else:
+                first = last = np.zeros(len(starts), dtype=np.int64)
+            child_start.append(np.where(leaf, 0, first))
+            child_end.append(np.where(leaf, 0, last))
+
+        body_start = np.concatenate([starts for _, starts, _, _ in levels])
+        body_end = np.concatenate([ends for _, _, ends, _ in levels])
+        # Cell sums over contiguous body ranges via prefix sums
+        mass_sums = np.concatenate([[0.0], np.cumsum(sorted_mass)])
+        weighted_sums = np.concatenate([np.zeros((1, 2)), np.cumsum(weighted, axis=0)])
+        cell_mass = mass_sums[body_end] - mass_sums[body_start]
+        centroid = (weighted_sums[body_end] - weighted_sums[body_start]) / cell_mass[:, None]
+        size = np.concatenate(
+            [np.full(len(starts), extent / 2**depth) for depth, starts, _, _ in levels]
+        )
+        return cls(
+            order=order,
+            mass=cell_mass,
+            centroid=centroid,
+            size=size,
+            body_start=body_start,
+            body_end=body_end,
+            child_start=np.concatenate(child_start),
+            child_end=np.concatenate(child_end),
+            leaf=np.concatenate([leaf for _, _, _, leaf in levels]),
+        )
+
+
+def _expand(items: np.ndarray, start: np.ndarray, end: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Pair each item with every index in its [start, end) range.
+
+    Args:
+        items: Item per range
+        start: Range starts
+        end: Range ends
+
+    Returns:
+        Tuple of (repeated items, range indices)
+    """
+    counts = end - start
+    total = int(counts.sum())
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(items, counts), np.repeat(start, counts) + offsets
+
+
+def _barnes_hut_repulsion(
+    positions: np.ndarray, mass: np.ndarray, k: float, theta: float = 1.0
+) -> np.ndarray:
+    """Approximate repulsion (force k^2 * mass / d) with a Barnes-Hut quadtree.
+
+    All bodies descend the tree together: a cell of side s at distance d
+    whose s / d is below ``theta`` (and which does not contain the body)
+    acts as a point mass at its centroid, leaf cells interact body by body,
+    and other cells are opened into their children.
+
+    Args:
+        positions: (n, 2) node positions
+        mass: Node masses
+        k: Natural edge length
+        theta: Opening angle; 0 computes exact all-pairs forces
+
+    Returns:
+        (n, 2) displacement array
+    """
+    n = len(positions)
+    tree = _QuadTree.build(positions, mass)
+    sorted_positions = positions[tree.order]
+    sorted_mass = mass[tree.order]
+    force = np.zeros((n, 2))
+
+    def accumulate(body: np.ndarray, delta: np.ndarray, strength: np.ndarray) -> None:
+        for axis in (0, 1):
+            force[:, axis] += np.bincount(body, weights=delta[:, axis] * strength, minlength=n)
+
+    for chunk in range(0, n, _TRAVERSAL_CHUNK):
+        body = np.arange(chunk, min(chunk + _TRAVERSAL_CHUNK, n))
+        cell = np.zeros(len(body), dtype=np.int64)
+        while len(body):
+            delta = sorted_positions[body] - tree.centroid[cell]
+            dist2 = np.einsum("ij,ij->i", delta, delta)
+            inside = (tree.body_start[cell] <= body) & (body < tree.body_end[cell])
+            far = ~inside & (tree.size[cell] ** 2 < theta * theta * dist2)
+            accumulate(body[far], delta[far], tree.mass[cell[far]] / dist2[far])
+
+            # Leaves interact body by body
+            leaf = ~far & tree.leaf[cell]
+            pair_body, other = _expand(
+                body[leaf], tree.body_start[cell[leaf]], tree.body_end[cell[leaf]]
+            )
+            pair_delta = sorted_positions[pair_body] - sorted_positions[other]
+            pair_dist2 = np.einsum("ij,ij->i", pair_delta, pair_delta)
+            apart = pair_dist2 > 0
+            accumulate(
+                pair_body[apart], pair_delta[apart], sorted_mass[other[apart]] / pair_dist2[apart]
+            )
+
+            # Open the remaining cells
+            opened = ~far & ~tree.leaf[cell]
+            body, cell = _expand(
+                body[opened], tree.child_start[cell[opened]], tree.child_end[cell[opened]]
+            )
+
+    displacement = np.empty_like(force)
+    displacement[tree.order] = force * (k * k)
+    return displacement
+
+
+def _refine(
+    positions: np.ndarray,
+    mass: np.ndarray,
+    source: np.ndarray,
+    target: np.ndarray,
+    weights: np.ndarray,
+    k: float,
+    iterations: int,
+    temperature: float | np.ndarray,
+    repulsion: Callable[[np.ndarray, np.ndarray, float], np.ndarray] = _repulsion,
+) -> np.ndarray:
+    """Run force-directed iterations with a cooling step limit.
+
+    Args:
+        positions: (n, 2) initial positions (updated in place)
+        mass: Node masses
+        source: Source node indices
+        target: Target node indices
+        weights: Edge weights
+        k: Natural edge length
+        iterations: Number of iterations
+        temperature: Initial maximum displacement per iteration (per node
+            if an array)
+        repulsion: Function(positions, mass, k) -> repulsive displacements
+
+    Returns:
+        (n, 2) refined positions
+    """
+    cooling = 0.1 ** (1.0 / max(iterations, 1))
+    for _ in range(iterations):
+        displacement = repulsion(positions, mass, k)
+        displacement += _attraction(positions, source, target, weights, k)
+        length = np.hypot(displacement[:, 0], displacement[:, 1])
+        step = np.minimum(1.0, temperature / np.maximum(length, 1e-12))
+        positions += displacement * step[:, None]
+        temperature *= cooling
+    return positions
+
+
+def _component_labels(n: int, source: np.ndarray, target: np.ndarray) -> tuple[np.ndarray, int]:
+    """Label connected components by vectorised hooking and pointer jumping.
+
+    Args:
+        n: Number of nodes
+        source: Source node indices
+        target: Target node indices
+
+    Returns:
+        Tuple of (component label per node, number of components). Labels
+        are numbered in order of each component's first node.
+    """
+    parent = np.arange(n)
+    while True:
+        # Hook the larger root of every edge spanning two trees to the smaller
+        lo = np.minimum(parent[source], parent[target])
+        hi = np.maximum(parent[source], parent[target])
+        spanning = lo != hi
+        if not spanning.any():
+            break
+        np.minimum.at(parent, hi[spanning], lo[spanning])
+        # Point every node straight at its root
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+    roots, labels = np.unique(parent, return_inverse=True)
+    return labels, len(roots)
+
+
+def _multilevel_positions(
+    n: int,
+    source: np.ndarray,
+    target: np.ndarray,
+    weights: np.ndarray,
+    iterations: int,
+    min_size: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Lay out one connected graph by coarsening and refining.
+
+    Args:
+        n: Number of nodes
+        source: Source node indices (merged, see _merge_edges)
+        target: Target node indices
+        weights: Edge weights
+        iterations: Force-directed iterations on the coarsest level
+        min_size: Stop coarsening at this many nodes
+        rng: Random generator for matching order and initial positions
+
+    Returns:
+        (n, 2) positions with a natural edge length of about 1
+    """
+    # Coarsen: levels[0] is the input graph, levels[-1] the coarsest
+    levels = [(n, source, target, weights, np.ones(n))]
+    clusters: list[np.ndarray] = []
+    while levels[-1][0] > max(min_size, 1):
+        size, source, target, weights, mass = levels[-1]
+        cluster, coarse_size = _coarsen(size, source, target, weights, rng)
+        if coarse_size > _MIN_REDUCTION * size:
+            break
+        coarse_mass = np.bincount(cluster, weights=mass, minlength=coarse_size)
+        coarse_edges = _merge_edges(cluster[source], cluster[target], weights, coarse_size)
+        levels.append((coarse_size, *coarse_edges, coarse_mass))
+        clusters.append(cluster)
+
+    # Lay out the coarsest level from random positions over an area ~ n * k^2
+    k = _LEVEL_SCALE ** (len(levels) - 1)
+    size, source, target, weights, mass = levels[-1]
+    side = k * math.sqrt(float(mass.sum()))
+    positions = rng.random((size, 2)) * side
+    positions = _refine(positions, mass, source, target, weights, k, iterations, side / 4)
+
+    # Project each level onto the finer one and refine
+    for level, cluster in zip(reversed(levels[:-1]), reversed(clusters), strict=True):
+        k /= _LEVEL_SCALE
+        size, source, target, weights, mass = level
+        positions = positions[cluster] + rng.uniform(-0.1 * k, 0.1 * k, size=(size, 2))
+        # Finer levels start from a good layout and need fewer iterations
+        steps = max(iterations // 5, round(iterations * math.sqrt(levels[-1][0] / size)))
+        positions = _refine(positions, mass, source, target, weights, k, steps, 2 * k)
+
+    return positions
+
+
+def _small_components(
+    members: np.ndarray,
+    sizes: np.ndarray,
+    n: int,
+    source: np.ndarray,
+    target: np.ndarray,
+    weights: np.ndarray,
+    iterations: int,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Lay out many small components in one vectorised refinement.
+
+    Each component starts at random in its own box and repels only its
+    own nodes (exactly, pair by pair), so all of them share one run of
+    force-directed iterations instead of one run each.
+
+    Args:
+        members: Nodes of the components, grouped by component
+        sizes: Node count of each component, in the order of members
+        n: Number of nodes in the whole graph
+        source: Source node indices of all edges
+        target: Target node indices of all edges
+        weights: Edge weights
+        iterations: Number of force-directed iterations
+        rng: Random generator for the initial positions
+
+    Returns:
+        Tuple of ((m, 2) positions of members, each component translated
+        to the origin and scaled as by _normalise_component, and (c, 2)
+        bounding box sizes of the components)
+    """
+    m = len(members)
+    index = np.full(n, -1, dtype=np.int64)
+    index[members] = np.arange(m)
+    inside = index[source] >= 0
+    batch_source, batch_target = index[source[inside]], index[target[inside]]
+
+    # Pair every node with the later nodes of its component
+    starts = np.cumsum(sizes) - sizes
+    rank = np.arange(m) - np.repeat(starts, sizes)
+    later = np.repeat(sizes, sizes) - 1 - rank
+    first = np.repeat(np.arange(m), later)
+    second = first + 1 + np.arange(len(first)) - np.repeat(np.cumsum(later) - later, later)
+
+    side = np.repeat(np.sqrt(sizes.astype(np.float64)), sizes)
+    positions = rng.random((m, 2)) * side[:, None]
+    positions = _refine(
+        positions,
+        np.ones(m),
+        batch_source,
+        batch_target,
+        weights[inside],
+        1.0,
+        iterations,
+        side / 4,
+        repulsion=partial(_pair_repulsion, first=first, second=second),
+    )
+
+    # Normalise each component like _normalise_component
+    positions -= np.repeat(np.minimum.reduceat(positions, starts, axis=0), sizes, axis=0)
+    extent = np.maximum.reduceat(positions, starts, axis=0).max(axis=1)
+    factor = np.sqrt(sizes) / np.where(extent > 0, extent, 1.0)
+    positions *= np.repeat(factor, sizes)[:, None]
+    return positions, np.maximum.reduceat(positions, starts, axis=0)
+
+
+def _pair_repulsion(
+    positions: np.ndarray, mass: np.ndarray, k: float, first: np.ndarray, second: np.ndarray
+) -> np.ndarray:
+    """Compute exact repulsion between the given node pairs only.
+
+    Args:
+        positions: (n, 2) node positions
+        mass: Node masses
+        k: Natural edge length
+        first: First node of each pair
+        second: Second node of each pair
+
+    Returns:
+        (n, 2) displacement array
+    """
+    n = len(positions)
+    delta = positions[first] - positions[second]
+    dist2 = np.einsum("ij,ij->i", delta, delta)
+    apart = dist2 > 0
+    first, second = first[apart], second[apart]
+    force = delta[apart] * (k * k / dist2[apart])[:, None]
+
+    displacement = np.empty_like(positions)
+    for axis in (0, 1):
+        displacement[:, axis] = np.bincount(
+            first, weights=force[:, axis] * mass[second], minlength=n
+        ) - np.bincount(second, weights=force[:, axis] * mass[first], minlength=n)
+    return displacement
+
+
+def multilevel_layout(
+    graph: Any,
+    iterations: int = 50,
+    seed: int | None = None,
+    weight: str | None = "weight",
+    min_size: int = 50,
+    scale: float = 1.0,
+) -> dict[Any, np.ndarray]:
+    """Compute a multilevel (coarsen-and-refine) force-directed layout.
+
+    The graph is repeatedly coarsened by heavy-edge matching until it has
+    at most ``min_size`` nodes. The coarsest graph is laid out from random
+    positions, then each level is projected back onto the finer graph and
+    refined with Fruchterman-Reingold iterations whose natural edge length
+    shrinks by sqrt(7/4) per level. Repulsion uses exact forces between
+    nodes in adjacent grid cells and a grid-pyramid approximation for
+    distant ones, so every step is vectorised with NumPy. Connected
+    scale-free graphs take about 1.6 s at 10k nodes, 5.8 s at 50k and
+    25 s at 200k (one core). Connected components are laid out separately
+    and packed side by side.
+
+    Args:
+        graph: NetworkX graph object (edge direction is ignored)
+        iterations: Force-directed iterations on the coarsest level (finer
+            levels run fewer, down to iterations // 5)
+        seed: Random seed for matching order and initial positions
+        weight: Edge attribute used as attraction weight (None for unweighted)
+        min_size: Stop coarsening at this many nodes
+        scale: Positions are rescaled to [-scale, scale]
+
+    Returns:
+        Dictionary mapping node IDs to (x, y) positions
+    """
+    if iterations < 0:
+        raise ValueError("iterations must be non-negative")
+
+    nodes, source, target, weights = _graph_arrays(graph, weight)
+    n = len(nodes)
+    if n == 0:
+        return {}
+
+    rng = np.random.default_rng(seed)
+    labels, count = _component_labels(n, source, target)
+    if count == 1:
+        positions = _multilevel_positions(n, source, target, weights, iterations, min_size, rng)
+        return _rescale(nodes, positions, scale)
+
+    # Separate components drift apart under repulsion and crowd the rest
+    # of the graph into a few grid cells, so they are laid out on their own
+    # and packed side by side
+    sizes = np.bincount(labels, minlength=count)
+    order = np.argsort(labels, kind="stable")
+    small = sizes <= max(min_size, 2)
+    boxes = np.empty((count, 2))
+    positions = np.empty((n, 2))
+
+    # Components that would not be coarsened anyway are refined together
+    in_small = order[small[labels[order]]]
+    if len(in_small):
+        coords, boxes[small] = _small_components(
+            in_small, sizes[small], n, source, target, weights, iterations, rng
+        )
+        positions[in_small] = coords
+
+    # Larger components go through coarsening one by one
+    starts = np.cumsum(sizes) - sizes
+    edge_labels = labels[source]
+    edge_order = np.argsort(edge_labels, kind="stable")
+    edge_sizes = np.bincount(edge_labels, minlength=count)
+    edge_starts = np.cumsum(edge_sizes) - edge_sizes
+    local = np.empty(n, dtype=np.int64)
+    for component in np.flatnonzero(~small).tolist():
+        members = order[starts[component] : starts[component] + sizes[component]]
+        local[members] = np.arange(len(members))
+        edges = edge_order[edge_starts[component] : edge_starts[component] + edge_sizes[component]]
+        coords = _multilevel_positions(
+            len(members),
+            local[source[edges]],
+            local[target[edges]],
+            weights[edges],
+            iterations,
+            min_size,
+            rng,
+        )
+        positions[members] = _normalise_component(coords)
+        boxes[component] = positions[members].max(axis=0)
+
+    offsets = _shelf_pack(boxes)
+    positions += offsets[labels]
+    return _rescale(nodes, positions, scale)
+
+
+def _default_iterations(n: int) -> int:
+    """Return the Barnes-Hut iteration count for an n-node graph.
+
+    Iterations cost O(n log n), so above _FULL_ITERATION_NODES the count
+    falls in proportion to n, keeping the total time roughly level.
+    """
+    if n <= _FULL_ITERATION_NODES:
+        return _DEFAULT_ITERATIONS
+    return max(_MIN_ITERATIONS, round(_DEFAULT_ITERATIONS * _FULL_ITERATION_NODES / n))
+
+
+def barnes_hut_layout(
+    graph: Any,
+    iterations: int | None = None,
+    theta: float = 1.0,
+    seed: int | None = None,
+    weight: str | None = "weight",
+    scale: float = 1.0,
+) -> dict[Any, np.ndarray]:
+    """Compute a Fruchterman-Reingold layout with Barnes-Hut repulsion.
+
+    Repulsive forces are approximated with a quadtree rebuilt on every
+    iteration, reducing each iteration from O(n^2) to O(n log n). Tree
+    construction and traversal are vectorised over all nodes with NumPy.
+
+    One iteration takes about 0.01 s at 1k nodes, 0.11 s at 10k, 0.7 s at
+    50k and 3.9 s at 200k (Barabasi-Albert graphs, one core). By default
+    graphs up to 10k nodes run 50 iterations, and larger ones fewer, down
+    to 10 from 50k nodes: a 200k-node layout takes about 35 s rather than
+    over 3 minutes. Pass iterations explicitly for a better-converged
+    layout, or use multilevel_layout, which lays out 200k connected nodes
+    in about 25 s.
+
+    Args:
+        graph: NetworkX graph object (edge direction is ignored)
+        iterations: Number of force-directed iterations (None scales
+            them with the graph size as above)
+        theta: Barnes-Hut opening angle; larger is faster but less
+            accurate, 0 computes exact forces
+        seed: Random seed for the initial positions
+        weight: Edge attribute used as attraction weight (None for unweighted)
+        scale: Positions are rescaled to [-scale, scale]
+
+    Returns:
+        Dictionary mapping node IDs to (x, y) positions
+    """
+    if iterations is not None and iterations < 0:
+        raise ValueError("iterations must be non-negative")
+    if theta < 0:
+        raise ValueError("theta must be non-negative")
+
+    nodes, source, target, weights = _graph_arrays(graph, weight)
+    n = len(nodes)
+    if n == 0:
+        return {}
+
+    if iterations is None:
+        iterations = _default_iterations(n)
+
+    rng = np.random.default_rng(seed)
+    side = math.sqrt(n)
+    positions = rng.random((n, 2)) * side
+    positions = _refine(
+        positions,
+        np.ones(n),
+        source,
+        target,
+        weights,
+        1.0,
+        iterations,
+        side / 4,
+        repulsion=partial(_barnes_hut_repulsion, theta=theta),
+    )
+    return _rescale(nodes, positions, scale)
+
+
+def _rescale(nodes: list[Any], positions: np.ndarray, scale: float) -> dict[Any, np.ndarray]:
+    """Centre positions, rescale them to [-scale, scale] and map them to nodes.
+
+    Args:
+        nodes: Node IDs in position order
+        positions: (n, 2) node positions
+        scale: Half-width of the output range
+
+    Returns:
+        Dictionary mapping node IDs to (x, y) positions
+    """
+    positions = positions - positions.mean(axis=0)
+    limit = float(np.abs(positions).max())
+    if limit > 0:
+        positions *= scale / limit
+    return dict(zip(nodes, positions, strict=True))
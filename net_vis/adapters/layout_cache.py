@@ -0,0 +1,257 @@
+"""Cache of computed layouts keyed by graph structure fingerprint."""
+
+import hashlib
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+_KEY_PATTERN = re.compile(r"^[0-9a-f]{40}\.npy$")
+
+
+def _hash_reprs(hasher: Any, items: Iterable[Any], batch_size: int = 8192) -> None:
+    """Feed the reprs of many items into a hasher in batches.
+
+    Args:
+        hasher: hashlib hash object
+        items: Items to hash (order-sensitive)
+        batch_size: Number of items joined per update call
+    """
+    iterator = iter(items)
+    while batch := list(islice(iterator, batch_size)):
+        hasher.update("\x1f".join(map(repr, batch)).encode("utf-8"))
+        hasher.update(b"\x1e")
+
+
+class LayoutCache:
+    """LRU cache of layout coordinates with an optional on-disk store.
+
+    Layouts are keyed by a structural fingerprint of the graph (graph type,
+    node order, edges with the attribute named by the 'weight' option,
+    'weight' by default), the layout name and
+    its options (including the seed). Node and edge styling attributes are
+    not part of the key, so re-plotting the same topology with different
+    colors or labels reuses the cached positions.
+
+    Examples:
+        In-memory cache shared by default:
+            >>> plotter.add_networkx(G, layout="kamada_kawai")  # computed
+            >>> plotter.add_networkx(G, layout="kamada_kawai")  # cache hit
+
+        Persistent cache:
+            >>> cache = LayoutCache(directory="~/.cache/netvis-layouts")
+            >>> plotter.add_networkx(G, layout="spring", layout_cache=cache)
+    """
+
+    _shared: "LayoutCache | None" = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_entries: int = 32,
+        max_bytes: int = 64 * 1024 * 1024,
+        directory: str | Path | None = None,
+        max_disk_entries: int = 256,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of layouts kept in memory
+            max_bytes: Maximum total size of in-memory coordinate arrays
+            directory: Optional directory for persisting layouts as .npy files
+            max_disk_entries: Maximum number of layouts kept on disk
+        """
+        if max_entries <= 0 or max_bytes <= 0 or max_disk_entries <= 0:
+            raise ValueError("Cache size limits must be positive")
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._max_disk_entries = max_disk_entries
+        self._directory = Path(directory).expanduser() if directory is not None else None
+        self._entries: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "LayoutCache":
+        """Return the process-wide in-memory cache used by default."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def fingerprint(
+        graph: Any,
+        layout: str,
+        options: Mapping[str, Any] | None = None,
+    ) -> str:
+        """Compute the structural cache key of a graph layout.
+
+        Args:
+            graph: NetworkX graph object
+            layout: Layout algorithm name
+            options: Layout options (e.g. seed, iterations). Its 'weight'
+                entry names the edge attribute read by the layout; None
+                ignores edge data.
+
+        Returns:
+            Hex digest identifying the layout of this topology
+        """
+        options = options or {}
+        weight = options.get("weight", "weight")
+        data = weight if weight is not None else False
+        hasher = hashlib.blake2b(digest_size=20)
+        hasher.update(type(graph).__name__.encode("utf-8"))
+        hasher.update(b"\x00")
+        hasher.update(layout.lower().encode("utf-8"))
+        hasher.update(b"\x00")
+        hasher.update(repr(sorted(options.items())).encode("utf-8"))
+        hasher.update(b"\x00")
+        _hash_reprs(hasher, graph)
+        hasher.update(b"\x00")
+        if graph.is_multigraph():
+            _hash_reprs(hasher, graph.edges(keys=True, data=data))
+        else:
+            _hash_reprs(hasher, graph.edges(data=data))
+        return hasher.hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        if key in self._entries:
+            return True
+        path = self._path(key)
+        return path is not None and path.exists()
+
+    def get(self, key: str) -> np.ndarray | None:
+        """Look up cached coordinates, falling back to the disk store.
+
+        Args:
+            key: Fingerprint from LayoutCache.fingerprint
+
+        Returns:
+            Read-only (n, 2) coordinate array, or None on a miss
+        """
+        with self._lock:
+            coords = self._entries.get(key)
+            if coords is not None:
+                self._entries.move_to_end(key)
+                return coords
+
+        path = self._path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            coords = np.load(path, allow_pickle=False)
+            # Refresh mtime so disk eviction is least-recently-used
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        self._remember(key, coords)
+        return coords
+
+    def put(self, key: str, coords: np.ndarray) -> None:
+        """Store coordinates in memory and, if configured, on disk.
+
+        Args:
+            key: Fingerprint from LayoutCache.fingerprint
+            coords: (n, 2) coordinate array
+        """
+        coords = np.array(coords, dtype=np.float64)
+        self._remember(key, coords)
+
+        path = self._path(key)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write atomically so concurrent readers never see partial files
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                np.save(fp, coords, allow_pickle=False)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self._evict_disk()
+
+    def invalidate(
+        self,
+        graph: Any,
+        layout: str,
+        options: Mapping[str, Any] | None = None,
+    ) -> bool:
+        """Drop the cached layout of one graph.
+
+        Args:
+            graph: NetworkX graph object
+            layout: Layout algorithm name
+            options: Layout options used when the layout was cached
+
+        Returns:
+            True if an entry was removed
+        """
+        key = self.fingerprint(graph, layout, options)
+        removed = False
+        with self._lock:
+            coords = self._entries.pop(key, None)
+            if coords is not None:
+                self._bytes -= coords.nbytes
+                removed = True
+        path = self._path(key)
+        if path is not None and path.exists():
+            path.unlink(missing_ok=True)
+            removed = True
+        return removed
+
+    def clear(self) -> None:
+        """Drop all cached layouts from memory and the disk store."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        for path in self._disk_files():
+            path.unlink(missing_ok=True)
+
+    def _remember(self, key: str, coords: np.ndarray) -> None:
+        """Insert an entry into the in-memory LRU and evict to size."""
+        coords.setflags(write=False)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            if coords.nbytes > self._max_bytes:
+                return
+            self._entries[key] = coords
+            self._bytes += coords.nbytes
+            while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+
+    def _path(self, key: str) -> Path | None:
+        """Return the disk store path of a key, if a directory is configured."""
+        if self._directory is None:
+            return None
+        return self._directory / f"{key}.npy"
+
+    def _disk_files(self) -> list[Path]:
+        """List layout files in the disk store."""
+        if self._directory is None or not self._directory.is_dir():
+            return []
+        return [path for path in self._directory.iterdir() if _KEY_PATTERN.match(path.name)]
+
+    def _evict_disk(self) -> None:
+        """Remove the least recently used files beyond max_disk_entries."""
+        files = self._disk_files()
+        if len(files) <= self._max_disk_entries:
+            return
+        files.sort(key=lambda path: path.stat().st_mtime)
+        for path in files[: len(files) - self._max_disk_entries]:
+            path.unlink(missing_ok=True)
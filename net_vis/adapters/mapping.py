@@ -0,0 +1,78 @@
+"""Vectorised style mappings applied to whole node/edge columns."""
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+
+def attribute_column(records: Sequence[dict], name: str) -> np.ndarray:
+    """Pull one attribute out of many attribute dicts in a single pass.
+
+    Args:
+        records: Attribute dictionaries of the nodes or edges
+        name: Attribute name
+
+    Returns:
+        Numeric array if every record holds a number (bools excluded),
+        otherwise an object array with None where the attribute is missing
+    """
+    values = [record.get(name) for record in records]
+    # Check the (few) distinct types rather than every value
+    types = set(map(type, values))
+    if types and all(
+        issubclass(kind, (int, float, np.number)) and not issubclass(kind, (bool, np.bool_))
+        for kind in types
+    ):
+        return np.asarray(values)
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+@dataclass(frozen=True)
+class BatchMapping:
+    """Style mapping evaluated once for all nodes or edges of a graph.
+
+    Plain callables passed as node_color/node_label/edge_label are called
+    once per element. Wrapping a vectorised function in BatchMapping calls
+    it once with the whole column instead, which avoids per-element Python
+    call overhead on large graphs.
+
+    Attributes:
+        func: Function receiving all inputs at once and returning one
+            result per element (a sequence or NumPy array; None entries
+            leave the element unstyled).
+        attribute: If set, ``func`` receives this attribute as a NumPy array
+            (see attribute_column); otherwise it receives the list of
+            attribute dicts.
+
+    Examples:
+        >>> BatchMapping(lambda degree: np.where(degree > 10, "red", "grey"), attribute="degree")
+        >>> BatchMapping(lambda records: [r.get("name", "").upper() for r in records])
+    """
+
+    func: Callable[[Any], Any]
+    attribute: str | None = None
+
+    def apply(self, records: Sequence[dict]) -> Sequence[Any]:
+        """Evaluate the mapping for a column of elements.
+
+        Args:
+            records: Attribute dictionaries of the nodes or edges
+
+        Returns:
+            One mapped value per record
+
+        Raises:
+            ValueError: If the function does not return one value per record
+        """
+        inputs = records if self.attribute is None else attribute_column(records, self.attribute)
+        values = self.func(inputs)
+        if np.ndim(values) != 1 or len(values) != len(records):
+            raise ValueError(
+                f"BatchMapping function must return {len(records)} values, "
+                f"got shape {np.shape(values)}"
+            )
+        return values
@@ -1,12 +1,34 @@
 """NetworkX graph adapter for converting to netvis data structures."""
 
+import inspect
 import warnings
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from typing import Any
 
 import networkx as nx
-
-from ..models import Edge, GraphLayer, Node
+import numpy as np
+
+from ..models import EdgeColumns, GraphLayer, LayerColumns, NodeColumns, StringTable
+from .attributes import AttributeFilter
+from .colors import ColorMap, detect_color_type
+from .components import layout_components
+from .force_layout import barnes_hut_layout, multilevel_layout
+from .layout_cache import LayoutCache
+from .mapping import BatchMapping
+
+# Layout functions behind the named layouts, used to check their options
+_LAYOUT_FUNCTIONS: dict[str, Callable] = {
+    "spring": nx.spring_layout,
+    "kamada_kawai": nx.kamada_kawai_layout,
+    "spectral": nx.spectral_layout,
+    "circular": nx.circular_layout,
+    "random": nx.random_layout,
+    "multilevel": multilevel_layout,
+    "barnes_hut": barnes_hut_layout,
+}
+
+# Named layouts whose positions depend only on the graph and options
+_DETERMINISTIC_LAYOUTS = frozenset({"kamada_kawai", "spectral", "circular"})
 
 
 class NetworkXAdapter:
@@ -42,197 +64,150 @@ class NetworkXAdapter:
     @staticmethod
     def _extract_nodes(
         graph: Any,
-        positions: dict[Any, Any],
-        node_color: str | Callable | None = None,
-        node_label: str | Callable | None = None,
-    ) -> list[Node]:
-        """Extract nodes from NetworkX graph with ID conversion to string.
+        coords: np.ndarray,
+        strings: StringTable,
+        node_color: str | Callable | BatchMapping | ColorMap | None = None,
+        node_label: str | Callable | BatchMapping | None = None,
+        node_attrs: AttributeFilter | None = None,
+    ) -> NodeColumns:
+        """Extract nodes from NetworkX graph into columnar storage.
+
+        Node IDs are converted to strings and interned in the layer's string
+        table; attributes are stored in sparse per-attribute columns.
 
         Args:
             graph: NetworkX graph object
-            positions: Dictionary mapping node IDs to (x, y) positions
-            node_color: Attribute name or function for color mapping
-            node_label: Attribute name or function for label mapping
+            coords: Array of shape (n, 2) with x/y positions in graph node order
+            strings: String table shared by the layer
+            node_color: Attribute name, function, BatchMapping or ColorMap for
+                color mapping
+            node_label: Attribute name, function or BatchMapping for label mapping
+            node_attrs: Projection selecting which attributes are exported
 
         Returns:
-            List of Node objects with positions and metadata
+            NodeColumns with positions, styling and attributes
         """
-        nodes = []
+        ids: list[int] = []
+        records: list[dict] = []
+        attrs: dict[str, dict[int, Any]] = {}
 
-        for node_id in graph.nodes():
+        for row, (node_id, data) in enumerate(graph.nodes(data=True)):
             # Convert node ID to string
-            node_id_str = str(node_id)
-
-            # Get position from layout (default to (0, 0) if missing)
-            x, y = positions.get(node_id, (0.0, 0.0))
-
-            # Get node attributes and preserve them in metadata
-            node_attrs = dict(graph.nodes[node_id]) if graph.nodes[node_id] else {}
-
-            # Apply color mapping
-            color = NetworkXAdapter._map_node_color(node_id, node_attrs, node_color)
-
-            # Apply label mapping
-            label = NetworkXAdapter._map_node_label(node_id, node_attrs, node_label)
-
-            # Create Node object
-            node = Node(
-                id=node_id_str,
-                x=float(x),
-                y=float(y),
-                color=color,
-                label=label,
-                metadata=node_attrs,
-            )
-
-            nodes.append(node)
-
-        return nodes
+            ids.append(strings.intern(str(node_id)))
+            records.append(data)
+
+            # Preserve node attributes in sparse columns
+            NetworkXAdapter._store_attrs(attrs, row, data, node_attrs)
+
+        # Apply color and label mapping column by column
+        return NodeColumns(
+            ids=np.array(ids, dtype=np.int32),
+            x=np.ascontiguousarray(coords[:, 0], dtype=np.float64),
+            y=np.ascontiguousarray(coords[:, 1], dtype=np.float64),
+            labels=NetworkXAdapter._map_column(records, node_label, strings),
+            colors=NetworkXAdapter._map_colors(records, node_color, strings),
+            attrs=attrs,
+        )
 
     @staticmethod
-    def _extract_edges(
-        graph: Any,
-        edge_label: str | Callable | None = None,
-    ) -> list[Edge]:
-        """Extract edges from NetworkX graph with automatic type dispatch.
+    def _store_attrs(
+        attrs: dict[str, dict[int, Any]],
+        row: int,
+        values: dict,
+        attr_filter: AttributeFilter | None = None,
+    ) -> None:
+        """Store one element's attributes into sparse attribute columns.
 
         Args:
-            graph: NetworkX graph object
-            edge_label: Attribute name or function for label mapping
-
-        Returns:
-            List of Edge objects with metadata
+            attrs: Attribute columns mapping attribute name to {row: value}
+            row: Row index of the element
+            values: Attribute dictionary of the element
+            attr_filter: Projection selecting which attributes are stored
         """
-        # Detect graph type and dispatch to appropriate extractor
-        graph_type = NetworkXAdapter._detect_graph_type(graph)
-
-        if graph_type in ("multigraph", "multidigraph"):
-            return NetworkXAdapter._expand_multigraph_edges(graph, edge_label)
-        elif graph_type == "digraph":
-            return NetworkXAdapter._extract_edges_digraph(graph, edge_label)
-        else:
-            # Basic Graph type
-            return NetworkXAdapter._extract_edges_simple(graph, edge_label)
+        items = values.items() if attr_filter is None else attr_filter.select(values)
+        for name, value in items:
+            column = attrs.get(name)
+            if column is None:
+                column = attrs[name] = {}
+            column[row] = value
 
     @staticmethod
-    def _extract_edges_simple(
+    def _extract_edges(
         graph: Any,
-        edge_label: str | Callable | None = None,
-    ) -> list[Edge]:
-        """Extract edges from NetworkX Graph (undirected, simple).
+        node_index: dict[Any, int],
+        strings: StringTable,
+        edge_label: str | Callable | BatchMapping | None = None,
+        edge_attrs: AttributeFilter | None = None,
+    ) -> EdgeColumns:
+        """Extract edges from any NetworkX graph type in a single pass.
+
+        Edge attribute dicts are read straight from ``graph.edges(data=True)``
+        (with ``keys=True`` for multigraphs), so each edge costs one graph walk
+        step instead of repeated adjacency lookups. Multiple edges between the
+        same pair of nodes are expanded into independent edge rows with their
+        keys preserved as 'edge_key'; directed graphs mark every edge with
+        'directed': True via a shared attribute.
 
         Args:
             graph: NetworkX graph object
-            edge_label: Attribute name or function for label mapping
+            node_index: Mapping from NetworkX node to node row index
+            strings: String table shared by the layer
+            edge_label: Attribute name, function or BatchMapping for label mapping
+            edge_attrs: Projection selecting which attributes are exported
 
         Returns:
-            List of Edge objects with metadata
+            EdgeColumns with attributes preserved in sparse columns
         """
-        edges = []
-
-        for source, target in graph.edges():
-            # Convert node IDs to strings
-            source_str = str(source)
-            target_str = str(target)
-
-            # Get edge attributes and preserve them in metadata
-            edge_attrs = dict(graph[source][target]) if graph[source][target] else {}
-
-            # Apply label mapping
-            label = NetworkXAdapter._map_edge_label(edge_attrs, edge_label)
-
-            # Create Edge object
-            edge = Edge(source=source_str, target=target_str, label=label, metadata=edge_attrs)
-
-            edges.append(edge)
-
-        return edges
-
-    @staticmethod
-    def _extract_edges_digraph(
-        graph: Any,
-        edge_label: str | Callable | None = None,
-    ) -> list[Edge]:
-        """Extract edges from NetworkX DiGraph (directed).
-
-        Args:
-            graph: NetworkX DiGraph object
-            edge_label: Attribute name or function for label mapping
-
-        Returns:
-            List of Edge objects with direction preserved in metadata
-        """
-        edges = []
-
-        for source, target in graph.edges():
-            # Convert node IDs to strings
-            source_str = str(source)
-            target_str = str(target)
-
-            # Get edge attributes and preserve them in metadata
-            edge_attrs = dict(graph[source][target]) if graph[source][target] else {}
-
-            # Add direction indicator to metadata for DiGraph
-            edge_attrs["directed"] = True
-
-            # Apply label mapping
-            label = NetworkXAdapter._map_edge_label(edge_attrs, edge_label)
-
-            # Create Edge object
-            edge = Edge(source=source_str, target=target_str, label=label, metadata=edge_attrs)
-
-            edges.append(edge)
-
-        return edges
-
-    @staticmethod
-    def _expand_multigraph_edges(
-        graph: Any,
-        edge_label: str | Callable | None = None,
-    ) -> list[Edge]:
-        """Extract and expand edges from NetworkX MultiGraph/MultiDiGraph.
-
-        Multiple edges between the same pair of nodes are expanded into
-        independent Edge objects, with edge keys preserved in metadata.
-
-        Args:
-            graph: NetworkX MultiGraph or MultiDiGraph object
-            edge_label: Attribute name or function for label mapping
-
-        Returns:
-            List of Edge objects with edge keys preserved in metadata
-        """
-        edges = []
-
-        # Check if this is a directed multigraph
         graph_type = NetworkXAdapter._detect_graph_type(graph)
-        is_directed = graph_type == "multidigraph"
-
-        # MultiGraph.edges() returns (source, target, key) tuples
-        for source, target, key in graph.edges(keys=True):
-            # Convert node IDs to strings
-            source_str = str(source)
-            target_str = str(target)
-
-            # Get edge attributes for this specific edge key
-            edge_attrs = dict(graph[source][target][key]) if graph[source][target][key] else {}
-
-            # Preserve edge key in metadata
-            edge_attrs["edge_key"] = key
-
-            # Add direction indicator for MultiDiGraph
-            if is_directed:
-                edge_attrs["directed"] = True
-
-            # Apply label mapping
-            label = NetworkXAdapter._map_edge_label(edge_attrs, edge_label)
-
-            # Create Edge object
-            edge = Edge(source=source_str, target=target_str, label=label, metadata=edge_attrs)
-
-            edges.append(edge)
+        is_multi = graph_type in ("multigraph", "multidigraph")
+        is_directed = graph_type in ("digraph", "multidigraph")
+        shared_attrs: dict[str, Any] = {"directed": True} if is_directed else {}
+
+        sources: list[int] = []
+        targets: list[int] = []
+        records: list[dict] = []
+        attrs: dict[str, dict[int, Any]] = {}
+        edge_keys: dict[int, Any] = {}
+
+        if is_multi:
+            edge_iter = graph.edges(keys=True, data=True)
+        else:
+            edge_iter = (
+                (source, target, None, data) for source, target, data in graph.edges(data=True)
+            )
 
-        return edges
+        for row, (source, target, key, data) in enumerate(edge_iter):
+            sources.append(node_index[source])
+            targets.append(node_index[target])
+
+            # Preserve edge attributes in sparse columns (no per-edge dict copy)
+            NetworkXAdapter._store_attrs(attrs, row, data, edge_attrs)
+            if is_multi:
+                edge_keys[row] = key
+
+            # Collect the label mapping input; the mapped view includes the
+            # derived 'edge_key'/'directed' fields, so only build it when needed
+            if edge_label is None:
+                continue
+            if is_multi or is_directed:
+                data = dict(data)
+                if is_multi:
+                    data["edge_key"] = key
+                data.update(shared_attrs)
+            records.append(data)
+
+        # Preserve multigraph edge keys in metadata
+        if is_multi:
+            attrs["edge_key"] = edge_keys
+
+        return EdgeColumns(
+            source=np.array(sources, dtype=np.int32),
+            target=np.array(targets, dtype=np.int32),
+            labels=NetworkXAdapter._map_column(records, edge_label, strings, len(sources)),
+            weight=np.full(len(sources), np.nan, dtype=np.float64),
+            attrs=attrs,
+            shared_attrs=shared_attrs,
+        )
 
     @staticmethod
     def _get_existing_positions(graph: Any) -> dict[Any, Any] | None:
@@ -256,23 +231,29 @@ class NetworkXAdapter:
         return positions if has_positions else None
 
     @staticmethod
-    def _apply_spring_layout(graph: Any) -> dict[Any, Any]:
+    def _apply_spring_layout(graph: Any, **options: Any) -> dict[Any, Any]:
         """Apply spring (force-directed) layout.
 
         Args:
             graph: NetworkX graph object
+            **options: Keyword arguments for nx.spring_layout
+                (e.g. seed, k, iterations, weight)
 
         Returns:
             Dictionary mapping node IDs to (x, y) positions
         """
-        return nx.spring_layout(graph)
+        return nx.spring_layout(graph, **options)
 
     @staticmethod
-    def _apply_kamada_kawai_layout(graph: Any) -> dict[Any, Any]:
+    def _apply_kamada_kawai_layout(graph: Any, **options: Any) -> dict[Any, Any]:
         """Apply Kamada-Kawai layout.
 
+        Deterministic: it starts from a circular layout unless 'pos' is given.
+
         Args:
             graph: NetworkX graph object
+            **options: Keyword arguments for nx.kamada_kawai_layout
+                (e.g. weight, dist, pos, scale)
 
         Returns:
             Dictionary mapping node IDs to (x, y) positions
@@ -287,14 +268,16 @@ class NetworkXAdapter:
                 "Layout 'kamada_kawai' requires scipy. Install with: pip install net_vis[full]"
             )
 
-        return nx.kamada_kawai_layout(graph)
+        return nx.kamada_kawai_layout(graph, **options)
 
     @staticmethod
-    def _apply_spectral_layout(graph: Any) -> dict[Any, Any]:
-        """Apply spectral layout.
+    def _apply_spectral_layout(graph: Any, **options: Any) -> dict[Any, Any]:
+        """Apply spectral layout (deterministic).
 
         Args:
             graph: NetworkX graph object
+            **options: Keyword arguments for nx.spectral_layout
+                (e.g. weight, scale, center)
 
         Returns:
             Dictionary mapping node IDs to (x, y) positions
@@ -309,31 +292,63 @@ class NetworkXAdapter:
                 "Layout 'spectral' requires scipy. Install with: pip install net_vis[full]"
             )
 
-        return nx.spectral_layout(graph)
+        return nx.spectral_layout(graph, **options)
 
     @staticmethod
-    def _apply_circular_layout(graph: Any) -> dict[Any, Any]:
-        """Apply circular layout.
+    def _apply_circular_layout(graph: Any, **options: Any) -> dict[Any, Any]:
+        """Apply circular layout (deterministic).
 
         Args:
             graph: NetworkX graph object
+            **options: Keyword arguments for nx.circular_layout
+                (scale, center, dim)
 
         Returns:
             Dictionary mapping node IDs to (x, y) positions
         """
-        return nx.circular_layout(graph)
+        return nx.circular_layout(graph, **options)
 
     @staticmethod
-    def _apply_random_layout(graph: Any) -> dict[Any, Any]:
+    def _apply_random_layout(graph: Any, **options: Any) -> dict[Any, Any]:
         """Apply random layout.
 
         Args:
             graph: NetworkX graph object
+            **options: Keyword arguments for nx.random_layout
+                (seed, center, dim)
+
+        Returns:
+            Dictionary mapping node IDs to (x, y) positions
+        """
+        return nx.random_layout(graph, **options)
+
+    @staticmethod
+    def _apply_multilevel_layout(graph: Any, **options: Any) -> dict[Any, Any]:
+        """Apply multilevel (coarsen-and-refine) force-directed layout.
+
+        Args:
+            graph: NetworkX graph object
+            **options: Keyword arguments forwarded to multilevel_layout
+                (e.g. seed, iterations)
+
+        Returns:
+            Dictionary mapping node IDs to (x, y) positions
+        """
+        return multilevel_layout(graph, **options)
+
+    @staticmethod
+    def _apply_barnes_hut_layout(graph: Any, **options: Any) -> dict[Any, Any]:
+        """Apply force-directed layout with Barnes-Hut repulsion.
+
+        Args:
+            graph: NetworkX graph object
+            **options: Keyword arguments forwarded to barnes_hut_layout
+                (e.g. seed, iterations, theta)
 
         Returns:
             Dictionary mapping node IDs to (x, y) positions
         """
-        return nx.random_layout(graph)
+        return barnes_hut_layout(graph, **options)
 
     @staticmethod
     def _apply_custom_layout(graph: Any, layout_func: Callable) -> dict[Any, Any]:
@@ -349,46 +364,278 @@ class NetworkXAdapter:
         return layout_func(graph)
 
     @staticmethod
-    def _validate_positions(positions: dict[Any, Any]) -> bool:
-        """Validate that positions don't contain NaN or inf values.
+    def _supported_options(layout: str, options: dict[str, Any]) -> dict[str, Any]:
+        """Drop layout options the named layout does not accept.
+
+        Args:
+            layout: Lower-case layout name
+            options: Keyword arguments for the layout algorithm
+
+        Returns:
+            Options accepted by the layout function. Unsupported ones are
+            dropped with a warning rather than failing the layout.
+        """
+        func = _LAYOUT_FUNCTIONS.get(layout)
+        if func is None or not options:
+            return options
+        accepted = list(inspect.signature(func).parameters)[1:]
+        unsupported = sorted(name for name in options if name not in accepted)
+        if not unsupported:
+            return options
+        warnings.warn(f"Layout '{layout}' does not accept options {unsupported}, ignoring them")
+        return {name: value for name, value in options.items() if name not in unsupported}
+
+    @staticmethod
+    def _apply_incremental_layout(
+        graph: Any,
+        initial_positions: dict[Any, Any],
+        fix_unchanged: bool = False,
+        **options: Any,
+    ) -> dict[Any, Any]:
+        """Apply spring layout warm-started from previous positions.
+
+        Nodes with a prior position start there; new nodes start at the mean
+        position of their already placed neighbours (or at a random point in
+        the prior bounding box). Only a few iterations are run and the result
+        is not rescaled, so the picture stays stable between snapshots.
+
+        Args:
+            graph: NetworkX graph object
+            initial_positions: Mapping from node to prior (x, y) position
+            fix_unchanged: Keep nodes with a prior position fixed
+            **options: Keyword arguments forwarded to nx.spring_layout
+                (defaults: iterations=15, scale=None)
+
+        Returns:
+            Dictionary mapping node IDs to (x, y) positions
+        """
+        known = [node_id for node_id in graph if node_id in initial_positions]
+        if not known:
+            return NetworkXAdapter._apply_spring_layout(graph, **options)
+
+        init = {
+            node_id: np.asarray(initial_positions[node_id], dtype=np.float64)[:2]
+            for node_id in known
+        }
+        coords = np.array(list(init.values()))
+        low, high = coords.min(axis=0), coords.max(axis=0)
+        span = max(float((high - low).max()), 1e-3)
+        rng = np.random.default_rng(options.get("seed"))
+
+        # Place new nodes next to their placed neighbours, repeating so that
+        # chains of new nodes grow outwards from the existing layout
+        pending = [node_id for node_id in graph if node_id not in init]
+        while pending:
+            remaining = []
+            for node_id in pending:
+                placed = [init[nbr] for nbr in nx.all_neighbors(graph, node_id) if nbr in init]
+                if placed:
+                    jitter = rng.normal(scale=0.05 * span, size=2)
+                    init[node_id] = np.mean(placed, axis=0) + jitter
+                else:
+                    remaining.append(node_id)
+            if len(remaining) == len(pending):
+                for node_id in remaining:
+                    init[node_id] = low + rng.random(2) * (high - low + 1e-3)
+                break
+            pending = remaining
+
+        kwargs: dict[str, Any] = {"iterations": 15, "scale": None, **options, "pos": init}
+        if fix_unchanged:
+            kwargs["fixed"] = known
+        return nx.spring_layout(graph, **kwargs)
+
+    @staticmethod
+    def _pack_positions(graph: Any, positions: dict[Any, Any]) -> np.ndarray:
+        """Pack a layout position dictionary into a single coordinate array.
 
         Args:
+            graph: NetworkX graph object
             positions: Dictionary mapping node IDs to (x, y) positions
 
+        Returns:
+            Array of shape (n, 2) in graph node order. Nodes missing from
+            ``positions`` are placed at (0, 0).
+        """
+        if graph.number_of_nodes() == 0:
+            return np.empty((0, 2), dtype=np.float64)
+
+        default = (0.0, 0.0)
+        coords = np.asarray(
+            [positions.get(node_id, default) for node_id in graph], dtype=np.float64
+        )
+        if coords.ndim != 2 or coords.shape[1] < 2:
+            raise ValueError(f"Layout positions must be (x, y) pairs, got shape {coords.shape}")
+        return coords[:, :2]
+
+    @staticmethod
+    def _validate_positions(positions: np.ndarray | dict[Any, Any]) -> bool:
+        """Validate that positions don't contain NaN or inf values.
+
+        Args:
+            positions: Packed (n, 2) coordinate array, or dictionary mapping
+                node IDs to (x, y) positions
+
         Returns:
             True if valid, False otherwise
         """
-        import math
+        if isinstance(positions, dict):
+            positions = np.asarray(list(positions.values()), dtype=np.float64)
+        return bool(np.isfinite(positions).all())
 
-        for node_id, (x, y) in positions.items():
-            if math.isnan(x) or math.isnan(y) or math.isinf(x) or math.isinf(y):
-                return False
-        return True
+    @staticmethod
+    def _resolve_warm_start(
+        graph: Any,
+        warm_start: Any,
+        layout: str | Callable | None = None,
+        layout_options: dict[str, Any] | None = None,
+        cache: LayoutCache | None = None,
+    ) -> dict[Any, Any] | None:
+        """Resolve a warm-start source to prior node positions.
+
+        Args:
+            graph: NetworkX graph object being laid out
+            warm_start: Source of prior positions:
+                - True: The graph's own 'pos' node attributes
+                - Mapping: Node ID to (x, y) position
+                - NetworkX graph: Previous snapshot, whose layout is taken from
+                  the cache (same layout and options, including warm-started
+                  layouts of the snapshot) or its 'pos' attributes
+                - None/False: No warm start
+            layout: Layout algorithm name used for the cache lookup
+            layout_options: Layout options used for the cache lookup
+            cache: Layout cache holding previous layouts
+
+        Returns:
+            Mapping from node to prior position, or None if unavailable
+        """
+        if warm_start is None or warm_start is False:
+            return None
+        if warm_start is True:
+            return NetworkXAdapter._get_existing_positions(graph)
+        if isinstance(warm_start, Mapping):
+            return dict(warm_start)
+        if hasattr(warm_start, "nodes") and hasattr(warm_start, "edges"):
+            if cache is not None and warm_start.number_of_nodes() > 0:
+                layout_name = layout.lower() if isinstance(layout, str) else "spring"
+                # A snapshot that was itself warm-started is stored under '+warm'
+                for name in (f"{layout_name}+warm", layout_name):
+                    key = LayoutCache.fingerprint(warm_start, name, layout_options)
+                    cached = cache.get(key)
+                    if cached is not None and len(cached) == warm_start.number_of_nodes():
+                        return dict(zip(warm_start.nodes(), cached, strict=True))
+            positions = NetworkXAdapter._get_existing_positions(warm_start)
+            if positions is None:
+                warnings.warn("No previous layout found for warm start, computing from scratch")
+            return positions
+        raise TypeError(
+            f"warm_start must be True, a position mapping or a graph, got {type(warm_start).__name__}"
+        )
 
     @staticmethod
-    def _compute_layout(graph: Any, layout: str | Callable | None = None) -> dict[Any, Any]:
+    def _compute_layout(
+        graph: Any,
+        layout: str | Callable | None = None,
+        layout_options: dict[str, Any] | None = None,
+        cache: LayoutCache | None = None,
+        initial_positions: dict[Any, Any] | None = None,
+        fix_unchanged: bool = False,
+        split_components: bool = False,
+        workers: int | None = None,
+    ) -> np.ndarray:
         """Compute node positions using specified layout algorithm.
 
+        Named layouts are stored into ``cache`` by a structural fingerprint
+        of the graph. Cached positions are only reused for deterministic
+        layouts (kamada_kawai, spectral, circular) or when a seed is given,
+        so unseeded random and force-directed layouts are recomputed each
+        time; their stored result can still warm-start a later snapshot.
+        Fallback results are never cached. Options the named layout does
+        not accept are dropped with a warning.
+
+        When ``initial_positions`` is given with the spring layout (or None),
+        an incremental layout warm-started from those positions is computed
+        instead. Incremental results are never reused, but they are stored
+        under a separate '<layout>+warm' key so the graph can in turn
+        warm-start the next snapshot.
+
+        With ``split_components``, each connected component is laid out
+        separately (in parallel for large graphs) and the components are
+        packed side by side.
+
         Args:
             graph: NetworkX graph object
             layout: Layout algorithm name, custom function, or None
+            layout_options: Keyword arguments for the layout algorithm (e.g. seed)
+            cache: Layout cache to consult, or None to always recompute
+            initial_positions: Prior positions to warm-start the spring layout
+            fix_unchanged: Keep nodes with a prior position fixed
+            split_components: Lay out connected components separately and pack them
+            workers: Worker processes for component layouts (None for all CPUs)
 
         Returns:
-            Dictionary mapping node IDs to (x, y) positions
+            Array of shape (n, 2) with x/y positions in graph node order
         """
         # Handle empty graphs
         if len(graph.nodes()) == 0:
-            return {}
+            return np.empty((0, 2), dtype=np.float64)
+
+        options = layout_options or {}
+        layout_name = layout.lower() if isinstance(layout, str) else None
+
+        # Warm-start the spring layout from prior positions
+        incremental = bool(initial_positions) and layout_name in (None, "spring")
+        if not callable(layout):
+            options = NetworkXAdapter._supported_options(layout_name or "spring", options)
+        if initial_positions and not incremental:
+            warnings.warn(
+                f"Warm start is only supported for the spring layout, ignoring it for '{layout}'"
+            )
+
+        if split_components and incremental:
+            warnings.warn("split_components is ignored when warm-starting the layout")
+        split = split_components and not incremental
+
+        # Reuse cached positions for named layouts of an unchanged topology
+        cache_key = None
+        if cache is not None and isinstance(layout, str) and not incremental:
+            cache_name = f"{layout_name}+components" if split else layout_name
+            cache_key = LayoutCache.fingerprint(graph, cache_name, options)
+            reusable = layout_name in _DETERMINISTIC_LAYOUTS or options.get("seed") is not None
+            cached = cache.get(cache_key) if reusable else None
+            if cached is not None and len(cached) == graph.number_of_nodes():
+                return cached
+        elif cache is not None and incremental:
+            cache_name = f"{layout_name or 'spring'}+warm"
+            cache_key = LayoutCache.fingerprint(graph, cache_name, options)
 
         # Determine which layout to use
         positions = None
+        fell_back = False
 
-        if layout is None:
+        if incremental:
+            try:
+                positions = NetworkXAdapter._apply_incremental_layout(
+                    graph, initial_positions or {}, fix_unchanged, **options
+                )
+            except Exception as e:
+                warnings.warn(f"Incremental layout failed: {e}, falling back to random layout")
+                positions = NetworkXAdapter._apply_random_layout(graph)
+                fell_back = True
+        elif split:
+            # Per-component layouts, already packed into an (n, 2) array
+            try:
+                positions = layout_components(graph, layout, options, workers)
+            except Exception as e:
+                warnings.warn(f"Component layout failed: {e}, falling back to random layout")
+                positions = NetworkXAdapter._apply_random_layout(graph)
+                fell_back = True
+        elif layout is None:
             # Try to use existing 'pos' attribute, fall back to spring
             positions = NetworkXAdapter._get_existing_positions(graph)
             if positions is None:
                 try:
-                    positions = NetworkXAdapter._apply_spring_layout(graph)
+                    positions = NetworkXAdapter._apply_spring_layout(graph, **options)
                 except Exception as e:
                     warnings.warn(f"Spring layout failed: {e}, falling back to random layout")
                     positions = NetworkXAdapter._apply_random_layout(graph)
@@ -404,50 +651,85 @@ class NetworkXAdapter:
             layout_str = str(layout).lower()
             try:
                 if layout_str == "spring":
-                    positions = NetworkXAdapter._apply_spring_layout(graph)
+                    positions = NetworkXAdapter._apply_spring_layout(graph, **options)
                 elif layout_str == "kamada_kawai":
-                    positions = NetworkXAdapter._apply_kamada_kawai_layout(graph)
+                    positions = NetworkXAdapter._apply_kamada_kawai_layout(graph, **options)
                 elif layout_str == "spectral":
-                    positions = NetworkXAdapter._apply_spectral_layout(graph)
+                    positions = NetworkXAdapter._apply_spectral_layout(graph, **options)
                 elif layout_str == "circular":
-                    positions = NetworkXAdapter._apply_circular_layout(graph)
+                    positions = NetworkXAdapter._apply_circular_layout(graph, **options)
                 elif layout_str == "random":
-                    positions = NetworkXAdapter._apply_random_layout(graph)
+                    positions = NetworkXAdapter._apply_random_layout(graph, **options)
+                elif layout_str == "multilevel":
+                    positions = NetworkXAdapter._apply_multilevel_layout(graph, **options)
+                elif layout_str == "barnes_hut":
+                    positions = NetworkXAdapter._apply_barnes_hut_layout(graph, **options)
                 else:
                     warnings.warn(f"Unknown layout '{layout}', using spring layout")
-                    positions = NetworkXAdapter._apply_spring_layout(graph)
+                    positions = NetworkXAdapter._apply_spring_layout(graph, **options)
+                    fell_back = True
             except Exception as e:
                 warnings.warn(f"Layout '{layout}' failed: {e}, falling back to random layout")
                 positions = NetworkXAdapter._apply_random_layout(graph)
+                fell_back = True
 
-        # Validate positions
-        if not NetworkXAdapter._validate_positions(positions):
+        # Pack positions once and validate them in a single vectorized pass
+        if isinstance(positions, np.ndarray):
+            coords = positions
+        else:
+            coords = NetworkXAdapter._pack_positions(graph, positions)
+        if not NetworkXAdapter._validate_positions(coords):
             warnings.warn(
                 "Layout produced invalid positions (NaN/inf), falling back to random layout"
             )
             positions = NetworkXAdapter._apply_random_layout(graph)
+            coords = NetworkXAdapter._pack_positions(graph, positions)
+            fell_back = True
 
-        return positions
+        if cache is not None and cache_key is not None and not fell_back:
+            cache.put(cache_key, coords)
+
+        return coords
 
     @staticmethod
     def convert_graph(
         graph: Any,
         layout: str | Callable | None = None,
-        node_color: str | Callable | None = None,
-        node_label: str | Callable | None = None,
-        edge_label: str | Callable | None = None,
+        layout_options: dict[str, Any] | None = None,
+        layout_cache: LayoutCache | None = None,
+        warm_start: Any = None,
+        fix_unchanged: bool = False,
+        split_components: bool = False,
+        workers: int | None = None,
+        node_color: str | Callable | BatchMapping | ColorMap | None = None,
+        node_label: str | Callable | BatchMapping | None = None,
+        edge_label: str | Callable | BatchMapping | None = None,
+        node_attrs: AttributeFilter | Iterable[str] | None = None,
+        edge_attrs: AttributeFilter | Iterable[str] | None = None,
     ) -> GraphLayer:
         """Convert NetworkX graph to GraphLayer with layout and styling.
 
         Args:
             graph: NetworkX graph object
             layout: Layout algorithm name, custom function, or None
-            node_color: Attribute name or function for node color mapping
-            node_label: Attribute name or function for node label mapping
-            edge_label: Attribute name or function for edge label mapping
+            layout_options: Keyword arguments for the layout algorithm (e.g. seed)
+            layout_cache: Cache for named layouts, or None to always recompute
+            warm_start: Prior positions for an incremental spring layout
+                (True, position mapping, or previous graph snapshot)
+            fix_unchanged: Keep nodes with a prior position fixed when warm-starting
+            split_components: Lay out connected components separately and pack them
+            workers: Worker processes for component layouts (None for all CPUs)
+            node_color: Attribute name, function, BatchMapping or ColorMap for node
+                color mapping (numeric values are mapped through a color scale)
+            node_label: Attribute name, function or BatchMapping for node label mapping
+            edge_label: Attribute name, function or BatchMapping for edge label mapping
+            node_attrs: Node attributes to export (AttributeFilter, names to
+                include, or None for all)
+            edge_attrs: Edge attributes to export (AttributeFilter, names to
+                include, or None for all)
 
         Returns:
-            GraphLayer object with nodes, edges, and metadata
+            Column-backed GraphLayer object with nodes, edges, and metadata
 
         Raises:
             ValueError: If layout computation fails
@@ -455,196 +737,179 @@ class NetworkXAdapter:
         # Detect graph type
         graph_type = NetworkXAdapter._detect_graph_type(graph)
 
-        # Compute layout positions
-        positions = NetworkXAdapter._compute_layout(graph, layout=layout)
+        # Compute layout positions as an (n, 2) array
+        initial_positions = NetworkXAdapter._resolve_warm_start(
+            graph, warm_start, layout, layout_options, layout_cache
+        )
+        coords = NetworkXAdapter._compute_layout(
+            graph,
+            layout=layout,
+            layout_options=layout_options,
+            cache=layout_cache,
+            initial_positions=initial_positions,
+            fix_unchanged=fix_unchanged,
+            split_components=split_components,
+            workers=workers,
+        )
 
-        # Extract nodes with positions and styling
+        # Extract nodes and edges into columnar storage sharing one string table
+        strings = StringTable()
         nodes = NetworkXAdapter._extract_nodes(
             graph,
-            positions,
+            coords,
+            strings,
             node_color=node_color,
             node_label=node_label,
+            node_attrs=AttributeFilter.coerce(node_attrs),
         )
 
-        # Extract edges with styling
+        node_index = {node_id: row for row, node_id in enumerate(graph.nodes())}
         edges = NetworkXAdapter._extract_edges(
             graph,
+            node_index,
+            strings,
             edge_label=edge_label,
+            edge_attrs=AttributeFilter.coerce(edge_attrs),
         )
 
         # Create GraphLayer with metadata
-        layer = GraphLayer(
+        layer = GraphLayer.from_columns(
             layer_id="",  # Will be set by Plotter
-            nodes=nodes,
-            edges=edges,
+            columns=LayerColumns(strings=strings, nodes=nodes, edges=edges),
             metadata={"graph_type": graph_type},
         )
 
         return layer
 
     @staticmethod
-    def _map_node_color(
-        node_id: Any, node_data: dict, mapping: str | Callable | None
-    ) -> str | None:
-        """Map node attribute to color value.
+    def _map_column(
+        records: list[dict],
+        mapping: str | Callable | BatchMapping | None,
+        strings: StringTable,
+        size: int | None = None,
+    ) -> np.ndarray:
+        """Map node/edge attributes to interned style strings for a whole column.
 
         Args:
-            node_id: Node identifier
-            node_data: Node attributes dictionary
-            mapping: Attribute name (str) or function (node_data -> color_value)
+            records: Attribute dictionaries of the nodes or edges
+            mapping: Attribute name, function, BatchMapping, or None
+            strings: String table shared by the layer
+            size: Number of rows when ``records`` was not collected (no mapping)
 
         Returns:
-            Color value (string) or None if not mapped
+            int32 array of string table indices (-1 where unmapped)
         """
         if mapping is None:
-            return None
-
-        if callable(mapping):
-            # Call function with node_data
-            try:
-                result = mapping(node_data)
-                return str(result) if result is not None else None
-            except Exception:
-                return None
-        else:
-            # mapping is attribute name (str)
-            value = node_data.get(mapping)
-            return str(value) if value is not None else None
+            return np.full(len(records) if size is None else size, -1, dtype=np.int32)
+        values = NetworkXAdapter._mapped_values(records, mapping)
+        return NetworkXAdapter._intern_values(values, strings)
 
     @staticmethod
-    def _map_node_label(
-        node_id: Any, node_data: dict, mapping: str | Callable | None
-    ) -> str | None:
-        """Map node attribute to label value.
-
-        Args:
-            node_id: Node identifier
-            node_data: Node attributes dictionary
-            mapping: Attribute name (str) or function (node_data -> label_str)
-
-        Returns:
-            Label string or None if not mapped
-        """
-        if mapping is None:
-            return None
-
-        if callable(mapping):
-            # Call function with node_data
-            try:
-                result = mapping(node_data)
-                return str(result) if result is not None else None
-            except Exception:
-                return None
-        else:
-            # mapping is attribute name (str)
-            value = node_data.get(mapping)
-            return str(value) if value is not None else None
+    def _map_colors(
+        records: list[dict],
+        mapping: str | Callable | BatchMapping | ColorMap | None,
+        strings: StringTable,
+    ) -> np.ndarray:
+        """Map node attributes to interned colors for a whole column.
 
-    @staticmethod
-    def _map_edge_label(edge_data: dict, mapping: str | Callable | None) -> str | None:
-        """Map edge attribute to label value.
+        A ColorMap decides the scale itself. For other mappings the column
+        type is detected once: numeric columns go through the default
+        ColorMap gradient, anything else is used as color names as is.
 
         Args:
-            edge_data: Edge attributes dictionary
-            mapping: Attribute name (str) or function (edge_data -> label_str)
+            records: Attribute dictionaries of the nodes
+            mapping: Attribute name, function, BatchMapping, ColorMap, or None
+            strings: String table shared by the layer
 
         Returns:
-            Label string or None if not mapped
+            int32 array of string table indices (-1 where uncolored)
         """
         if mapping is None:
-            return None
+            return np.full(len(records), -1, dtype=np.int32)
+        if isinstance(mapping, ColorMap):
+            values = NetworkXAdapter._mapped_values(records, mapping.source)
+            return mapping.intern(values, strings)
 
-        if callable(mapping):
-            # Call function with edge_data
-            try:
-                result = mapping(edge_data)
-                return str(result) if result is not None else None
-            except Exception:
-                return None
-        else:
-            # mapping is attribute name (str)
-            value = edge_data.get(mapping)
-            return str(value) if value is not None else None
+        values = NetworkXAdapter._mapped_values(records, mapping)
+        if detect_color_type(values) == "numeric":
+            return ColorMap(mapping, kind="numeric").intern(values, strings)
+        return NetworkXAdapter._intern_values(values, strings)
 
     @staticmethod
-    def _detect_color_type(values: list) -> str:
-        """Detect if color values are numeric or categorical.
+    def _mapped_values(records: list[dict], mapping: str | Callable | BatchMapping) -> Any:
+        """Evaluate a style mapping for a whole column.
+
+        - Attribute name: the attribute is read from every record in one pass
+        - BatchMapping: the function is called once with the whole column
+        - Callable: the function is called per record; exceptions map to None
 
         Args:
-            values: List of color values
+            records: Attribute dictionaries of the nodes or edges
+            mapping: Attribute name, function, or BatchMapping
 
         Returns:
-            'numeric' or 'categorical'
+            One raw value per record (sequence or NumPy array)
         """
-        # Check if all non-None values are numeric
-        numeric_count = 0
-        total_count = 0
-
-        for val in values:
-            if val is not None:
-                total_count += 1
-                if isinstance(val, (int, float)):
-                    numeric_count += 1
-
-        # If majority are numeric, treat as numeric
-        if total_count > 0 and numeric_count / total_count > 0.5:
-            return "numeric"
-        return "categorical"
+        if isinstance(mapping, BatchMapping):
+            return mapping.apply(records)
+        if callable(mapping):
+            values = []
+            for data in records:
+                try:
+                    values.append(mapping(data))
+                except Exception:
+                    values.append(None)
+            return values
+        return [data.get(mapping) for data in records]
 
     @staticmethod
-    def _apply_continuous_color_scale(value: float, min_val: float, max_val: float) -> str:
-        """Apply continuous color scale to numeric value.
+    def _intern_values(values: Sequence[Any], strings: StringTable) -> np.ndarray:
+        """Intern mapped values as strings, converting each distinct value once.
 
         Args:
-            value: Numeric value to map
-            min_val: Minimum value in dataset
-            max_val: Maximum value in dataset
+            values: Mapped values (None leaves an element unmapped)
+            strings: String table shared by the layer
 
         Returns:
-            Hex color string
+            int32 array of string table indices (-1 for None)
         """
-        # Simple linear interpolation from blue to red
-        if max_val == min_val:
-            ratio = 0.5
-        else:
-            ratio = (value - min_val) / (max_val - min_val)
-
-        # Clamp ratio to [0, 1]
-        ratio = max(0.0, min(1.0, ratio))
-
-        # Blue (0) to Red (1)
-        red = int(255 * ratio)
-        blue = int(255 * (1 - ratio))
-        green = 0
-
-        return f"#{red:02x}{green:02x}{blue:02x}"
+        if isinstance(values, np.ndarray):
+            if values.dtype.kind in "biuf":
+                # Numeric columns: convert each distinct value once
+                uniques, inverse = np.unique(values, return_inverse=True)
+                table = np.array([strings.intern(str(value)) for value in uniques], dtype=np.int32)
+                return table[inverse.reshape(-1)]
+            values = values.tolist()
+
+        intern = strings.intern
+        # Key by type as well, since 1 == 1.0 == True but their strings differ
+        cache: dict[tuple[type, Any], int] = {}
+        ids: list[int] = []
+        for value in values:
+            if value is None:
+                ids.append(-1)
+            elif value.__class__ is str:
+                ids.append(intern(value))
+            else:
+                try:
+                    key = (value.__class__, value)
+                    index = cache.get(key)
+                    if index is None:
+                        index = cache[key] = intern(str(value))
+                except TypeError:
+                    # Unhashable values (e.g. lists) are converted every time
+                    index = intern(str(value))
+                ids.append(index)
+        return np.array(ids, dtype=np.int32)
 
     @staticmethod
-    def _apply_categorical_color_palette(category: str) -> str:
-        """Apply categorical color palette.
+    def _detect_color_type(values: list) -> str:
+        """Detect if color values are numeric or categorical.
 
         Args:
-            category: Category value
+            values: List of color values
 
         Returns:
-            Hex color string from palette
+            'numeric' or 'categorical'
         """
-        # D3.js Category10 palette
-        palette = [
-            "#1f77b4",
-            "#ff7f0e",
-            "#2ca02c",
-            "#d62728",
-            "#9467bd",
-            "#8c564b",
-            "#e377c2",
-            "#7f7f7f",
-            "#bcbd22",
-            "#17becf",
-        ]
-
-        # Use hash of category string to select color
-        category_hash = hash(category)
-        color_index = category_hash % len(palette)
-
-        return palette[color_index]
+        return detect_color_type(values)
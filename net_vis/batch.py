@@ -0,0 +1,300 @@
+"""Batch and dashboard export of many plotters, scenes or graphs to HTML."""
+
+import os
+import time
+import traceback
+import warnings
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .html_exporter import ExportOptions, HTMLExporter
+from .models import Scene
+from .plotter import Plotter
+
+_EXECUTORS = ("process", "thread")
+
+
+@dataclass
+class ExportResult:
+    """Outcome of exporting one item of a batch.
+
+    Attributes:
+        name: Item name (the HTML file is named '<name>.html')
+        path: Written file, or None if the export failed
+        seconds: Wall time spent building and exporting the item
+        error: 'ExceptionType: message' if the export failed
+        traceback: Formatted traceback of the failure
+    """
+
+    name: str
+    path: Path | None = None
+    seconds: float = 0.0
+    error: str | None = None
+    traceback: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item was exported."""
+        return self.error is None
+
+
+def _as_plotter(item: Any) -> Plotter:
+    """Turn a batch item into a Plotter, running its layout if needed.
+
+    Args:
+        item: Plotter, Scene, NetworkX graph, or a callable returning one of them
+
+    Returns:
+        Plotter holding the item's scene
+
+    Raises:
+        TypeError: If the item is none of the supported types
+    """
+    if callable(item) and not isinstance(item, (Plotter, Scene)):
+        item = item()
+    if isinstance(item, Plotter):
+        return item
+    if isinstance(item, Scene):
+        plotter = Plotter(title=item.title)
+        plotter._scene = item
+        plotter._invalidate_payload()
+        return plotter
+    if hasattr(item, "nodes") and hasattr(item, "edges"):
+        plotter = Plotter()
+        plotter.add_networkx(item)
+        return plotter
+    raise TypeError(
+        f"Batch items must be a Plotter, Scene, NetworkX graph or a callable "
+        f"returning one, not {type(item).__name__}"
+    )
+
+
+def _export_item(name: str, item: Any, out_dir: Path, options: dict[str, Any]) -> ExportResult:
+    """Build and export one item, capturing failures (runs in workers).
+
+    Args:
+        name: Item name
+        item: Batch item (see _as_plotter)
+        out_dir: Output directory
+        options: Keyword arguments for Plotter.export_html
+
+    Returns:
+        ExportResult of the item
+    """
+    start = time.perf_counter()
+    try:
+        path = _as_plotter(item).export_html(out_dir / f"{name}.html", **options)
+    except Exception as e:
+        return ExportResult(
+            name=name,
+            seconds=time.perf_counter() - start,
+            error=f"{type(e).__name__}: {e}",
+            traceback=traceback.format_exc(),
+        )
+    return ExportResult(name=name, path=Path(path), seconds=time.perf_counter() - start)
+
+
+def _prewarm_worker() -> None:
+    """Load the exporter's template and bundle once per worker process."""
+    HTMLExporter.shared().prewarm()
+
+
+def _make_executor(executor: str, workers: int) -> Executor:
+    """Create the worker pool, falling back to threads if processes are unavailable."""
+    if executor == "process":
+        try:
+            return ProcessPoolExecutor(max_workers=workers, initializer=_prewarm_worker)
+        except (OSError, NotImplementedError) as e:
+            # e.g. restricted environments without multiprocessing support
+            warnings.warn(f"Process pool unavailable: {e}, exporting in threads", stacklevel=3)
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def export_many(
+    items: Mapping[str, Any] | Iterable[tuple[str, Any]],
+    out_dir: str | Path,
+    *,
+    workers: int | None = None,
+    executor: str = "process",
+    on_result: Callable[[ExportResult], None] | None = None,
+    **export_options: Any,
+) -> list[ExportResult]:
+    """Export many plotters, scenes or graphs to HTML files in parallel.
+
+    Each item is turned into a plotter (running its layout for graphs and
+    callables), serialized and streamed to '<out_dir>/<name>.html' in a
+    worker. A failing item is reported in its result and does not stop
+    the batch. The exporter's template and JS bundle are loaded once per
+    worker process (once in total with threads); with bundle='linked' the
+    bundle file is written once before the workers start.
+
+    Args:
+        items: Mapping or (name, item) pairs. Items may be a Plotter, a
+            Scene, a NetworkX graph (laid out with the default layout), or
+            a callable returning one of them, which is called in the worker.
+            Names must be unique file names without path separators.
+        out_dir: Output directory (created if needed)
+        workers: Number of workers. None uses all CPUs, 1 exports in-process.
+        executor: 'process' (default) or 'thread'. Process workers receive
+            items by pickling, so callables must be module-level functions
+            or functools.partial objects.
+        on_result: Called in the calling process with each result as it
+            completes, e.g. for progress reporting
+        **export_options: Keyword arguments for Plotter.export_html
+            (e.g. compress=True, bundle='linked', bundle_integrity=True)
+
+    Returns:
+        One ExportResult per item, in input order
+
+    Raises:
+        ValueError: If names are duplicated or not plain file names, or
+            executor/workers are invalid
+
+    Examples:
+        >>> results = export_many(
+        ...     {f"customer_{cid}": graph for cid, graph in graphs.items()},
+        ...     "reports/",
+        ...     workers=8,
+        ...     bundle="linked",
+        ... )
+        >>> failed = [r for r in results if not r.ok]
+        >>> slowest = max(results, key=lambda r: r.seconds)
+    """
+    if executor not in _EXECUTORS:
+        raise ValueError(f"executor must be one of {_EXECUTORS}, got {executor!r}")
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be a positive integer")
+
+    pairs = list(items.items() if isinstance(items, Mapping) else items)
+    names = [name for name, _ in pairs]
+    duplicates = sorted(name for name, count in Counter(names).items() if count > 1)
+    if duplicates:
+        raise ValueError(f"Duplicate item names: {duplicates}")
+    # Names become file names; keep every file inside out_dir
+    unsafe = [
+        name
+        for name in names
+        if not isinstance(name, str)
+        or name in ("", ".", "..")
+        or "/" in name
+        or os.sep in name
+        or (os.altsep is not None and os.altsep in name)
+        or Path(name).name != name
+    ]
+    if unsafe:
+        raise ValueError(f"Item names must be plain file names, got {unsafe}")
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    exporter = HTMLExporter.shared().prewarm()
+    if export_options.get("bundle") == "linked" and export_options.get("bundle_url") is None:
+        exporter.write_bundle(out_dir)
+
+    if workers == 1 or len(pairs) <= 1:
+        results = []
+        for name, item in pairs:
+            results.append(_export_item(name, item, out_dir, export_options))
+            if on_result is not None:
+                on_result(results[-1])
+        return results
+
+    slots: list[ExportResult | None] = [None] * len(pairs)
+    with _make_executor(executor, workers or os.cpu_count() or 1) as pool:
+        futures = {
+            pool.submit(_export_item, name, item, out_dir, export_options): index
+            for index, (name, item) in enumerate(pairs)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # The item could not be sent to or returned from the worker
+                result = ExportResult(
+                    name=names[index],
+                    error=f"{type(e).__name__}: {e}",
+                    traceback="".join(traceback.format_exception(e)),
+                )
+            if on_result is not None:
+                on_result(result)
+            slots[index] = result
+    return [result for result in slots if result is not None]
+
+
+def export_dashboard(
+    items: Mapping[str, Any] | Iterable[tuple[str, Any]],
+    filepath: str | Path | None = None,
+    *,
+    title: str | None = None,
+    description: str | None = None,
+    width: str = "480px",
+    height: int = 480,
+    compress: bool = False,
+    link_index: bool = False,
+) -> str | Path:
+    """Export many plotters, scenes or graphs as one dashboard HTML page.
+
+    Panels are laid out in a responsive grid. The JS bundle is inlined
+    once, and each graph's data is only parsed and simulated when its
+    panel scrolls into view, so reports with hundreds of graphs open
+    instantly.
+
+    Args:
+        items: Mapping or (name, item) pairs; names become panel headings.
+            Items may be a Plotter, Scene, NetworkX graph or a callable
+            returning one (see export_many).
+        filepath: Output file path. If None, returns HTML as string.
+            '.html' is added if missing; parent directories are created.
+        title: Page title and heading (defaults to "Network Dashboard")
+        description: Description text below the title
+        width: Minimum panel width as CSS value; panels fill each row
+        height: Panel height in pixels
+        compress: Embed each graph's data gzip-compressed and base64-encoded
+        link_index: Reference link endpoints by node index
+
+    Returns:
+        - If filepath is provided: Path object of written file
+        - If filepath is None: HTML content as string
+
+    Raises:
+        ValueError: If height is not a positive integer
+        TypeError: If an item is not a supported type
+        OSError: If the file cannot be written
+
+    Examples:
+        >>> export_dashboard(
+        ...     {name: graph for name, graph in graphs.items()},
+        ...     "dashboard.html",
+        ...     title="Customer networks",
+        ... )
+    """
+    if not isinstance(height, int) or height <= 0:
+        raise ValueError("height must be a positive integer")
+
+    pairs = items.items() if isinstance(items, Mapping) else items
+    # Scenes are converted (and laid out) as the document is written
+    scenes = ((str(name), _as_plotter(item)._scene) for name, item in pairs)
+    options = ExportOptions(
+        title=title,
+        description=description,
+        width=width,
+        height=height,
+        compress=compress,
+        link_index=link_index,
+    )
+    exporter = HTMLExporter.shared()
+
+    if filepath is None:
+        return exporter.export_dashboard(scenes, options)
+
+    path = Path(filepath)
+    if path.suffix.lower() != ".html":
+        path = path.with_suffix(path.suffix + ".html")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as fp:
+        exporter.write_dashboard(scenes, fp, options)
+    return path
@@ -1,11 +1,23 @@
 """HTML export functionality for standalone visualization files."""
 
-import json
+import base64
+import hashlib
+import html
+import os
+import tempfile
+import threading
+import zlib
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from string import Template
+from typing import TextIO
 
 from .models import Scene
+from .serializer import SceneJSONEncoder
+
+# gzip level for compressed exports; higher levels are much slower for ~5% less
+_COMPRESS_LEVEL = 6
 
 
 @dataclass
@@ -20,12 +32,36 @@ class ExportOptions:
             Default: "100%"
         height: Container height in pixels.
             Default: 600
+        compress: Embed the graph data gzip-compressed and base64-encoded,
+            decompressed in the browser with DecompressionStream.
+            Default: False
+        bundle_src: URL or relative path of the JS bundle, referenced with
+            <script src> instead of inlining it (see HTMLExporter.write_bundle).
+            Default: None (inline, fully self-contained)
+        bundle_integrity: Add a Subresource Integrity hash (and
+            crossorigin="anonymous") to the linked bundle. Chromium refuses
+            such scripts for pages opened from file://, so disable it for
+            files viewed locally.
+            Default: True
+        link_index: Reference link endpoints by node index in the embedded
+            data (see Scene.to_dict). Default: False
     """
 
     title: str | None = None
     description: str | None = None
     width: str = "100%"
     height: int = 600
+    compress: bool = False
+    bundle_src: str | None = None
+    bundle_integrity: bool = True
+    link_index: bool = False
+
+
+def _umask() -> int:
+    """Return the process umask (only readable by setting it)."""
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
 
 
 class HTMLExporter:
@@ -37,21 +73,83 @@ class HTMLExporter:
 
     This is an internal implementation class. Users should use
     Plotter.export_html() instead.
+
+    The template and JS bundle are read from disk on first use and kept
+    for the lifetime of the exporter. Plotter.export_html() uses the
+    process-wide instance from shared(), so they are read once per process.
+
+    Examples:
+        Load resources at process start, before exporting many graphs:
+            >>> HTMLExporter.shared().prewarm()
+
+        Share one bundle between many exported files:
+            >>> exporter = HTMLExporter.shared()
+            >>> asset = exporter.write_bundle("site/")
+            >>> html = exporter.export(scene, ExportOptions(bundle_src=asset.name))
     """
 
+    _shared: "HTMLExporter | None" = None
+    _shared_lock = threading.Lock()
+
     def __init__(self) -> None:
-        """Initialize exporter with cached template and resources.
+        """Initialize exporter; resources are loaded lazily and memoised."""
+        self._template_cache: Template | None = None
+        self._js_bundle_cache: str | None = None
+        self._bundle_digests: tuple[str, str] | None = None
+        self._segments_cache: dict[str, list[tuple[str, str | None]]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "HTMLExporter":
+        """Return the process-wide exporter used by Plotter.export_html()."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def prewarm(self) -> "HTMLExporter":
+        """Load the template and JS bundle now rather than on the first export.
 
-        Loads the HTML template and JS bundle once at initialization
-        for efficient reuse across multiple export calls.
+        Returns:
+            This exporter, for chaining
+
+        Raises:
+            FileNotFoundError: If a resource is missing from the package.
         """
-        self._template: Template = self._load_template()
-        self._js_bundle: str = self._load_js_bundle()
+        self._resources()
+        return self
+
+    @property
+    def _template(self) -> Template:
+        """HTML template, loaded on first access."""
+        return self._resources()[0]
+
+    @property
+    def _js_bundle(self) -> str:
+        """Minified JavaScript bundle, loaded on first access."""
+        return self._resources()[1]
+
+    def _resources(self) -> tuple[Template, str]:
+        """Load the template and bundle once, safely across threads.
+
+        Returns:
+            Tuple of (template, js_bundle).
+        """
+        template, js_bundle = self._template_cache, self._js_bundle_cache
+        if template is None or js_bundle is None:
+            with self._lock:
+                if self._template_cache is None:
+                    self._template_cache = self._load_template()
+                if self._js_bundle_cache is None:
+                    self._js_bundle_cache = self._load_js_bundle()
+                template, js_bundle = self._template_cache, self._js_bundle_cache
+        return template, js_bundle
 
     def export(
         self,
         scene: Scene,
         options: ExportOptions | None = None,
+        json_data: str | Iterable[str] | None = None,
     ) -> str:
         """Generate standalone HTML from scene.
 
@@ -59,6 +157,9 @@ class HTMLExporter:
             scene: Scene object containing graph layers to export.
             options: Optional ExportOptions for customization.
                 If None, default options are used.
+            json_data: Scene JSON encoded by the caller (compact, non-ASCII
+                preserved), as a string or an iterable of consecutive
+                fragments. If None, the scene is serialized.
 
         Returns:
             Complete HTML document as UTF-8 string.
@@ -68,40 +169,337 @@ class HTMLExporter:
             - All scene layers are included in the export
             - Node/edge metadata is preserved in embedded JSON
         """
+        return "".join(self.iter_export(scene, options, json_data))
+
+    def write(
+        self,
+        scene: Scene,
+        fp: TextIO,
+        options: ExportOptions | None = None,
+        json_data: str | Iterable[str] | None = None,
+    ) -> None:
+        """Write standalone HTML for a scene into a text file object.
+
+        The document is written piece by piece: template text, the JS
+        bundle and the graph data as it is serialized (and compressed),
+        so the whole document is never held in memory.
+
+        Args:
+            scene: Scene object containing graph layers to export.
+            fp: Writable text file object (e.g. a file opened with
+                encoding="utf-8", or socket.makefile("w", encoding="utf-8")).
+            options: Optional ExportOptions for customization.
+            json_data: Scene JSON encoded by the caller, as a string or an
+                iterable of consecutive fragments. If None, the scene is
+                serialized incrementally.
+        """
+        for chunk in self.iter_export(scene, options, json_data):
+            fp.write(chunk)
+
+    def iter_export(
+        self,
+        scene: Scene,
+        options: ExportOptions | None = None,
+        json_data: str | Iterable[str] | None = None,
+    ) -> Iterator[str]:
+        """Yield the standalone HTML document in chunks.
+
+        Args:
+            scene: Scene object containing graph layers to export.
+            options: Optional ExportOptions for customization.
+            json_data: Scene JSON encoded by the caller, as a string or an
+                iterable of consecutive fragments. If None, the scene is
+                serialized incrementally.
+
+        Yields:
+            Consecutive fragments of the HTML document.
+
+        Raises:
+            KeyError: If the template has an unknown placeholder.
+        """
         if options is None:
             options = ExportOptions()
 
         # Resolve title
         title = self._resolve_title(options, scene)
 
-        # Generate components
-        css_styles = self._generate_css()
-        json_data = self._serialize_data(scene)
-
-        # Substitute template variables
-        html = self._template.substitute(
-            title=title,
-            display_title=title if title != "Network Visualization" else "",
-            description=options.description or "",
-            width=options.width,
-            height=options.height,
-            css_styles=css_styles,
-            js_bundle=self._js_bundle,
-            json_data=json_data,
-        )
+        values = {
+            "title": title,
+            "display_title": title if title != "Network Visualization" else "",
+            "description": options.description or "",
+            "width": options.width,
+            "height": options.height,
+            "css_styles": self._generate_css(),
+            "data_encoding": "gzip" if options.compress else "json",
+        }
+
+        _, js_bundle = self._resources()
+        for literal, name in self._template_segments():
+            yield literal
+            if name == "bundle_script":
+                yield from self._iter_bundle_script(options, js_bundle)
+            elif name == "json_data":
+                yield from self._iter_data(scene, options, json_data)
+            elif name is not None:
+                yield str(values[name])
+
+    def export_dashboard(
+        self,
+        scenes: Iterable[tuple[str, Scene]],
+        options: ExportOptions | None = None,
+    ) -> str:
+        """Generate one HTML document showing many scenes in a grid.
+
+        Args:
+            scenes: (heading, scene) pairs, one panel each.
+            options: Optional ExportOptions. title/description apply to the
+                page, width is the minimum panel width and height the panel
+                height; compress, link_index and bundle options apply to all
+                panels.
+
+        Returns:
+            Complete HTML document as UTF-8 string.
+        """
+        return "".join(self.iter_dashboard(scenes, options))
+
+    def write_dashboard(
+        self,
+        scenes: Iterable[tuple[str, Scene]],
+        fp: TextIO,
+        options: ExportOptions | None = None,
+    ) -> None:
+        """Write a dashboard of many scenes into a text file object.
+
+        Args:
+            scenes: (heading, scene) pairs, one panel each.
+            fp: Writable text file object.
+            options: Optional ExportOptions (see export_dashboard).
+        """
+        for chunk in self.iter_dashboard(scenes, options):
+            fp.write(chunk)
+
+    def iter_dashboard(
+        self,
+        scenes: Iterable[tuple[str, Scene]],
+        options: ExportOptions | None = None,
+    ) -> Iterator[str]:
+        """Yield a dashboard document of many scenes in chunks.
+
+        The JS bundle is included once. Each scene's data is kept in an
+        inert <script type="application/json"> block, which the page only
+        parses and renders once its panel scrolls into view, so large
+        dashboards open without parsing every graph up front.
+
+        Args:
+            scenes: (heading, scene) pairs, one panel each.
+            options: Optional ExportOptions (see export_dashboard).
+
+        Yields:
+            Consecutive fragments of the HTML document.
+
+        Raises:
+            KeyError: If the template has an unknown placeholder.
+        """
+        if options is None:
+            options = ExportOptions()
+
+        title = options.title or "Network Dashboard"
+        values = {
+            "title": html.escape(title),
+            "display_title": html.escape(options.title or ""),
+            "description": html.escape(options.description or ""),
+            "width": options.width,
+            "height": options.height,
+            "css_styles": self._generate_css(),
+        }
+
+        _, js_bundle = self._resources()
+        for literal, name in self._template_segments("dashboard.html"):
+            yield literal
+            if name == "bundle_script":
+                yield from self._iter_bundle_script(options, js_bundle)
+            elif name == "panels":
+                for index, (heading, scene) in enumerate(scenes):
+                    yield from self._iter_panel(index, heading, scene, options)
+            elif name is not None:
+                yield str(values[name])
+
+    def bundle_filename(self) -> str:
+        """Return the content-hashed file name of the JS bundle.
+
+        Returns:
+            Name such as 'netvis-standalone.3f2a9c1b0d4e.min.js', which
+            changes whenever the bundle does, so it can be cached forever.
+        """
+        return f"netvis-standalone.{self._digests()[0][:12]}.min.js"
+
+    def bundle_integrity(self) -> str:
+        """Return the Subresource Integrity hash of the JS bundle.
+
+        Returns:
+            'sha384-...' value for the integrity attribute of <script>.
+        """
+        return f"sha384-{self._digests()[1]}"
+
+    def write_bundle(self, directory: str | Path) -> Path:
+        """Write the JS bundle into a directory under its content-hashed name.
+
+        The file is written atomically and skipped if it already exists, so
+        concurrent exports into the same directory are safe.
 
-        return html
+        Args:
+            directory: Target directory (created if needed).
+
+        Returns:
+            Path of the bundle file.
+
+        Raises:
+            OSError: If the file cannot be written.
+        """
+        path = Path(directory) / self.bundle_filename()
+        if path.exists():
+            return path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".netvis-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                fp.write(self._js_bundle.encode("utf-8"))
+            # mkstemp creates the file as 0600; give it the usual mode for new files
+            os.chmod(tmp, 0o666 & ~_umask())
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return path
+
+    def _digests(self) -> tuple[str, str]:
+        """Hash the bundle once (hex SHA-256 for the name, base64 SHA-384 for SRI)."""
+        digests = self._bundle_digests
+        if digests is None:
+            data = self._js_bundle.encode("utf-8")
+            digests = self._bundle_digests = (
+                hashlib.sha256(data).hexdigest(),
+                base64.b64encode(hashlib.sha384(data).digest()).decode("ascii"),
+            )
+        return digests
+
+    def _template_segments(self, name: str = "standalone.html") -> list[tuple[str, str | None]]:
+        """Split a template into literal text and placeholder names, once.
+
+        Args:
+            name: Template file name in the package's templates directory.
+
+        Returns:
+            (literal, placeholder) pairs in document order; the last
+            placeholder is None.
+        """
+        segments = self._segments_cache.get(name)
+        if segments is None:
+            template = self._template if name == "standalone.html" else self._load_template(name)
+            segments = []
+            literal: list[str] = []
+            position = 0
+            for match in template.pattern.finditer(template.template):
+                literal.append(template.template[position : match.start()])
+                position = match.end()
+                if match.group("escaped") is not None:
+                    literal.append(template.delimiter)
+                    continue
+                placeholder = match.group("named") or match.group("braced")
+                if placeholder is None:
+                    raise ValueError(f"Invalid placeholder in HTML template at {match.start()}")
+                segments.append(("".join(literal), placeholder))
+                literal = []
+            literal.append(template.template[position:])
+            segments.append(("".join(literal), None))
+            self._segments_cache[name] = segments
+        return segments
+
+    def _iter_bundle_script(self, options: ExportOptions, js_bundle: str) -> Iterator[str]:
+        """Yield the <script> element carrying or referencing the bundle.
 
-    def _load_template(self) -> Template:
+        Args:
+            options: Export options (bundle_src, bundle_integrity).
+            js_bundle: Bundle code, inlined when no bundle_src is set.
+
+        Yields:
+            Fragments of the HTML <script> element.
+        """
+        if options.bundle_src is None:
+            yield "<script>\n"
+            yield js_bundle
+            yield "\n    </script>"
+            return
+        attributes = f'src="{html.escape(options.bundle_src)}"'
+        if options.bundle_integrity:
+            attributes += f' integrity="{self.bundle_integrity()}" crossorigin="anonymous"'
+        yield f"<script {attributes}></script>"
+
+    def _iter_data(
+        self, scene: Scene, options: ExportOptions, json_data: str | Iterable[str] | None
+    ) -> Iterator[str]:
+        """Yield the embedded graph data (a JSON literal or compressed string).
+
+        Args:
+            scene: Scene object to serialize if json_data is None.
+            options: Export options (compress, link_index).
+            json_data: Scene JSON (or its fragments) encoded by the caller.
+
+        Yields:
+            Fragments of the JavaScript value assigned to graphData.
+        """
+        if isinstance(json_data, str):
+            chunks: Iterable[str] = (json_data,)
+        elif json_data is not None:
+            chunks = json_data
+        else:
+            encoder = SceneJSONEncoder(ensure_ascii=False, link_index=options.link_index)
+            chunks = encoder.iter_encode(scene)
+        if options.compress:
+            yield from self._iter_compressed(chunks)
+        else:
+            yield from chunks
+
+    def _iter_panel(
+        self, index: int, heading: str, scene: Scene, options: ExportOptions
+    ) -> Iterator[str]:
+        """Yield one dashboard panel: heading, graph container and inert data.
+
+        Args:
+            index: Panel number, linking the container to its data block.
+            heading: Panel heading.
+            scene: Scene shown in the panel.
+            options: Export options (compress, link_index).
+
+        Yields:
+            Fragments of the panel's HTML.
+        """
+        encoding = "gzip" if options.compress else "json"
+        yield (
+            f'            <section class="netvis-panel">\n'
+            f'                <h2 class="netvis-panel-title">{html.escape(heading)}</h2>\n'
+            f'                <div class="netvis-graph" data-graph="{index}"></div>\n'
+            f'                <script type="application/json" id="netvis-data-{index}" '
+            f'data-encoding="{encoding}">'
+        )
+        for chunk in self._iter_data(scene, options, None):
+            # '<' only occurs inside JSON strings; escaping it keeps "</script>" inert
+            yield chunk.replace("<", "\\u003c")
+        yield "</script>\n            </section>\n"
+
+    def _load_template(self, name: str = "standalone.html") -> Template:
         """Load HTML template from package resources.
 
+        Args:
+            name: Template file name in the package's templates directory.
+
         Returns:
             string.Template object with placeholder variables.
 
         Raises:
             FileNotFoundError: If template file is missing from package.
         """
-        template_path = Path(__file__).parent / "templates" / "standalone.html"
+        template_path = Path(__file__).parent / "templates" / name
         if not template_path.exists():
             raise FileNotFoundError(f"HTML template not found: {template_path}")
         template_content = template_path.read_text(encoding="utf-8")
@@ -210,21 +608,31 @@ class HTMLExporter:
         }
         """
 
-    def _serialize_data(self, scene: Scene) -> str:
-        """Serialize scene to JSON for embedding.
+    def _iter_compressed(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Compress serialized scene JSON for embedding, chunk by chunk.
 
-        Uses Scene.to_dict() to convert the scene to the netvis
-        JSON format, then serializes to a JSON string suitable
-        for embedding in a <script> tag.
+        The gzip header carries no timestamp, so identical scenes produce
+        identical files.
 
         Args:
-            scene: Scene object to serialize.
+            chunks: Fragments of the scene JSON.
 
-        Returns:
-            JSON string (UTF-8, no extra whitespace).
+        Yields:
+            Fragments of a JavaScript string literal holding the base64
+            encoded gzip data.
         """
-        scene_dict = scene.to_dict()
-        return json.dumps(scene_dict, ensure_ascii=False)
+        compressor = zlib.compressobj(_COMPRESS_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        pending = b""
+        yield '"'
+        for chunk in chunks:
+            pending += compressor.compress(chunk.encode("utf-8"))
+            # base64 encodes 3 bytes at a time; keep the remainder for later
+            cut = len(pending) - len(pending) % 3
+            if cut:
+                yield base64.b64encode(pending[:cut]).decode("ascii")
+                pending = pending[cut:]
+        yield base64.b64encode(pending + compressor.flush()).decode("ascii")
+        yield '"'
 
     def _resolve_title(
         self,
@@ -1,7 +1,11 @@
 """Data models for graph visualization."""
 
+from abc import abstractmethod
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, NoReturn, overload
+
+import numpy as np
 
 
 @dataclass
@@ -44,23 +48,482 @@ class Edge:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+def _node_record(node: Node) -> dict[str, Any]:
+    """Convert a Node object to a netvis node record."""
+    record: dict[str, Any] = {
+        "id": node.id,
+        "x": node.x,
+        "y": node.y,
+    }
+    if node.label is not None:
+        record["name"] = node.label
+    if node.color is not None:
+        record["category"] = node.color
+    # Add metadata as additional fields
+    record.update(node.metadata)
+    return record
+
+
+def _link_record(edge: Edge, source: Any = None, target: Any = None) -> dict[str, Any]:
+    """Convert an Edge object to a netvis link record.
+
+    Args:
+        edge: Edge to convert
+        source: Reference to the source node (the edge's source ID if None)
+        target: Reference to the target node (the edge's target ID if None)
+    """
+    record: dict[str, Any] = {
+        "source": edge.source if source is None else source,
+        "target": edge.target if target is None else target,
+    }
+    if edge.label is not None:
+        record["label"] = edge.label
+    if edge.weight is not None:
+        record["value"] = edge.weight
+    # Add metadata as additional fields
+    record.update(edge.metadata)
+    return record
+
+
+class StringTable:
+    """Interned string storage shared by the columns of a layer.
+
+    Each distinct string is stored once and referenced by its integer index.
+    Index -1 is reserved for missing (None) values.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty string table."""
+        self._strings: list[str] = []
+        self._lookup: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    @property
+    def strings(self) -> list[str]:
+        """Interned strings in index order."""
+        return self._strings
+
+    def intern(self, value: str | None) -> int:
+        """Return the index of a string, adding it to the table if needed.
+
+        Args:
+            value: String to intern, or None
+
+        Returns:
+            Index of the string, or -1 for None
+        """
+        if value is None:
+            return -1
+        index = self._lookup.get(value)
+        if index is None:
+            index = len(self._strings)
+            self._strings.append(value)
+            self._lookup[value] = index
+        return index
+
+    def get(self, index: int) -> str | None:
+        """Return the string at an index, or None for -1."""
+        return self._strings[index] if index >= 0 else None
+
+    def resolve(self, indices: np.ndarray) -> list[str | None]:
+        """Resolve a whole index column to strings in a single pass.
+
+        Args:
+            indices: Integer array of string-table indices
+
+        Returns:
+            List of strings (None where the index is -1)
+        """
+        strings = self._strings
+        return [strings[i] if i >= 0 else None for i in indices.tolist()]
+
+
+@dataclass
+class NodeColumns:
+    """Columnar storage for the nodes of a layer.
+
+    Attributes:
+        ids: String-table indices of node IDs (int32)
+        x: X-coordinates (float64)
+        y: Y-coordinates (float64)
+        labels: String-table indices of labels, -1 if unset (int32)
+        colors: String-table indices of colors, -1 if unset (int32)
+        attrs: Sparse attribute columns mapping attribute name to {row: value}
+    """
+
+    ids: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    labels: np.ndarray
+    colors: np.ndarray
+    attrs: dict[str, dict[int, Any]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def row_metadata(self, row: int) -> dict[str, Any]:
+        """Collect the sparse attributes of one row into a metadata dict."""
+        return {name: column[row] for name, column in self.attrs.items() if row in column}
+
+
+@dataclass
+class EdgeColumns:
+    """Columnar storage for the edges of a layer.
+
+    Attributes:
+        source: Row indices of source nodes in NodeColumns (int32)
+        target: Row indices of target nodes in NodeColumns (int32)
+        labels: String-table indices of labels, -1 if unset (int32)
+        weight: Edge weights, NaN if unset (float64)
+        attrs: Sparse attribute columns mapping attribute name to {row: value}
+        shared_attrs: Attributes common to every edge (e.g. 'directed')
+    """
+
+    source: np.ndarray
+    target: np.ndarray
+    labels: np.ndarray
+    weight: np.ndarray
+    attrs: dict[str, dict[int, Any]] = field(default_factory=dict)
+    shared_attrs: dict[str, Any] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.source)
+
+    def row_metadata(self, row: int) -> dict[str, Any]:
+        """Collect the sparse and shared attributes of one row into a metadata dict."""
+        metadata = {name: column[row] for name, column in self.attrs.items() if row in column}
+        metadata.update(self.shared_attrs)
+        return metadata
+
+
+@dataclass
+class LayerColumns:
+    """Array-backed storage for all nodes and edges of a layer.
+
+    Avoids allocating a Node/Edge object and metadata dict per element,
+    which dominates memory and time for large graphs.
+
+    Attributes:
+        strings: String table shared by node IDs, labels and colors
+        nodes: Node columns
+        edges: Edge columns
+    """
+
+    strings: StringTable
+    nodes: NodeColumns
+    edges: EdgeColumns
+
+    def node(self, row: int) -> Node:
+        """Materialise one node row as a Node object."""
+        nodes = self.nodes
+        return Node(
+            id=self.strings.strings[nodes.ids[row]],
+            label=self.strings.get(int(nodes.labels[row])),
+            x=float(nodes.x[row]),
+            y=float(nodes.y[row]),
+            color=self.strings.get(int(nodes.colors[row])),
+            metadata=nodes.row_metadata(row),
+        )
+
+    def edge(self, row: int) -> Edge:
+        """Materialise one edge row as an Edge object."""
+        edges = self.edges
+        node_ids = self.nodes.ids
+        weight = float(edges.weight[row])
+        return Edge(
+            source=self.strings.strings[node_ids[edges.source[row]]],
+            target=self.strings.strings[node_ids[edges.target[row]]],
+            label=self.strings.get(int(edges.labels[row])),
+            weight=None if np.isnan(weight) else weight,
+            metadata=edges.row_metadata(row),
+        )
+
+    def iter_node_records(self) -> Iterator[dict[str, Any]]:
+        """Yield netvis node records straight from the columns.
+
+        Yields:
+            Node dictionaries in netvis MIME renderer format
+        """
+        nodes = self.nodes
+        ids = self.strings.resolve(nodes.ids)
+        labels = self.strings.resolve(nodes.labels)
+        colors = self.strings.resolve(nodes.colors)
+        xs = nodes.x.tolist()
+        ys = nodes.y.tolist()
+        attrs = list(nodes.attrs.items())
+
+        for row, node_id in enumerate(ids):
+            record: dict[str, Any] = {"id": node_id, "x": xs[row], "y": ys[row]}
+            if labels[row] is not None:
+                record["name"] = labels[row]
+            if colors[row] is not None:
+                record["category"] = colors[row]
+            for name, column in attrs:
+                if row in column:
+                    record[name] = column[row]
+            yield record
+
+    def iter_link_records(self, node_offset: int | None = None) -> Iterator[dict[str, Any]]:
+        """Yield netvis link records straight from the columns.
+
+        Args:
+            node_offset: If given, links reference nodes by scene-wide index
+                (row + node_offset) instead of by ID
+
+        Yields:
+            Link dictionaries in netvis MIME renderer format
+        """
+        edges = self.edges
+        if node_offset is None:
+            node_ids = self.strings.resolve(self.nodes.ids)
+        else:
+            node_ids = range(node_offset, node_offset + len(self.nodes))
+        labels = self.strings.resolve(edges.labels)
+        weights = edges.weight.tolist()
+        attrs = list(edges.attrs.items())
+        shared_attrs = edges.shared_attrs
+
+        for row, (source, target) in enumerate(
+            zip(edges.source.tolist(), edges.target.tolist(), strict=True)
+        ):
+            record: dict[str, Any] = {"source": node_ids[source], "target": node_ids[target]}
+            if labels[row] is not None:
+                record["label"] = labels[row]
+            if weights[row] == weights[row]:  # NaN marks an unset weight
+                record["value"] = weights[row]
+            for name, column in attrs:
+                if row in column:
+                    record[name] = column[row]
+            if shared_attrs:
+                record.update(shared_attrs)
+            yield record
+
+
+class _ColumnView(Sequence):
+    """Read-only sequence that materialises objects from columns on access.
+
+    Subclasses implement _build and __len__ (Sequence is an ABC, so
+    incomplete subclasses cannot be instantiated). List mutators raise
+    TypeError instead of being silently lost.
+    """
+
+    def __init__(self, columns: LayerColumns) -> None:
+        self._columns = columns
+
+    @abstractmethod
+    def _build(self, row: int) -> Any:
+        """Materialise the object at a row."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of rows in the viewed columns."""
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Any]: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self._build(row) for row in range(*index.indices(len(self)))]
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return self._build(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        for row in range(len(self)):
+            yield self._build(row)
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(
+            f"{type(self).__name__} of a column-backed layer is read-only; "
+            "call GraphLayer.materialise() to edit its nodes and edges"
+        )
+
+    __setitem__ = __delitem__ = __iadd__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+
+class NodeView(_ColumnView):
+    """Lazy Node view over columnar layer storage.
+
+    Nodes are materialised on access; modifying them does not write back
+    (see GraphLayer.materialise).
+    """
+
+    def __len__(self) -> int:
+        return len(self._columns.nodes)
+
+    def _build(self, row: int) -> Node:
+        return self._columns.node(row)
+
+
+class EdgeView(_ColumnView):
+    """Lazy Edge view over columnar layer storage.
+
+    Edges are materialised on access; modifying them does not write back
+    (see GraphLayer.materialise).
+    """
+
+    def __len__(self) -> int:
+        return len(self._columns.edges)
+
+    def _build(self, row: int) -> Edge:
+        return self._columns.edge(row)
+
+
 @dataclass
 class GraphLayer:
     """Represents a single network visualization layer.
 
-    Corresponds to one NetworkX graph object in a scene.
+    Corresponds to one NetworkX graph object in a scene. A layer is either
+    backed by lists of Node/Edge objects or by LayerColumns, in which case
+    ``nodes`` and ``edges`` are lazy read-only views over the columns.
+    materialise() converts a column-backed layer into an editable one, and
+    assigning a list to ``nodes`` or ``edges`` detaches the columns.
+
+    Encoded JSON fragments of a column-backed layer's records can be cached
+    on the layer (see SceneJSONEncoder). Assigning a field drops them; after
+    mutating the columns in place, call invalidate().
 
     Attributes:
         layer_id: Unique layer identifier
-        nodes: List of nodes in this layer
-        edges: List of edges in this layer
+        nodes: Sequence of nodes in this layer
+        edges: Sequence of edges in this layer
         metadata: Additional layer metadata
+        columns: Columnar storage backing this layer, if any
     """
 
     layer_id: str
-    nodes: list[Node] = field(default_factory=list)
-    edges: list[Edge] = field(default_factory=list)
+    nodes: Sequence[Node] = field(default_factory=list)
+    edges: Sequence[Edge] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
+    columns: LayerColumns | None = None
+    _fragments: dict[tuple[Any, ...], tuple[tuple[int, int], str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Record fields change what the layer serializes to (layer_id does not)
+        if name in ("nodes", "edges", "columns") and "_fragments" in self.__dict__:
+            self._fragments.clear()
+        super().__setattr__(name, value)
+        # Records assigned over a column-backed layer replace its columns
+        if name in ("nodes", "edges") and not isinstance(value, _ColumnView):
+            super().__setattr__("columns", None)
+
+    def materialise(self) -> None:
+        """Convert a column-backed layer into lists of Node/Edge objects.
+
+        Afterwards nodes and edges can be edited in place. Does nothing
+        for a layer that is already list-backed.
+        """
+        if self.columns is None:
+            return
+        self.nodes = list(self.nodes)
+        self.edges = list(self.edges)
+
+    def invalidate(self) -> None:
+        """Drop cached JSON fragments after an in-place mutation."""
+        self._fragments.clear()
+
+    def cached_fragment(self, key: tuple[Any, ...]) -> str | None:
+        """Return a cached JSON fragment of this layer's records.
+
+        Args:
+            key: Fragment identity (record kind and encoder options)
+
+        Returns:
+            Cached fragment, or None if missing or the layer has grown/shrunk
+        """
+        entry = self._fragments.get(key)
+        if entry is None or entry[0] != self._fragment_stamp():
+            return None
+        return entry[1]
+
+    def store_fragment(self, key: tuple[Any, ...], fragment: str) -> None:
+        """Cache a JSON fragment of this layer's records.
+
+        Args:
+            key: Fragment identity (record kind and encoder options)
+            fragment: Encoded records
+        """
+        self._fragments[key] = (self._fragment_stamp(), fragment)
+
+    def _fragment_stamp(self) -> tuple[int, int]:
+        """Cheap guard against appends or removals without invalidate()."""
+        return (len(self.nodes), len(self.edges))
+
+    @classmethod
+    def from_columns(
+        cls,
+        layer_id: str,
+        columns: LayerColumns,
+        metadata: dict[str, Any] | None = None,
+    ) -> "GraphLayer":
+        """Create a layer backed by columnar storage.
+
+        Args:
+            layer_id: Unique layer identifier
+            columns: Columnar node/edge storage
+            metadata: Additional layer metadata
+
+        Returns:
+            GraphLayer whose nodes/edges are lazy views over the columns
+        """
+        return cls(
+            layer_id=layer_id,
+            nodes=NodeView(columns),
+            edges=EdgeView(columns),
+            metadata=metadata if metadata is not None else {},
+            columns=columns,
+        )
+
+    def iter_node_records(self) -> Iterator[dict[str, Any]]:
+        """Yield netvis node records for this layer.
+
+        Yields:
+            Node dictionaries in netvis MIME renderer format
+        """
+        if self.columns is not None:
+            yield from self.columns.iter_node_records()
+        else:
+            for node in self.nodes:
+                yield _node_record(node)
+
+    def iter_link_records(self, node_offset: int | None = None) -> Iterator[dict[str, Any]]:
+        """Yield netvis link records for this layer.
+
+        Args:
+            node_offset: If given, links reference nodes by scene-wide index
+                (position in this layer + node_offset) instead of by ID
+
+        Yields:
+            Link dictionaries in netvis MIME renderer format
+
+        Raises:
+            ValueError: If indexing links and an edge references a node
+                missing from this layer
+        """
+        if self.columns is not None:
+            yield from self.columns.iter_link_records(node_offset)
+        elif node_offset is None:
+            for edge in self.edges:
+                yield _link_record(edge)
+        else:
+            # Build the ID -> index map once for the whole layer
+            index = {node.id: row + node_offset for row, node in enumerate(self.nodes)}
+            for edge in self.edges:
+                try:
+                    yield _link_record(edge, index[edge.source], index[edge.target])
+                except KeyError as e:
+                    raise ValueError(f"Edge references unknown node {e.args[0]!r}") from None
 
 
 @dataclass
@@ -79,50 +542,36 @@ class Scene:
     title: str | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, link_index: bool = False) -> dict[str, Any]:
         """Convert scene to dictionary format for MIME renderer.
 
+        Args:
+            link_index: Reference link endpoints by their position in 'nodes'
+                instead of by node ID. The result is marked with
+                ``"linkIndex": true``, which the frontend uses to skip the ID
+                lookup. Smaller for long IDs (URLs, UUIDs).
+
         Returns:
             Dictionary representation compatible with netvis MIME renderer format.
+
+        Raises:
+            ValueError: If link_index is set and an edge references a node
+                missing from its layer
         """
         # Combine all nodes and links from all layers
-        all_nodes = []
-        all_links = []
+        all_nodes: list[dict[str, Any]] = []
+        all_links: list[dict[str, Any]] = []
 
         for layer in self.layers:
-            # Convert nodes to netvis format
-            for node in layer.nodes:
-                node_dict: dict[str, Any] = {
-                    "id": node.id,
-                    "x": node.x,
-                    "y": node.y,
-                }
-                if node.label is not None:
-                    node_dict["name"] = node.label
-                if node.color is not None:
-                    node_dict["category"] = node.color
-                # Add metadata as additional fields
-                node_dict.update(node.metadata)
-                all_nodes.append(node_dict)
-
-            # Convert edges to netvis format (links)
-            for edge in layer.edges:
-                link_dict: dict[str, Any] = {
-                    "source": edge.source,
-                    "target": edge.target,
-                }
-                if edge.label is not None:
-                    link_dict["label"] = edge.label
-                if edge.weight is not None:
-                    link_dict["value"] = edge.weight
-                # Add metadata as additional fields
-                link_dict.update(edge.metadata)
-                all_links.append(link_dict)
-
-        result: dict[str, Any] = {
-            "nodes": all_nodes,
-            "links": all_links,
-        }
+            node_offset = len(all_nodes) if link_index else None
+            all_nodes.extend(layer.iter_node_records())
+            all_links.extend(layer.iter_link_records(node_offset))
+
+        result: dict[str, Any] = {}
+        if link_index:
+            result["linkIndex"] = True
+        result["nodes"] = all_nodes
+        result["links"] = all_links
 
         if self.title:
             result["title"] = self.title
@@ -2,10 +2,15 @@
 This module defines the NetVis widget.
 """
 
+import codecs
+import io
 import json
-from collections.abc import Sequence
+import os
+from collections.abc import Mapping, Sequence
+from pathlib import Path
 from typing import Any
 
+from . import validation
 from ._version import __version__
 
 
@@ -22,36 +27,170 @@ class NetVis:
     This widget show Network Visualization using MIME renderer.
     """
 
-    value = ""
-
-    def __init__(self, value=None, **kwargs):
+    def __init__(
+        self,
+        value=None,
+        streaming: bool | None = None,
+        validation_level: str | None = None,
+        **kwargs,
+    ):
         """
         Initialize NetVis object with graph data validation.
 
+        Graph data is validated where it is: mappings in place, JSON text
+        parsed once (the parsed GraphData is kept, see graph_data), large
+        text and files with a streaming parser, files through a memory map.
+        Open files on disk are validated like their path; other file objects
+        are validated while they are read.
+        The JSON string sent to the frontend is only produced when the MIME
+        bundle is requested.
+
         Args:
-            value (str): JSON string containing graph data with 'nodes' and 'links'
+            value: Graph data with 'nodes' and 'links', as a JSON string,
+                mapping, UTF-8 bytes, open file, or path to a JSON file
+            streaming: Validate with the streaming parser. None (default)
+                streams text and files of at least
+                validation.STREAMING_THRESHOLD characters/bytes, and file
+                objects of unknown size. Only used at the 'full' level.
+            validation_level: 'full', 'structural' (top-level shape only),
+                'sampled' (node IDs and a random subset of link references)
+                or 'none'. None uses validation.get_default_level().
 
         Raises:
             ValueError: If JSON is invalid, nodes/links are missing, or data is inconsistent
         """
+        self._text: str | None = ""
+        self._raw: bytes | None = None
+        self._path: Path | None = None
+        self._graph_data: dict[str, Any] | None = None
+        self._parsed_text: str | None = None
+        level = validation.resolve_level(validation_level)
         # Handle value parameter
-        if value is not None:
-            if value != "":
-                # Type check
-                if not isinstance(value, str):
-                    raise ValueError(f"Value must be a string, not {type(value).__name__}")
-                # GraphData validation
-                self._validate_graph_data(value)
-            self.value = value
+        if value is not None and not (isinstance(value, str) and value == ""):
+            self._load(value, streaming, level)
+
+    def _load(self, value: Any, streaming: bool | None, level: str) -> None:
+        """Validate graph data of any supported input type and remember it."""
+        if isinstance(value, Mapping):
+            validation.validate_graph_data(value, level)
+            self._text = None
+            self._graph_data = dict(value)
+        elif isinstance(value, (bytes, bytearray, memoryview)):
+            raw = bytes(value)
+            if level == "none":
+                pass
+            elif self._use_streaming(streaming, level, len(raw)):
+                validation.validate_graph_stream(io.TextIOWrapper(io.BytesIO(raw), "utf-8-sig"))
+            else:
+                self._graph_data = validation.parse_graph_data(raw, level)
+            self._text, self._raw = None, raw
+        elif isinstance(value, os.PathLike):
+            path = Path(value)
+            if level == "none" or self._use_streaming(streaming, level, path.stat().st_size):
+                if level != "none":
+                    validation.validate_graph_file(path)
+                self._text, self._path = None, path
+            else:
+                self._load(path.read_bytes(), False, level)
+        elif hasattr(value, "read"):
+            path = self._file_path(value)
+            if path is not None:
+                self._load(path, streaming, level)
+            elif self._use_streaming(streaming, level, validation.STREAMING_THRESHOLD):
+                # The size of a stream is unknown until it has been read
+                content = validation.read_graph_stream(value)
+                if isinstance(content, str):
+                    self._text = content
+                else:
+                    self._text, self._raw = None, content
+            else:
+                self._load(value.read(), streaming, level)
+        elif isinstance(value, str):
+            # GraphData validation
+            self._graph_data = self._validate_graph_data(value, streaming, level)
+            self._text = self._parsed_text = value
         else:
-            self.value = ""
-
-    def _validate_graph_data(self, data: str) -> None:
+            raise ValueError(
+                f"Value must be a string, mapping, bytes, file or path, not {type(value).__name__}"
+            )
+
+    @staticmethod
+    def _file_path(fp: Any) -> Path | None:
+        """Return the path of an unread UTF-8 file object opened from disk, if any."""
+        name = getattr(fp, "name", None)
+        if not isinstance(name, (str, bytes, os.PathLike)):
+            return None
+        try:
+            encoding = getattr(fp, "encoding", None)
+            if encoding is not None and codecs.lookup(encoding).name not in ("utf-8", "utf-8-sig"):
+                return None
+            if not fp.seekable() or fp.tell() != 0 or not os.path.isfile(name):
+                return None
+        except (AttributeError, LookupError, OSError, ValueError):
+            return None
+        return Path(os.fsdecode(name))
+
+    @staticmethod
+    def _use_streaming(streaming: bool | None, level: str, size: int) -> bool:
+        """Resolve the streaming option for input of the given size."""
+        if level != "full":
+            # Lighter levels check the parsed structure
+            return False
+        if streaming is None:
+            return size >= validation.STREAMING_THRESHOLD
+        return streaming
+
+    @property
+    def value(self) -> str:
+        """Graph data as a JSON string, serialised once on first access."""
+        if self._text is None:
+            if self._raw is not None:
+                self._text = self._raw.decode("utf-8-sig")
+            elif self._path is not None:
+                self._text = self._path.read_text(encoding="utf-8-sig")
+            else:
+                self._text = json.dumps(self._graph_data)
+            if self._graph_data is not None:
+                # Text and parsed data come from the same input
+                self._parsed_text = self._text
+            self._raw = self._path = None
+        return self._text
+
+    @value.setter
+    def value(self, value: str) -> None:
+        self._text = value
+        self._raw = self._path = None
+
+    @property
+    def graph_data(self) -> dict[str, Any] | None:
+        """Parsed GraphData, or None for an empty widget.
+
+        Parsed at most once per value: reuses the structure from validation,
+        or parses lazily if the value was validated by streaming or replaced.
+        """
+        if self._text is not None:
+            if self._graph_data is None or self._parsed_text is not self._text:
+                self._graph_data = json.loads(self._text) if self._text else None
+                self._parsed_text = self._text
+        elif self._graph_data is None:
+            # Bytes or a file validated by streaming
+            source = self._raw if self._raw is not None else self._path.read_bytes()
+            self._graph_data = json.loads(source)
+        return self._graph_data
+
+    def _validate_graph_data(
+        self, data: str, streaming: bool | None = False, level: str = "full"
+    ) -> dict[str, Any] | None:
         """
         Validate GraphData structure.
 
         Args:
             data (str): JSON string to validate
+            streaming: Use the streaming parser (None: decide by size)
+            level: Validation level (see validation.VALIDATION_LEVELS)
+
+        Returns:
+            Parsed GraphData, or None when validated by streaming or not at all
 
         Raises:
             ValueError: If validation fails
@@ -60,59 +199,12 @@ class NetVis:
         if not isinstance(data, str):
             raise ValueError(f"Value must be a string, not {type(data).__name__}")
 
-        try:
-            parsed = json.loads(data)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON format: {e}")
-
-        if not isinstance(parsed, dict):
-            raise ValueError("GraphData must be a JSON object")
-
-        if "nodes" not in parsed:
-            raise ValueError("GraphData must contain 'nodes' array")
-
-        if "links" not in parsed:
-            raise ValueError("GraphData must contain 'links' array")
-
-        nodes = parsed["nodes"]
-        links = parsed["links"]
-
-        if not isinstance(nodes, list):
-            raise ValueError("'nodes' must be an array")
-
-        if not isinstance(links, list):
-            raise ValueError("'links' must be an array")
-
-        # Check for duplicate node IDs
-        node_ids = set()
-        for node in nodes:
-            if not isinstance(node, dict):
-                raise ValueError("Each node must be an object")
-            if "id" not in node:
-                raise ValueError("Each node must have an 'id' field")
-
-            node_id = node["id"]
-            if node_id in node_ids:
-                raise ValueError(f"Duplicate node ID: {node_id}")
-            node_ids.add(node_id)
-
-        # Check link references
-        for link in links:
-            if not isinstance(link, dict):
-                raise ValueError("Each link must be an object")
-
-            if "source" not in link:
-                raise ValueError("Each link must have a 'source' field")
-            if "target" not in link:
-                raise ValueError("Each link must have a 'target' field")
-
-            source = link["source"]
-            target = link["target"]
-
-            if source not in node_ids:
-                raise ValueError(f"Link source '{source}' does not exist in nodes")
-            if target not in node_ids:
-                raise ValueError(f"Link target '{target}' does not exist in nodes")
+        if level == "none":
+            return None
+        if self._use_streaming(streaming, level, len(data)):
+            validation.validate_graph_stream(data)
+            return None
+        return validation.parse_graph_data(data, level)
 
     def _repr_mimebundle_(
         self, include: Sequence[str] | None = None, exclude: Sequence[str] | None = None
@@ -122,7 +214,8 @@ class NetVis:
 
         This method is automatically called by IPython/JupyterLab to display
         the NetVis object. It returns a custom MIME type that will be handled
-        by the NetVisRenderer TypeScript extension.
+        by the NetVisRenderer TypeScript extension. The value was validated
+        when the object was created, so it is not parsed again here.
 
         Args:
             include: Optional list of MIME types to include (not used)
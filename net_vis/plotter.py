@@ -1,13 +1,25 @@
 """High-level API for plotting NetworkX graphs in JupyterLab."""
 
-import json
-from collections.abc import Callable
+from collections.abc import Callable, Container, Hashable, Iterable, Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO, overload
 
+from .adapters.attributes import AttributeFilter
+from .adapters.colors import ColorMap
+from .adapters.layout_cache import LayoutCache
+from .adapters.mapping import BatchMapping
 from .adapters.networkx_adapter import NetworkXAdapter
 from .html_exporter import ExportOptions, HTMLExporter
 from .models import Scene
+from .serializer import BINARY_MIME_TYPE, MIME_TYPE, SceneBinaryEncoder, SceneJSONEncoder
+
+_WIRE_FORMATS = ("json", "binary", "auto")
+
+_BUNDLE_MODES = ("inline", "linked")
+
+# With wire_format='auto', scenes with at least this many nodes are sent in
+# the binary format
+_BINARY_MIN_NODES = 5000
 
 
 class Plotter:
@@ -46,16 +58,36 @@ class Plotter:
     Attributes:
         _scene: Internal Scene object containing all visualization layers
         _layer_counter: Counter for auto-generating unique layer IDs
+        _revision: Counter bumped whenever the scene changes
+        _wire_format: MIME payload format ('json', 'binary' or 'auto')
+        _payloads: Binary payload of a column-backed scene under "binary", valid
+            for the scene state recorded in _payload_state
     """
 
-    def __init__(self, title: str | None = None) -> None:
+    def __init__(self, title: str | None = None, wire_format: str = "json") -> None:
         """Initialize plotter with optional scene title.
 
         Args:
             title: Optional title for the visualization scene
+            wire_format: Payload sent to JupyterLab:
+                - 'json': JSON records (application/vnd.netvis+json, default)
+                - 'binary': Typed arrays and a string table
+                  (application/vnd.netvis.binary+json), several times smaller.
+                  Only frontends with a renderer for that MIME type can
+                  display it.
+                - 'auto': 'binary' for scenes with at least 5000 nodes
+
+        Raises:
+            ValueError: If wire_format is unknown
         """
+        if wire_format not in _WIRE_FORMATS:
+            raise ValueError(f"wire_format must be one of {_WIRE_FORMATS}, got {wire_format!r}")
         self._scene = Scene(title=title)
         self._layer_counter = 0
+        self._wire_format = wire_format
+        self._revision = 0
+        self._payloads: dict[Hashable, Any] = {}
+        self._payload_state: tuple[Any, ...] | None = None
 
     def _generate_layer_id(self) -> str:
         """Generate unique layer ID.
@@ -67,15 +99,66 @@ class Plotter:
         self._layer_counter += 1
         return layer_id
 
+    @staticmethod
+    def _resolve_layout_cache(layout_cache: LayoutCache | bool) -> LayoutCache | None:
+        """Resolve the layout_cache argument to a cache instance.
+
+        Args:
+            layout_cache: True for the shared cache, False to disable, or a cache
+
+        Returns:
+            LayoutCache to use, or None if caching is disabled
+        """
+        if layout_cache is True:
+            return LayoutCache.shared()
+        if layout_cache is False:
+            return None
+        return layout_cache
+
+    def _layer_positions(self, graph: Any, layer_id: str) -> dict[Any, Any]:
+        """Collect positions of an existing layer for the nodes of a graph.
+
+        Args:
+            graph: NetworkX graph whose nodes are matched by string ID
+            layer_id: ID of a layer in this plotter
+
+        Returns:
+            Mapping from graph node to (x, y) position in that layer
+
+        Raises:
+            ValueError: If no layer has the given ID
+        """
+        layer = next((item for item in self._scene.layers if item.layer_id == layer_id), None)
+        if layer is None:
+            raise ValueError(f"Unknown layer for warm start: '{layer_id}'")
+
+        if layer.columns is not None:
+            columns = layer.columns
+            ids = columns.strings.resolve(columns.nodes.ids)
+            coords = zip(columns.nodes.x.tolist(), columns.nodes.y.tolist(), strict=True)
+            by_id = dict(zip(ids, coords, strict=True))
+        else:
+            by_id = {node.id: (node.x, node.y) for node in layer.nodes}
+
+        return {node_id: by_id[str(node_id)] for node_id in graph if str(node_id) in by_id}
+
     def add_networkx(
         self,
         graph: Any,
         *,
         layer_id: str | None = None,
         layout: str | Callable | None = None,
-        node_color: str | Callable | None = None,
-        node_label: str | Callable | None = None,
-        edge_label: str | Callable | None = None,
+        layout_options: dict[str, Any] | None = None,
+        layout_cache: LayoutCache | bool = True,
+        warm_start: Any = None,
+        fix_unchanged: bool = False,
+        split_components: bool = False,
+        workers: int | None = None,
+        node_color: str | Callable | BatchMapping | ColorMap | None = None,
+        node_label: str | Callable | BatchMapping | None = None,
+        edge_label: str | Callable | BatchMapping | None = None,
+        node_attrs: AttributeFilter | Iterable[str] | None = None,
+        edge_attrs: AttributeFilter | Iterable[str] | None = None,
     ) -> str:
         """Add NetworkX graph as visualization layer.
 
@@ -85,7 +168,8 @@ class Plotter:
 
         Args:
             graph: NetworkX graph object (Graph/DiGraph/MultiGraph/MultiDiGraph).
-                All node and edge attributes are preserved in metadata.
+                Node and edge attributes are preserved in metadata (see
+                node_attrs/edge_attrs to restrict which ones).
             layer_id: Custom layer ID (auto-generated if None).
             layout: Layout algorithm or custom function:
                 - 'spring': Force-directed layout (default)
@@ -93,20 +177,59 @@ class Plotter:
                 - 'spectral': Spectral layout using graph Laplacian
                 - 'circular': Nodes arranged in a circle
                 - 'random': Random node positions
+                - 'multilevel': Coarsen-and-refine force-directed layout for
+                  very large graphs
+                - 'barnes_hut': Force-directed layout with Barnes-Hut
+                  repulsion (options: iterations, theta, seed)
                 - callable: Custom function(graph) -> dict[node_id, (x, y)]
                 - None: Use existing 'pos' attribute or fall back to spring
+            layout_options: Keyword arguments for the layout algorithm,
+                e.g. {"seed": 42, "iterations": 100}
+            layout_cache: Reuse positions of named layouts for unchanged
+                topologies. Only deterministic layouts (kamada_kawai,
+                spectral, circular) and seeded layouts are reused:
+                - True: Use the shared in-memory cache (default)
+                - LayoutCache: Use the given cache (e.g. with an on-disk store)
+                - False: Always recompute the layout
+            warm_start: Start the spring layout from prior positions and run
+                only a few iterations, for stable re-plots of evolving graphs:
+                - str: ID of a previous layer in this plotter
+                - NetworkX graph: Previous snapshot (layout taken from the cache)
+                - dict: Node ID -> (x, y) position
+                - True: The graph's own 'pos' node attributes
+                - None: Compute the layout from scratch (default)
+            fix_unchanged: Keep nodes with a prior position fixed when
+                warm-starting, so only new nodes move
+            split_components: Lay out each connected component separately and
+                pack the components side by side without overlap. Suited to
+                forests of many small components.
+            workers: Number of processes used to lay out components in
+                parallel (None for all CPUs, 1 to stay in-process)
             node_color: Node color mapping:
                 - str: Attribute name to use for color values
                 - callable: Function(node_data) -> color_value
+                - BatchMapping: Vectorised function over all nodes at once
+                - ColorMap: Numeric gradient or categorical palette over any
+                  of the above
                 - None: No color mapping (default)
+                Numeric color values are mapped through a blue-to-red scale
+                spanning their min/max; other values are used as colors.
             node_label: Node label mapping:
                 - str: Attribute name to use for labels
                 - callable: Function(node_data) -> label_string
+                - BatchMapping: Vectorised function over all nodes at once
                 - None: No label mapping (default)
             edge_label: Edge label mapping:
                 - str: Attribute name to use for labels
                 - callable: Function(edge_data) -> label_string
+                - BatchMapping: Vectorised function over all edges at once
                 - None: No label mapping (default)
+            node_attrs: Node attributes exported to metadata:
+                - list of str: Only these attribute names
+                - AttributeFilter: Include/exclude names, size cap, JSON type filter
+                - None: All attributes (default)
+            edge_attrs: Edge attributes exported to metadata (same options as
+                node_attrs). Derived 'edge_key'/'directed' fields are always kept.
 
         Returns:
             str: ID of the added layer (auto-generated or custom)
@@ -135,6 +258,28 @@ class Plotter:
                 ...     node_label=lambda d: f"Node {d.get('id', '')}"
                 ... )
 
+            With vectorised styling on large graphs:
+                >>> plotter.add_networkx(
+                ...     G,
+                ...     node_color=BatchMapping(
+                ...         lambda club: np.where(club == 0, 'red', 'blue'), attribute='club'
+                ...     ),
+                ... )
+
+            With color scales:
+                >>> plotter.add_networkx(G, node_color=ColorMap('score', vmin=0, vmax=1))
+                >>> plotter.add_networkx(G, node_color=ColorMap('club', kind='categorical'))
+
+            With attribute projection:
+                >>> plotter.add_networkx(
+                ...     G,
+                ...     node_attrs=["club"],
+                ...     edge_attrs=AttributeFilter(exclude=["embedding"], json_only=True),
+                ... )
+
+            Forest of many small components, laid out in parallel:
+                >>> plotter.add_networkx(forest, split_components=True, workers=4)
+
         Notes:
             - All graph types (Graph, DiGraph, MultiGraph, MultiDiGraph) are supported
             - DiGraph edges include 'directed': True in metadata
@@ -146,6 +291,10 @@ class Plotter:
         if not hasattr(graph, "nodes") or not hasattr(graph, "edges"):
             raise TypeError(f"Expected NetworkX graph object, got {type(graph).__name__}")
 
+        # Resolve a previous layer ID to its node positions
+        if isinstance(warm_start, str):
+            warm_start = self._layer_positions(graph, warm_start)
+
         # Generate layer ID if not provided
         if layer_id is None:
             layer_id = self._generate_layer_id()
@@ -154,29 +303,150 @@ class Plotter:
         graph_layer = NetworkXAdapter.convert_graph(
             graph,
             layout=layout,
+            layout_options=layout_options,
+            layout_cache=self._resolve_layout_cache(layout_cache),
+            warm_start=warm_start,
+            fix_unchanged=fix_unchanged,
+            split_components=split_components,
+            workers=workers,
             node_color=node_color,
             node_label=node_label,
             edge_label=edge_label,
+            node_attrs=node_attrs,
+            edge_attrs=edge_attrs,
         )
         graph_layer.layer_id = layer_id
 
         # Add layer to scene
         self._scene.layers.append(graph_layer)
+        self._invalidate_payload()
 
         return layer_id
 
-    def to_json(self) -> str:
-        """Export scene structure as JSON string.
+    def _invalidate_payload(self) -> None:
+        """Mark the scene as changed so cached payloads are re-encoded.
+
+        Must be called by every method that mutates the scene.
+        """
+        self._revision += 1
+
+    def _cached_payload(self, key: Hashable) -> Any:
+        """Return the cached scene payload for an encoding, if still valid."""
+        # Layer count and title also catch direct edits of the scene
+        state = (self._revision, len(self._scene.layers), self._scene.title)
+        if state != self._payload_state:
+            self._payloads.clear()
+            self._payload_state = state
+        return self._payloads.get(key)
+
+    def _iter_payload(
+        self, indent: int | None = None, ensure_ascii: bool = False, link_index: bool = False
+    ) -> Iterator[str]:
+        """Encode the scene as JSON in chunks.
+
+        Only the compact form (the defaults), shared by _repr_mimebundle_
+        and export_html, keeps encoded fragments on column-backed layers, so
+        unchanged layers are not re-encoded and only one copy of that
+        variant is held in memory.
+
+        Args:
+            indent: Indentation level for pretty-printing (None for compact)
+            ensure_ascii: Escape non-ASCII characters
+            link_index: Reference link endpoints by node index instead of ID
+
+        Returns:
+            Iterator over consecutive fragments of the JSON document
+        """
+        encoder = SceneJSONEncoder(
+            indent=indent,
+            ensure_ascii=ensure_ascii,
+            cache_fragments=indent is None and not ensure_ascii and not link_index,
+            link_index=link_index,
+        )
+        return encoder.iter_encode(self._scene)
+
+    def _payload(
+        self, indent: int | None = None, ensure_ascii: bool = False, link_index: bool = False
+    ) -> str:
+        """Encode the scene as a JSON string (see _iter_payload)."""
+        return "".join(self._iter_payload(indent, ensure_ascii, link_index))
+
+    def _binary_payload(self) -> dict[str, Any]:
+        """Encode the scene in the binary wire format.
+
+        The payload is reused until the scene changes if every layer is
+        column-backed; Node/Edge objects can be edited in place unnoticed.
+        """
+        payload = self._cached_payload("binary")
+        if payload is None:
+            payload = SceneBinaryEncoder().encode(self._scene)
+            if all(layer.columns is not None for layer in self._scene.layers):
+                self._payloads["binary"] = payload
+        return payload
+
+    def _resolve_wire_format(
+        self, include: Container[str] | None, exclude: Container[str] | None
+    ) -> str:
+        """Pick the MIME payload format for a display request.
+
+        Args:
+            include: MIME types requested by the frontend, if restricted
+            exclude: MIME types the frontend does not want
 
         Returns:
-            JSON string representation of the scene
+            'json' or 'binary'
         """
-        scene_dict = self._scene.to_dict()
-        return json.dumps(scene_dict, indent=2)
+        wire_format = self._wire_format
+        if wire_format == "auto":
+            node_count = sum(len(layer.nodes) for layer in self._scene.layers)
+            wire_format = "binary" if node_count >= _BINARY_MIN_NODES else "json"
+        if wire_format == "binary" and (
+            (include is not None and BINARY_MIME_TYPE not in include)
+            or (exclude is not None and BINARY_MIME_TYPE in exclude)
+        ):
+            wire_format = "json"
+        return wire_format
+
+    @overload
+    def to_json(self, fp: None = None, *, link_index: bool = False) -> str: ...
+
+    @overload
+    def to_json(self, fp: TextIO, *, link_index: bool = False) -> None: ...
+
+    def to_json(self, fp: TextIO | None = None, *, link_index: bool = False) -> str | None:
+        """Export scene structure as JSON.
+
+        Writing to ``fp`` encodes the scene incrementally so memory stays
+        bounded regardless of graph size.
+
+        Args:
+            fp: Optional writable text file object. If given, JSON is streamed
+                into it and None is returned.
+            link_index: Reference link endpoints by their position in 'nodes'
+                instead of by node ID (see Scene.to_dict). Much smaller for
+                long node IDs such as URLs or UUIDs.
+
+        Returns:
+            JSON string representation of the scene, or None if ``fp`` is given
+
+        Raises:
+            ValueError: If link_index is set and an edge references a node
+                missing from its layer
+        """
+        if fp is not None:
+            SceneJSONEncoder(indent=2, link_index=link_index).dump(self._scene, fp)
+            return None
+        return self._payload(indent=2, ensure_ascii=True, link_index=link_index)
 
     def _repr_mimebundle_(self, include=None, exclude=None) -> dict:
         """Return MIME bundle for IPython/JupyterLab display.
 
+        Column-backed layers keep their encoded records, so repeated
+        displays of an unchanged plotter only re-assemble the payload. With
+        wire_format='binary' (or 'auto' for large scenes) the scene is sent
+        in the compact binary format unless the frontend excludes its MIME
+        type.
+
         Args:
             include: Optional list of MIME types to include
             exclude: Optional list of MIME types to exclude
@@ -184,12 +454,10 @@ class Plotter:
         Returns:
             Dictionary mapping MIME types to content
         """
-        scene_dict = self._scene.to_dict()
-
-        return {
-            "application/vnd.netvis+json": {"data": json.dumps(scene_dict)},
-            "text/plain": f"<Plotter with {len(self._scene.layers)} layer(s)>",
-        }
+        text = f"<Plotter with {len(self._scene.layers)} layer(s)>"
+        if self._resolve_wire_format(include, exclude) == "binary":
+            return {BINARY_MIME_TYPE: {"data": self._binary_payload()}, "text/plain": text}
+        return {MIME_TYPE: {"data": self._payload()}, "text/plain": text}
 
     def export_html(
         self,
@@ -200,6 +468,11 @@ class Plotter:
         width: str = "100%",
         height: int = 600,
         download: bool = False,
+        link_index: bool = False,
+        compress: bool = False,
+        bundle: str = "inline",
+        bundle_url: str | None = None,
+        bundle_integrity: bool | None = None,
     ) -> str | Path:
         """Export visualization as standalone HTML.
 
@@ -228,6 +501,26 @@ class Plotter:
             download: If True, trigger browser download (for remote environments).
                 - Useful in JupyterHub, Google Colab, Binder
                 - Uses IPython display mechanism
+            link_index: Embed links with node indices instead of node IDs.
+                - Shrinks files whose node IDs are long (URLs, UUIDs)
+                - Lets the page build its link force without an ID lookup
+            compress: Embed graph data gzip-compressed and base64-encoded.
+                - Typically 5-10x smaller files for large graphs
+                - Decompressed by the browser (DecompressionStream), which
+                  needs Chrome 80+, Firefox 113+ or Safari 16.4+
+            bundle: How the JavaScript bundle is included:
+                - 'inline': Embedded in the file, fully self-contained (default)
+                - 'linked': Written once next to the file under a
+                  content-hashed name and referenced with <script src>,
+                  so many exports share one copy
+            bundle_url: URL or path of an already hosted bundle to reference
+                instead of writing one (implies bundle='linked'; see
+                HTMLExporter.write_bundle)
+            bundle_integrity: Add a Subresource Integrity hash to the linked
+                bundle's <script> element.
+                - None (default): only for bundle_url, since Chromium
+                  refuses integrity-checked scripts on file:// pages
+                - True/False: always/never add it
 
         Returns:
             - If filepath is provided: Path object of written file
@@ -235,7 +528,8 @@ class Plotter:
 
         Raises:
             OSError: If file write fails (permission denied, disk full, etc.)
-            ValueError: If height is not a positive integer
+            ValueError: If height is not a positive integer, bundle is
+                unknown, or bundle='linked' is used without filepath or bundle_url
 
         Examples:
             Export to file:
@@ -253,6 +547,12 @@ class Plotter:
                 ...     height=800
                 ... )
 
+            Compressed export of a large graph:
+                >>> plotter.export_html("large.html", compress=True)
+
+            Many small exports sharing one JS bundle:
+                >>> plotter.export_html("reports/graph_001.html", bundle="linked")
+
             Get HTML string:
                 >>> html = plotter.export_html()
                 >>> # Use html string in web application, email, etc.
@@ -261,11 +561,39 @@ class Plotter:
             - Exported HTML works offline (no internet required)
             - All modern browsers supported (Chrome, Firefox, Safari, Edge)
             - Interactive features preserved (zoom, pan, node selection)
-            - File size depends on graph complexity (data embedded as JSON)
+            - File size depends on graph complexity (data embedded as JSON,
+              or gzip-compressed with compress=True)
+            - Linked bundles written next to the file open from file://;
+              bundle_integrity=True pages must be served over HTTP(S)
         """
         # Validate height
         if not isinstance(height, int) or height <= 0:
             raise ValueError("height must be a positive integer")
+        if bundle not in _BUNDLE_MODES:
+            raise ValueError(f"bundle must be one of {_BUNDLE_MODES}, got {bundle!r}")
+        if bundle == "linked" and filepath is None and bundle_url is None:
+            raise ValueError("bundle='linked' needs a filepath or bundle_url")
+
+        path = None
+        if filepath is not None:
+            path = Path(filepath)
+
+            # Auto-add .html extension if missing
+            if path.suffix.lower() != ".html":
+                path = path.with_suffix(path.suffix + ".html")
+
+            # Create parent directories if needed
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write the shared bundle next to the file unless it is hosted elsewhere
+        exporter = HTMLExporter.shared()
+        bundle_src = bundle_url
+        if bundle == "linked" and bundle_src is None and path is not None:
+            bundle_src = exporter.write_bundle(path.parent).name
+
+        # SRI only works over HTTP(S), so by default it is kept to hosted bundles
+        if bundle_integrity is None:
+            bundle_integrity = bundle_url is not None
 
         # Create export options
         options = ExportOptions(
@@ -273,28 +601,24 @@ class Plotter:
             description=description,
             width=width,
             height=height,
+            compress=compress,
+            bundle_src=bundle_src,
+            bundle_integrity=bundle_integrity,
+            link_index=link_index,
         )
 
-        # Generate HTML using exporter
-        exporter = HTMLExporter()
-        html = exporter.export(self._scene, options)
-
         # If no filepath, return HTML string
-        if filepath is None:
-            return html
-
-        # Handle file path
-        path = Path(filepath)
-
-        # Auto-add .html extension if missing
-        if path.suffix.lower() != ".html":
-            path = path.with_suffix(path.suffix + ".html")
-
-        # Create parent directories if needed
-        path.parent.mkdir(parents=True, exist_ok=True)
+        if path is None:
+            return exporter.export(
+                self._scene, options, json_data=self._iter_payload(link_index=link_index)
+            )
 
-        # Write file
-        path.write_text(html, encoding="utf-8")
+        # Stream into the file; the scene is serialized as it is written,
+        # reusing the fragments cached on its layers
+        with path.open("w", encoding="utf-8") as fp:
+            exporter.write(
+                self._scene, fp, options, json_data=self._iter_payload(link_index=link_index)
+            )
 
         # Handle download for remote environments
         if download:
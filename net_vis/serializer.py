@@ -0,0 +1,412 @@
+"""Streaming JSON and compact binary serialization for Scene objects."""
+
+import base64
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any, TextIO
+
+import numpy as np
+
+from .models import EdgeColumns, GraphLayer, LayerColumns, NodeColumns, Scene, StringTable
+
+# MIME type of the JSON-in-JSON netvis payload
+MIME_TYPE = "application/vnd.netvis+json"
+
+# MIME type of the compact payload produced by SceneBinaryEncoder
+BINARY_MIME_TYPE = "application/vnd.netvis.binary+json"
+
+
+class SceneJSONEncoder:
+    """Encodes a Scene as netvis JSON without materialising the whole document.
+
+    Node and link records are generated layer by layer and encoded in
+    fixed-size batches, so peak memory is bounded by the batch size rather
+    than by the size of the graph. The output is identical to
+    ``json.dumps(scene.to_dict(), ...)`` with the same options.
+
+    With ``cache_fragments`` the encoded records of each column-backed
+    layer are kept on the layer and reused by later caching encodings with
+    the same options, so re-encoding a scene after adding a layer only
+    encodes the new layer. Layers holding lists of Node/Edge objects can be
+    edited in place and are always encoded afresh.
+
+    With ``link_index`` links reference nodes by their position in the
+    ``nodes`` array, as ``Scene.to_dict(link_index=True)`` does.
+
+    Examples:
+        Stream to a file:
+            >>> with open("scene.json", "w", encoding="utf-8") as fp:
+            ...     SceneJSONEncoder().dump(scene, fp)
+
+        Build a string:
+            >>> text = SceneJSONEncoder(indent=2).encode(scene)
+    """
+
+    def __init__(
+        self,
+        *,
+        indent: int | None = None,
+        ensure_ascii: bool = True,
+        batch_size: int = 1000,
+        cache_fragments: bool = False,
+        link_index: bool = False,
+    ) -> None:
+        """Initialize encoder with json.dumps-compatible options.
+
+        Args:
+            indent: Indentation level for pretty-printing (None for compact)
+            ensure_ascii: Escape non-ASCII characters (as in json.dumps)
+            batch_size: Number of records encoded per chunk
+            cache_fragments: Store and reuse the encoded records of
+                column-backed layers on the layer
+            link_index: Reference link endpoints by node index instead of ID
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+        self._indent = indent
+        self._ensure_ascii = ensure_ascii
+        self._batch_size = batch_size
+        self._cache_fragments = cache_fragments
+        self._link_index = link_index
+        self._encoder = json.JSONEncoder(ensure_ascii=ensure_ascii, indent=indent)
+        self._item_separator = self._encoder.item_separator
+        self._key_separator = self._encoder.key_separator
+
+    def iter_encode(self, scene: Scene) -> Iterator[str]:
+        """Yield the JSON document for a scene in chunks.
+
+        Args:
+            scene: Scene object to serialize
+
+        Yields:
+            Consecutive fragments of the JSON document
+        """
+        newline = "" if self._indent is None else "\n"
+        pad = "" if self._indent is None else " " * self._indent
+
+        yield "{"
+        if self._link_index:
+            yield (
+                f"{newline}{pad}{self._encoder.encode('linkIndex')}"
+                f"{self._key_separator}true{self._item_separator}"
+            )
+        yield from self._iter_member("nodes", scene.layers, first=True)
+        yield from self._iter_member("links", scene.layers)
+        if scene.title:
+            yield (
+                f"{self._item_separator}{newline}{pad}"
+                f"{self._encoder.encode('title')}{self._key_separator}"
+                f"{self._encoder.encode(scene.title)}"
+            )
+        yield f"{newline}}}"
+
+    def encode(self, scene: Scene) -> str:
+        """Serialize a scene to a JSON string.
+
+        Args:
+            scene: Scene object to serialize
+
+        Returns:
+            JSON string representation of the scene
+        """
+        return "".join(self.iter_encode(scene))
+
+    def dump(self, scene: Scene, fp: TextIO) -> None:
+        """Serialize a scene as JSON into a text file object.
+
+        Args:
+            scene: Scene object to serialize
+            fp: Writable text file object
+        """
+        for chunk in self.iter_encode(scene):
+            fp.write(chunk)
+
+    def _iter_member(
+        self,
+        key: str,
+        layers: Iterable[GraphLayer],
+        first: bool = False,
+    ) -> Iterator[str]:
+        """Yield one top-level ``"key": [records...]`` member.
+
+        Args:
+            key: Member name ('nodes' or 'links')
+            layers: Layers whose records form the array value
+            first: Whether this is the first member of the object
+
+        Yields:
+            Fragments of the member
+        """
+        newline = "" if self._indent is None else "\n"
+        pad = "" if self._indent is None else " " * self._indent
+        separator = "" if first else self._item_separator
+
+        yield f"{separator}{newline}{pad}{self._encoder.encode(key)}{self._key_separator}["
+
+        empty = True
+        node_offset = 0
+        for layer in layers:
+            offset = node_offset if self._link_index and key == "links" else None
+            for body in self._iter_layer(layer, key, offset):
+                yield body if empty else f"{self._item_separator}{body}"
+                empty = False
+            if offset is not None:
+                node_offset += len(layer.nodes)
+
+        yield "]" if empty else f"{newline}{pad}]"
+
+    def _iter_layer(
+        self, layer: GraphLayer, key: str, node_offset: int | None = None
+    ) -> Iterator[str]:
+        """Yield the encoded records of one layer, using the layer's cache if enabled.
+
+        Args:
+            layer: Layer to encode
+            key: 'nodes' or 'links'
+            node_offset: Index of the layer's first node when links reference
+                nodes by index, None to reference them by ID
+
+        Yields:
+            Non-empty array element fragments, to be joined by the item separator
+        """
+        cache_key = (key, self._indent, self._ensure_ascii, node_offset)
+        cacheable = self._cache_fragments and layer.columns is not None
+        fragment = layer.cached_fragment(cache_key) if cacheable else None
+        if fragment is None:
+            if key == "nodes":
+                records = layer.iter_node_records()
+            else:
+                records = layer.iter_link_records(node_offset)
+            bodies = self._iter_batches(records)
+            if not cacheable:
+                yield from bodies
+                return
+            fragment = self._item_separator.join(bodies)
+            layer.store_fragment(cache_key, fragment)
+        if fragment:
+            yield fragment
+
+    def _iter_batches(self, records: Iterable[dict[str, Any]]) -> Iterator[str]:
+        """Encode records in batches of batch_size.
+
+        Args:
+            records: Records forming array elements
+
+        Yields:
+            Encoded batches (see _encode_batch)
+        """
+        batch: list[dict[str, Any]] = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= self._batch_size:
+                yield self._encode_batch(batch)
+                batch = []
+        if batch:
+            yield self._encode_batch(batch)
+
+    def _encode_batch(self, batch: list[dict[str, Any]]) -> str:
+        """Encode a batch of records as array elements.
+
+        The batch is encoded as one JSON list (a single call into the C
+        encoder) and the surrounding brackets are stripped.
+
+        Args:
+            batch: Records to encode
+
+        Returns:
+            Array elements without a leading separator
+        """
+        text = self._encoder.encode(batch)
+        if self._indent is None:
+            return text[1:-1]
+
+        # Strip "[\n" and "\n]", then indent one level deeper (inside the member)
+        pad = " " * self._indent
+        return "\n" + pad + text[2:-2].replace("\n", "\n" + pad)
+
+
+def _base64(values: np.ndarray, dtype: str) -> str:
+    """Encode an array as base64 of its little-endian bytes."""
+    return base64.b64encode(np.ascontiguousarray(values, dtype=dtype).tobytes()).decode("ascii")
+
+
+def _object_columns(layer: GraphLayer) -> LayerColumns:
+    """Build columnar storage for a layer backed by Node/Edge objects.
+
+    Args:
+        layer: Layer with list-backed nodes and edges
+
+    Returns:
+        LayerColumns equivalent to the layer's objects
+
+    Raises:
+        ValueError: If an edge references a node missing from the layer
+    """
+    strings = StringTable()
+    nodes = list(layer.nodes)
+    edges = list(layer.edges)
+    rows = {node.id: row for row, node in enumerate(nodes)}
+    node_attrs: dict[str, dict[int, Any]] = {}
+    for row, node in enumerate(nodes):
+        for name, value in node.metadata.items():
+            node_attrs.setdefault(name, {})[row] = value
+    edge_attrs: dict[str, dict[int, Any]] = {}
+    for row, edge in enumerate(edges):
+        for name, value in edge.metadata.items():
+            edge_attrs.setdefault(name, {})[row] = value
+    try:
+        source = [rows[edge.source] for edge in edges]
+        target = [rows[edge.target] for edge in edges]
+    except KeyError as e:
+        raise ValueError(f"Edge references unknown node {e.args[0]!r}") from None
+
+    return LayerColumns(
+        strings=strings,
+        nodes=NodeColumns(
+            ids=np.array([strings.intern(node.id) for node in nodes], dtype=np.int32),
+            x=np.array([node.x for node in nodes], dtype=np.float64),
+            y=np.array([node.y for node in nodes], dtype=np.float64),
+            labels=np.array([strings.intern(node.label) for node in nodes], dtype=np.int32),
+            colors=np.array([strings.intern(node.color) for node in nodes], dtype=np.int32),
+            attrs=node_attrs,
+        ),
+        edges=EdgeColumns(
+            source=np.array(source, dtype=np.int32),
+            target=np.array(target, dtype=np.int32),
+            labels=np.array([strings.intern(edge.label) for edge in edges], dtype=np.int32),
+            weight=np.array(
+                [np.nan if edge.weight is None else edge.weight for edge in edges],
+                dtype=np.float64,
+            ),
+            attrs=edge_attrs,
+        ),
+    )
+
+
+class SceneBinaryEncoder:
+    """Encodes a Scene in the compact netvis binary wire format.
+
+    Instead of one JSON record per node and link, the payload holds typed
+    arrays (base64 encoded little-endian bytes) and a string table:
+
+    - ``strings``: node IDs, labels and colors, each stored once
+    - ``nodes``: ``id``/``name``/``category`` (int32 string indices, -1 for
+      none) and ``x``/``y`` (float32)
+    - ``links``: ``source``/``target`` (uint32 node indices), ``label``
+      (int32 string index) and ``value`` (float32, NaN for none)
+    - ``attrs`` of nodes and links: per attribute, the rows holding a value
+      (uint32) and the JSON values themselves
+
+    Links reference nodes by position, so the frontend needs no ID lookup,
+    and nodes of different layers never clash.
+
+    Examples:
+        >>> payload = SceneBinaryEncoder().encode(scene)
+        >>> bundle = {BINARY_MIME_TYPE: {"data": payload}}
+    """
+
+    VERSION = 1
+
+    def encode(self, scene: Scene) -> dict[str, Any]:
+        """Serialize a scene to the binary wire format.
+
+        Args:
+            scene: Scene object to serialize
+
+        Returns:
+            JSON-compatible payload dictionary
+
+        Raises:
+            ValueError: If an object-backed layer has an edge to an unknown node
+        """
+        strings: list[str] = []
+        node_parts: dict[str, list[np.ndarray]] = {
+            key: [] for key in ("id", "x", "y", "name", "category")
+        }
+        link_parts: dict[str, list[np.ndarray]] = {
+            key: [] for key in ("source", "target", "label", "value")
+        }
+        node_attrs: dict[str, tuple[list[np.ndarray], list[Any]]] = {}
+        link_attrs: dict[str, tuple[list[np.ndarray], list[Any]]] = {}
+        node_offset = link_offset = 0
+
+        for layer in scene.layers:
+            columns = layer.columns if layer.columns is not None else _object_columns(layer)
+            nodes, edges = columns.nodes, columns.edges
+
+            # Shift layer-local string and node indices into the scene tables
+            string_offset = len(strings)
+            strings.extend(columns.strings.strings)
+
+            def shift(indices: np.ndarray, offset: int = string_offset) -> np.ndarray:
+                return np.where(indices >= 0, indices + offset, -1)
+
+            node_parts["id"].append(nodes.ids + string_offset)
+            node_parts["x"].append(nodes.x)
+            node_parts["y"].append(nodes.y)
+            node_parts["name"].append(shift(nodes.labels))
+            node_parts["category"].append(shift(nodes.colors))
+            link_parts["source"].append(edges.source + node_offset)
+            link_parts["target"].append(edges.target + node_offset)
+            link_parts["label"].append(shift(edges.labels))
+            link_parts["value"].append(edges.weight)
+
+            self._collect_attrs(node_attrs, nodes.attrs, node_offset)
+            self._collect_attrs(link_attrs, edges.attrs, link_offset)
+            for name, value in edges.shared_attrs.items():
+                rows, values = link_attrs.setdefault(name, ([], []))
+                rows.append(np.arange(link_offset, link_offset + len(edges)))
+                values.extend([value] * len(edges))
+
+            node_offset += len(nodes)
+            link_offset += len(edges)
+
+        def column(parts: list[np.ndarray], dtype: str) -> str:
+            return _base64(np.concatenate(parts) if parts else np.empty(0), dtype)
+
+        payload: dict[str, Any] = {
+            "version": self.VERSION,
+            "strings": strings,
+            "nodes": {
+                "count": node_offset,
+                "id": column(node_parts["id"], "<i4"),
+                "x": column(node_parts["x"], "<f4"),
+                "y": column(node_parts["y"], "<f4"),
+                "name": column(node_parts["name"], "<i4"),
+                "category": column(node_parts["category"], "<i4"),
+                "attrs": self._encode_attrs(node_attrs),
+            },
+            "links": {
+                "count": link_offset,
+                "source": column(link_parts["source"], "<u4"),
+                "target": column(link_parts["target"], "<u4"),
+                "label": column(link_parts["label"], "<i4"),
+                "value": column(link_parts["value"], "<f4"),
+                "attrs": self._encode_attrs(link_attrs),
+            },
+        }
+        if scene.title:
+            payload["title"] = scene.title
+        return payload
+
+    @staticmethod
+    def _collect_attrs(
+        target: dict[str, tuple[list[np.ndarray], list[Any]]],
+        attrs: dict[str, dict[int, Any]],
+        offset: int,
+    ) -> None:
+        """Append one layer's sparse attribute columns with shifted rows."""
+        for name, column in attrs.items():
+            rows, values = target.setdefault(name, ([], []))
+            rows.append(np.fromiter(column.keys(), dtype=np.int64, count=len(column)) + offset)
+            values.extend(column.values())
+
+    @staticmethod
+    def _encode_attrs(
+        attrs: dict[str, tuple[list[np.ndarray], list[Any]]],
+    ) -> dict[str, dict[str, Any]]:
+        """Encode sparse attribute columns as row arrays plus JSON values."""
+        return {
+            name: {"rows": _base64(np.concatenate(rows), "<u4"), "values": values}
+            for name, (rows, values) in attrs.items()
+        }
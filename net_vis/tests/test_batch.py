@@ -0,0 +1,167 @@
+"""Tests for batch HTML export."""
+
+import base64
+import functools
+import gzip
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+# Skip all tests if networkx is not installed
+pytest.importorskip("networkx")
+
+import networkx as nx
+
+from net_vis import ExportResult, Plotter, export_dashboard, export_many
+from net_vis.html_exporter import HTMLExporter
+from net_vis.models import GraphLayer, Node, Scene
+
+
+def _broken_graph():
+    raise RuntimeError("no data for customer")
+
+
+@pytest.fixture
+def items() -> dict:
+    """Create one batch item of every supported kind plus a failing one."""
+    plotter = Plotter(title="From plotter")
+    plotter.add_networkx(nx.path_graph(3), layout="circular")
+    return {
+        "plotter": plotter,
+        "scene": Scene(layers=[GraphLayer(layer_id="a", nodes=[Node(id="1")])]),
+        "graph": nx.cycle_graph(4),
+        "factory": functools.partial(nx.star_graph, 3),
+        "broken": _broken_graph,
+    }
+
+
+class TestExportMany:
+    """Tests for export_many."""
+
+    @pytest.mark.parametrize(("executor", "workers"), [("thread", 2), ("thread", 1)])
+    def test_exports_items_and_reports_failures(
+        self, items: dict, tmp_path: Path, executor: str, workers: int
+    ):
+        """Test every item is exported or reported, in input order."""
+        seen: list[str] = []
+
+        results = export_many(
+            items,
+            tmp_path / "out",
+            workers=workers,
+            executor=executor,
+            on_result=lambda result: seen.append(result.name),
+        )
+
+        assert [result.name for result in results] == list(items)
+        assert sorted(seen) == sorted(items)
+        assert all(result.seconds >= 0 for result in results)
+        for result in results[:-1]:
+            assert result.ok
+            assert result.path == tmp_path / "out" / f"{result.name}.html"
+            assert "<!DOCTYPE html>" in result.path.read_text(encoding="utf-8")
+
+        failed = results[-1]
+        assert not failed.ok
+        assert failed.path is None
+        assert failed.error == "RuntimeError: no data for customer"
+        assert "_broken_graph" in failed.traceback
+
+    def test_process_pool(self, tmp_path: Path):
+        """Test picklable items are laid out and exported in worker processes."""
+        items = [(f"star_{n}", functools.partial(nx.star_graph, n)) for n in (2, 3)]
+
+        results = export_many(items, tmp_path, workers=2, compress=True)
+
+        assert [result.ok for result in results] == [True, True]
+        assert (tmp_path / "star_3.html").exists()
+
+    def test_linked_bundle_written_once(self, tmp_path: Path):
+        """Test linked exports share one bundle file."""
+        items = {f"g{i}": nx.path_graph(i + 2) for i in range(4)}
+
+        results = export_many(items, tmp_path, workers=2, executor="thread", bundle="linked")
+
+        assert all(result.ok for result in results)
+        assert len(list(tmp_path.glob("netvis-standalone.*.min.js"))) == 1
+
+    def test_invalid_arguments_raise(self, tmp_path: Path):
+        """Test duplicate names and unknown executors are rejected up front."""
+        with pytest.raises(ValueError, match="Duplicate item names"):
+            export_many([("a", nx.path_graph(2)), ("a", nx.path_graph(3))], tmp_path)
+        with pytest.raises(ValueError, match="executor"):
+            export_many({}, tmp_path, executor="cluster")
+
+    @pytest.mark.parametrize("name", ["../escape", "sub/graph", "..", ""])
+    def test_path_like_names_rejected(self, tmp_path: Path, name: str):
+        """Test names that would write outside out_dir are rejected before exporting."""
+        out_dir = tmp_path / "out"
+
+        with pytest.raises(ValueError, match="plain file names"):
+            export_many({"ok": nx.path_graph(2), name: nx.path_graph(2)}, out_dir)
+
+        assert not out_dir.exists()
+        assert list(tmp_path.rglob("*.html")) == []
+
+    def test_unsupported_item_is_a_failure(self, tmp_path: Path):
+        """Test an item of the wrong type fails alone."""
+        (result,) = export_many({"bad": 42}, tmp_path)
+
+        assert isinstance(result, ExportResult)
+        assert result.error is not None and "TypeError" in result.error
+
+
+def _data_blocks(html: str) -> list[tuple[str, str]]:
+    """Extract (encoding, text) of each inert graph data block."""
+    return re.findall(
+        r'<script type="application/json" id="netvis-data-\d+" data-encoding="(\w+)">(.*?)</script>',
+        html,
+    )
+
+
+class TestExportDashboard:
+    """Tests for export_dashboard."""
+
+    def test_panels_share_one_bundle(self, items: dict):
+        """Test every scene gets a panel with its data and the bundle is inlined once."""
+        del items["broken"]
+
+        html = export_dashboard(items, title="Customers")
+
+        bundle = HTMLExporter.shared()._js_bundle
+        assert html.count(bundle) == 1
+        assert html.count('class="netvis-graph" data-graph=') == len(items)
+        blocks = _data_blocks(html)
+        assert len(blocks) == len(items)
+        assert json.loads(blocks[0][1]) == items["plotter"]._scene.to_dict()
+        assert '<h1 class="netvis-title" id="netvis-title">Customers</h1>' in html
+
+    def test_data_cannot_close_its_script_block(self):
+        """Test '</script>' inside labels is escaped in the data block."""
+        scene = Scene(layers=[GraphLayer(layer_id="a", nodes=[Node(id="</script><b>")])])
+
+        html = export_dashboard({"<i>x</i>": scene})
+
+        ((_, text),) = _data_blocks(html)
+        assert json.loads(text)["nodes"][0]["id"] == "</script><b>"
+        assert "&lt;i&gt;x&lt;/i&gt;" in html
+
+    def test_compressed_file_export(self, tmp_path: Path):
+        """Test compressed panels round-trip and files match the string export."""
+        graphs = {f"g{i}": nx.path_graph(i + 2) for i in range(3)}
+        plotters = {}
+        for name, graph in graphs.items():
+            plotters[name] = Plotter()
+            plotters[name].add_networkx(graph, layout="circular")
+
+        path = export_dashboard(plotters, tmp_path / "dash", compress=True)
+
+        assert path == tmp_path / "dash.html"
+        html = path.read_text(encoding="utf-8")
+        assert html == export_dashboard(plotters, compress=True)
+        for (encoding, text), plotter in zip(_data_blocks(html), plotters.values(), strict=True):
+            assert encoding == "gzip"
+            data = json.loads(gzip.decompress(base64.b64decode(json.loads(text))))
+            assert data == plotter._scene.to_dict()
@@ -0,0 +1,138 @@
+"""Tests for vectorised color scales."""
+
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+# Skip all tests if networkx is not installed
+pytest.importorskip("networkx")
+
+import networkx as nx
+
+from net_vis import ColorMap, Plotter
+from net_vis.adapters import NetworkXAdapter
+from net_vis.adapters.colors import (
+    CATEGORY10,
+    category_index,
+    detect_color_type,
+    gradient_table,
+)
+from net_vis.models import StringTable
+
+
+class TestColorScales:
+    """Tests for type detection, gradient tables and category hashing."""
+
+    def test_detect_color_type_majority_rule(self):
+        """Test columns are numeric when most non-None values are numbers."""
+        assert detect_color_type(np.arange(3)) == "numeric"
+        assert detect_color_type([1, 2.5, None, "x"]) == "numeric"
+        assert detect_color_type(["a", "b", 1]) == "categorical"
+        assert detect_color_type([True, False]) == "categorical"
+        assert detect_color_type([None, None]) == "categorical"
+
+    def test_gradient_table_endpoints(self):
+        """Test the lookup table runs from the first to the last stop."""
+        table = gradient_table(("#0000ff", "#ff0000"), 256)
+
+        assert len(table) == 256
+        assert table[0] == "#0000ff"
+        assert table[-1] == "#ff0000"
+        assert gradient_table(("#000000", "#ffffff", "#000000"), 3)[1] == "#ffffff"
+
+    def test_invalid_color_map_options_raise(self):
+        """Test bad kinds and gradient stops are rejected up front."""
+        with pytest.raises(ValueError, match="kind"):
+            ColorMap("score", kind="diverging")
+        with pytest.raises(ValueError, match="rrggbb"):
+            ColorMap("score", gradient=("blue", "red"))
+
+    def test_category_hash_is_stable_across_processes(self):
+        """Test category colors do not depend on the hash seed."""
+        script = (
+            "from net_vis.adapters.colors import category_index;"
+            "print(category_index('community-7', 10))"
+        )
+        results = {
+            subprocess.run(
+                [sys.executable, "-c", script],
+                capture_output=True,
+                text=True,
+                check=True,
+                env={"PYTHONHASHSEED": seed, "PYTHONPATH": ":".join(sys.path)},
+            ).stdout.strip()
+            for seed in ("1", "2")
+        }
+
+        assert results == {str(category_index("community-7", 10))}
+
+
+class TestColorMap:
+    """Tests for mapping whole columns to interned colors."""
+
+    def test_numeric_values_span_gradient(self):
+        """Test min/max map to the gradient ends and None stays uncolored."""
+        strings = StringTable()
+        ids = ColorMap("score").intern([0.0, 5.0, 10.0, None], strings)
+
+        colors = [strings.strings[i] if i >= 0 else None for i in ids.tolist()]
+        assert colors[0] == "#0000ff"
+        assert colors[2] == "#ff0000"
+        assert colors[1] not in ("#0000ff", "#ff0000")
+        assert colors[3] is None
+
+    def test_fixed_range_clips_values(self):
+        """Test vmin/vmax override the column range and clip outliers."""
+        strings = StringTable()
+        ids = ColorMap("score", vmin=0, vmax=1).intern(np.array([-3.0, 0.5, 9.0]), strings)
+
+        colors = [strings.strings[i] for i in ids.tolist()]
+        assert colors[0] == "#0000ff"
+        assert colors[2] == "#ff0000"
+
+    def test_categorical_values_use_palette(self):
+        """Test equal categories share one palette color."""
+        strings = StringTable()
+        ids = ColorMap("group", kind="categorical").intern(["a", "b", "a", None], strings)
+
+        assert ids[0] == ids[2]
+        assert ids[3] == -1
+        assert strings.strings[ids[0]] == CATEGORY10[category_index("a", len(CATEGORY10))]
+
+
+class TestNodeColorIntegration:
+    """Tests for color scales reached through node_color."""
+
+    def test_numeric_attribute_uses_color_scale(self):
+        """Test a numeric attribute name is mapped to hex colors."""
+        G = nx.path_graph(3)
+        for node in G:
+            G.nodes[node]["score"] = float(node)
+
+        layer = NetworkXAdapter.convert_graph(G, node_color="score")
+
+        assert [node.color for node in layer.nodes] == ["#0000ff", "#80007f", "#ff0000"]
+
+    def test_color_names_pass_through(self):
+        """Test string color values are still used as is."""
+        G = nx.Graph()
+        G.add_node(1, color="red")
+
+        layer = NetworkXAdapter.convert_graph(G, node_color="color")
+
+        assert layer.nodes[0].color == "red"
+
+    def test_plotter_accepts_color_map(self):
+        """Test Plotter.add_networkx maps categories through a ColorMap."""
+        G = nx.path_graph(4)
+        for node in G:
+            G.nodes[node]["group"] = "a" if node < 2 else "b"
+        plotter = Plotter()
+
+        plotter.add_networkx(G, node_color=ColorMap("group", kind="categorical"))
+
+        colors = [node.color for node in plotter._scene.layers[0].nodes]
+        assert colors[0] == colors[1] != colors[2] == colors[3]
+        assert set(colors) <= set(CATEGORY10)
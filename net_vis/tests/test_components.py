@@ -0,0 +1,119 @@
+"""Tests for component-wise layout and packing."""
+
+import numpy as np
+import pytest
+
+# Skip all tests if networkx is not installed
+pytest.importorskip("networkx")
+
+import networkx as nx
+
+from net_vis import Plotter
+from net_vis.adapters import LayoutCache, NetworkXAdapter
+from net_vis.adapters import components as components_module
+from net_vis.adapters.components import _shelf_pack, layout_components
+
+
+@pytest.fixture
+def forest() -> nx.Graph:
+    """Create a graph of several trees, a pair and isolated nodes."""
+    parts = [nx.random_labeled_tree(n, seed=n) for n in (30, 12, 8, 5)]
+    parts += [nx.path_graph(2), nx.empty_graph(3)]
+    return nx.disjoint_union_all(parts)
+
+
+def _bounding_boxes(graph: nx.Graph, coords: np.ndarray) -> list[np.ndarray]:
+    """Return the (min, max) corners of each connected component."""
+    index = {node: i for i, node in enumerate(graph)}
+    boxes = []
+    for component in nx.connected_components(graph):
+        points = coords[[index[node] for node in component]]
+        boxes.append(np.array([points.min(axis=0), points.max(axis=0)]))
+    return boxes
+
+
+class TestShelfPack:
+    """Tests for shelf packing of component boxes."""
+
+    def test_boxes_do_not_overlap(self):
+        """Test packed boxes are disjoint and roughly square overall."""
+        rng = np.random.default_rng(0)
+        sizes = rng.random((40, 2)) * 5
+        offsets = _shelf_pack(sizes, padding=0.5)
+
+        for i in range(40):
+            for j in range(i + 1, 40):
+                separated = (offsets[i] + sizes[i] <= offsets[j]) | (
+                    offsets[j] + sizes[j] <= offsets[i]
+                )
+                assert separated.any()
+
+        extent = (offsets + sizes).max(axis=0)
+        assert extent.max() / extent.min() < 3
+
+
+class TestLayoutComponents:
+    """Tests for layout_components."""
+
+    def test_components_are_packed_without_overlap(self, forest: nx.Graph):
+        """Test component bounding boxes are disjoint and within [-1, 1]."""
+        coords = layout_components(forest, "spring", {"seed": 0}, workers=1)
+
+        assert coords.shape == (forest.number_of_nodes(), 2)
+        assert np.abs(coords).max() == pytest.approx(1.0)
+        boxes = _bounding_boxes(forest, coords)
+        for i, first in enumerate(boxes):
+            for second in boxes[i + 1 :]:
+                assert (first[1] < second[0]).any() or (second[1] < first[0]).any()
+
+    def test_parallel_matches_in_process(self, forest: nx.Graph, monkeypatch):
+        """Test the process pool produces the same positions as serial layout."""
+        serial = layout_components(forest, "spring", {"seed": 0}, workers=1)
+
+        monkeypatch.setattr(components_module, "_MIN_PARALLEL_NODES", 0)
+        parallel = layout_components(forest, "spring", {"seed": 0}, workers=2)
+
+        np.testing.assert_allclose(parallel, serial)
+
+    def test_unpicklable_layout_falls_back_in_process(self, forest: nx.Graph, monkeypatch):
+        """Test layouts that cannot be sent to workers run in-process."""
+        monkeypatch.setattr(components_module, "_MIN_PARALLEL_NODES", 0)
+
+        with pytest.warns(UserWarning, match="Parallel component layout failed"):
+            coords = layout_components(forest, lambda g: nx.circular_layout(g), workers=2)
+
+        assert np.isfinite(coords).all()
+
+    def test_directed_graphs_use_weak_components(self):
+        """Test directed graphs are split into weakly connected components."""
+        G = nx.DiGraph([(0, 1), (2, 1), (3, 4)])
+
+        coords = layout_components(G, "circular", workers=1)
+
+        boxes = _bounding_boxes(G.to_undirected(), coords)
+        assert len(boxes) == 2
+
+
+class TestComponentLayoutIntegration:
+    """Tests for the split_components option."""
+
+    def test_plotter_option(self, forest: nx.Graph):
+        """Test Plotter.add_networkx lays out components separately."""
+        plotter = Plotter()
+        plotter.add_networkx(forest, layout="kamada_kawai", split_components=True, workers=1)
+
+        layer = plotter._scene.layers[0]
+        coords = np.array([[node.x, node.y] for node in layer.nodes])
+        assert len(_bounding_boxes(forest, coords)) == 8
+        assert np.isfinite(coords).all()
+
+    def test_cached_separately_from_global_layout(self, forest: nx.Graph):
+        """Test packed layouts do not collide with the global layout cache entry."""
+        cache = LayoutCache()
+
+        NetworkXAdapter._compute_layout(forest, "spring", {"seed": 1}, cache=cache)
+        NetworkXAdapter._compute_layout(
+            forest, "spring", {"seed": 1}, cache=cache, split_components=True, workers=1
+        )
+
+        assert len(cache) == 2
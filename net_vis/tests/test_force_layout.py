@@ -0,0 +1,237 @@
+"""Tests for the NumPy force-directed layouts."""
+
+import numpy as np
+import pytest
+
+# Skip all tests if networkx is not installed
+pytest.importorskip("networkx")
+
+import networkx as nx
+
+from net_vis.adapters import NetworkXAdapter
+from net_vis.adapters.force_layout import (
+    _barnes_hut_repulsion,
+    _coarsen,
+    _component_labels,
+    _default_iterations,
+    _far_repulsion,
+    _graph_arrays,
+    _grid_cells,
+    _merge_edges,
+    _near_repulsion,
+    _QuadTree,
+    barnes_hut_layout,
+    multilevel_layout,
+)
+
+
+def _exact_repulsion(positions: np.ndarray, mass: np.ndarray) -> np.ndarray:
+    """Compute all-pairs repulsion (force mass / d) directly."""
+    delta = positions[:, None, :] - positions[None, :, :]
+    dist2 = np.einsum("ijk,ijk->ij", delta, delta)
+    np.fill_diagonal(dist2, np.inf)
+    return (delta * (mass[None, :] / dist2)[..., None]).sum(axis=1)
+
+
+class TestRepulsion:
+    """Tests for the grid-based repulsion approximation."""
+
+    def test_matches_exact_forces(self):
+        """Test near + far field approximates all-pairs repulsion closely."""
+        rng = np.random.default_rng(0)
+        positions = rng.random((400, 2)) * 20
+        mass = rng.random(400) + 0.5
+
+        cells, levels = _grid_cells(positions)
+        approx = _near_repulsion(positions, mass, cells, 2**levels, 1.0)
+        approx += _far_repulsion(positions, mass, cells, levels, 1.0)
+        exact = _exact_repulsion(positions, mass)
+
+        error = np.linalg.norm(approx - exact, axis=1) / np.linalg.norm(exact, axis=1)
+        assert np.median(error) < 0.1
+
+
+class TestBarnesHut:
+    """Tests for the Barnes-Hut quadtree repulsion."""
+
+    def test_quadtree_cells_cover_bodies(self):
+        """Test the root holds all mass and children partition their parent."""
+        rng = np.random.default_rng(1)
+        positions = rng.random((50, 2))
+        tree = _QuadTree.build(positions, np.ones(50))
+
+        assert tree.mass[0] == 50
+        np.testing.assert_allclose(tree.centroid[0], positions.mean(axis=0))
+        internal = np.flatnonzero(~tree.leaf)
+        for cell in internal:
+            children = range(tree.child_start[cell], tree.child_end[cell])
+            assert sum(tree.mass[child] for child in children) == tree.mass[cell]
+
+    def test_theta_zero_is_exact(self):
+        """Test theta=0 opens every cell and reproduces exact forces."""
+        rng = np.random.default_rng(2)
+        positions = rng.random((200, 2)) * 10
+        mass = rng.random(200) + 0.5
+
+        np.testing.assert_allclose(
+            _barnes_hut_repulsion(positions, mass, 1.0, theta=0.0),
+            _exact_repulsion(positions, mass),
+        )
+
+    def test_approximation_error_is_small(self):
+        """Test the default opening angle stays close to exact forces."""
+        rng = np.random.default_rng(3)
+        positions = rng.random((1000, 2)) * 30
+        mass = np.ones(1000)
+
+        approx = _barnes_hut_repulsion(positions, mass, 1.0, theta=0.5)
+        exact = _exact_repulsion(positions, mass)
+
+        error = np.linalg.norm(approx - exact, axis=1) / np.linalg.norm(exact, axis=1)
+        assert np.median(error) < 0.01
+
+    def test_coincident_bodies(self):
+        """Test bodies at the same position exert no force on each other."""
+        displacement = _barnes_hut_repulsion(np.zeros((4, 2)), np.ones(4), 1.0)
+
+        assert np.array_equal(displacement, np.zeros((4, 2)))
+
+    def test_layout_selectable_by_name(self):
+        """Test layout='barnes_hut' forwards theta/iterations and is seeded."""
+        G = nx.karate_club_graph()
+        options = {"seed": 4, "theta": 0.8, "iterations": 20}
+
+        first = NetworkXAdapter.convert_graph(
+            G, layout="barnes_hut", layout_options=options, layout_cache=None
+        )
+        second = NetworkXAdapter.convert_graph(
+            G, layout="barnes_hut", layout_options=options, layout_cache=None
+        )
+
+        assert [(n.x, n.y) for n in first.nodes] == [(n.x, n.y) for n in second.nodes]
+        assert all(np.isfinite([node.x, node.y]).all() for node in first.nodes)
+
+    def test_invalid_theta_raises(self):
+        """Test a negative opening angle is rejected."""
+        with pytest.raises(ValueError, match="theta"):
+            barnes_hut_layout(nx.path_graph(3), theta=-1)
+
+    def test_default_iterations_scale_with_size(self):
+        """Test large graphs run fewer iterations by default."""
+        assert _default_iterations(1_000) == 50
+        assert _default_iterations(10_000) == 50
+        assert _default_iterations(20_000) == 25
+        assert _default_iterations(200_000) == 10
+
+
+class TestCoarsening:
+    """Tests for graph coarsening."""
+
+    def test_merge_edges_sums_duplicates_and_drops_loops(self):
+        """Test reverse/parallel edges merge and self-loops are removed."""
+        source, target, weights = _merge_edges(
+            np.array([0, 1, 2, 2]), np.array([1, 0, 2, 0]), np.array([1.0, 2.0, 5.0, 1.0]), 3
+        )
+
+        assert source.tolist() == [0, 0]
+        assert target.tolist() == [1, 2]
+        assert weights.tolist() == [3.0, 1.0]
+
+    def test_star_collapses_in_one_level(self):
+        """Test unmatched leaves join the hub's cluster instead of stalling."""
+        source = np.zeros(20, dtype=np.int64)
+        target = np.arange(1, 21)
+
+        cluster, size = _coarsen(21, source, target, np.ones(20), np.random.default_rng(0))
+
+        assert size == 1
+        assert (cluster == 0).all()
+
+
+class TestMultilevelLayout:
+    """Tests for multilevel_layout and its adapter integration."""
+
+    def test_positions_are_finite_and_scaled(self):
+        """Test every node gets a finite position within [-scale, scale]."""
+        G = nx.grid_2d_graph(20, 20)
+
+        positions = multilevel_layout(G, seed=1, scale=2.0)
+
+        coords = np.array([positions[node] for node in G])
+        assert len(positions) == 400
+        assert np.isfinite(coords).all()
+        assert np.abs(coords).max() == pytest.approx(2.0)
+
+    def test_seed_is_deterministic(self):
+        """Test the same seed reproduces the same layout."""
+        G = nx.barabasi_albert_graph(300, 2, seed=3)
+
+        first = multilevel_layout(G, seed=7)
+        second = multilevel_layout(G, seed=7)
+
+        assert all(np.array_equal(first[node], second[node]) for node in G)
+
+    def test_neighbours_are_closer_than_average(self):
+        """Test the layout reflects graph structure."""
+        G = nx.grid_2d_graph(15, 15)
+        positions = multilevel_layout(G, seed=0)
+        coords = np.array([positions[node] for node in G])
+        index = {node: i for i, node in enumerate(G)}
+        edges = np.array([(index[u], index[v]) for u, v in G.edges()])
+
+        edge_length = np.linalg.norm(coords[edges[:, 0]] - coords[edges[:, 1]], axis=1).mean()
+        spread = np.linalg.norm(coords - coords.mean(axis=0), axis=1).mean()
+
+        assert edge_length < spread / 5
+
+    def test_component_labels_match_networkx(self):
+        """Test vectorised component labelling agrees with NetworkX."""
+        G = nx.disjoint_union_all([nx.path_graph(30), nx.empty_graph(5), nx.star_graph(6)])
+        G = nx.relabel_nodes(G, dict(zip(G, np.random.default_rng(0).permutation(len(G)))))
+        nodes, source, target, _ = _graph_arrays(G)
+
+        labels, count = _component_labels(len(nodes), source, target)
+
+        assert count == nx.number_connected_components(G)
+        for component in nx.connected_components(G):
+            assert len({labels[nodes.index(node)] for node in component}) == 1
+
+    def test_components_are_packed_apart(self):
+        """Test disconnected parts do not drift apart or overlap."""
+        G = nx.disjoint_union_all(
+            [nx.barabasi_albert_graph(200, 2, seed=0), nx.cycle_graph(8), nx.empty_graph(20)]
+        )
+
+        positions = multilevel_layout(G, seed=0)
+
+        boxes = []
+        for component in nx.connected_components(G):
+            coords = np.array([positions[node] for node in component])
+            boxes.append((coords.min(axis=0), coords.max(axis=0)))
+        for i, (low, high) in enumerate(boxes):
+            for other_low, other_high in boxes[i + 1 :]:
+                assert (high < other_low).any() or (other_high < low).any()
+        # The large component fills a sizeable share of the layout
+        low, high = boxes[0]
+        assert (high - low).max() > 0.5
+
+    @pytest.mark.parametrize(
+        "graph",
+        [nx.empty_graph(0), nx.empty_graph(3), nx.MultiDiGraph([(0, 1), (1, 0), (1, 1)])],
+    )
+    def test_degenerate_graphs(self, graph):
+        """Test empty, edgeless and self-loop multigraphs are laid out."""
+        positions = multilevel_layout(graph, seed=0)
+
+        assert set(positions) == set(graph)
+
+    def test_selectable_by_layout_name(self):
+        """Test layout='multilevel' goes through the adapter dispatch."""
+        G = nx.cycle_graph(80)
+
+        layer = NetworkXAdapter.convert_graph(
+            G, layout="multilevel", layout_options={"seed": 0}, layout_cache=None
+        )
+
+        assert len(layer.nodes) == 80
+        assert all(np.isfinite([node.x, node.y]).all() for node in layer.nodes)
@@ -1,12 +1,20 @@
 """Tests for HTML export functionality."""
 
+import base64
+import gzip
+import hashlib
+import io
+import json
+import os
+import re
 import sys
 from pathlib import Path
+from string import Template
 
 import pytest
 
 from net_vis import Plotter
-from net_vis.html_exporter import HTMLExporter
+from net_vis.html_exporter import ExportOptions, HTMLExporter
 from net_vis.models import Edge, GraphLayer, Node, Scene
 
 
@@ -317,6 +325,247 @@ class TestExportWithDownload:
         assert result.name == "custom_name.html"
 
 
+class TestSharedExporter:
+    """Tests for the process-wide exporter and lazy resource loading."""
+
+    def test_shared_returns_one_instance(self) -> None:
+        """Verify shared() is a process-wide singleton."""
+        assert HTMLExporter.shared() is HTMLExporter.shared()
+
+    def test_resources_load_lazily(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify resources are read on first use, then memoised."""
+        calls = []
+        load = HTMLExporter._load_js_bundle
+        monkeypatch.setattr(
+            HTMLExporter, "_load_js_bundle", lambda self: calls.append(1) or load(self)
+        )
+        exporter = HTMLExporter()
+
+        assert calls == []
+        assert exporter.prewarm() is exporter
+        exporter.export(Scene())
+        assert calls == [1]
+
+    def test_concurrent_exports_load_once(
+        self, monkeypatch: pytest.MonkeyPatch, sample_scene: Scene
+    ) -> None:
+        """Verify threads exporting at once share a single resource load."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        calls = []
+        load = HTMLExporter._load_template
+        monkeypatch.setattr(
+            HTMLExporter, "_load_template", lambda self: calls.append(1) or load(self)
+        )
+        exporter = HTMLExporter()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            pages = list(pool.map(lambda _: exporter.export(sample_scene), range(32)))
+
+        assert calls == [1]
+        assert len(set(pages)) == 1
+
+    def test_plotter_uses_shared_exporter(
+        self, monkeypatch: pytest.MonkeyPatch, sample_plotter: Plotter
+    ) -> None:
+        """Verify export_html does not construct a new exporter per call."""
+        exporter = HTMLExporter()
+        monkeypatch.setattr(HTMLExporter, "_shared", exporter)
+        monkeypatch.setattr(HTMLExporter, "__init__", None)
+
+        assert "<!DOCTYPE html>" in sample_plotter.export_html()
+
+
+class TestCompressedExport:
+    """Tests for gzip-compressed embedded data."""
+
+    @staticmethod
+    def _embedded_data(html: str) -> str:
+        match = re.search(r"var graphData = (.*);", html)
+        assert match is not None
+        return match.group(1)
+
+    def test_compressed_data_round_trips(self, exporter: HTMLExporter, sample_scene: Scene) -> None:
+        """Verify the embedded literal decompresses to the scene JSON."""
+        html = exporter.export(sample_scene, ExportOptions(compress=True))
+
+        encoded = json.loads(self._embedded_data(html))
+        data = json.loads(gzip.decompress(base64.b64decode(encoded)))
+        assert data == sample_scene.to_dict()
+        assert "'gzip' === 'gzip'" in html
+        assert "DecompressionStream" in html
+
+    def test_uncompressed_export_embeds_json(
+        self, exporter: HTMLExporter, sample_scene: Scene
+    ) -> None:
+        """Verify the default still embeds a plain JSON literal."""
+        html = exporter.export(sample_scene)
+
+        assert json.loads(self._embedded_data(html)) == sample_scene.to_dict()
+        assert "'json' === 'gzip'" in html
+
+    def test_compressed_export_is_deterministic_and_smaller(self) -> None:
+        """Verify compression shrinks large exports reproducibly."""
+        nx = pytest.importorskip("networkx")
+        plotter = Plotter()
+        plotter.add_networkx(nx.barabasi_albert_graph(2000, 3, seed=1), layout="random")
+
+        plain = self._embedded_data(plotter.export_html())
+        compressed = plotter.export_html(compress=True)
+
+        assert len(self._embedded_data(compressed)) * 2 < len(plain)
+        assert plotter.export_html(compress=True) == compressed
+
+
+class TestLinkedBundle:
+    """Tests for referencing a shared JS bundle instead of inlining it."""
+
+    def test_write_bundle_is_content_hashed(self, exporter: HTMLExporter, tmp_path: Path) -> None:
+        """Verify the asset name and integrity hash match the written bytes."""
+        path = exporter.write_bundle(tmp_path / "assets")
+        data = path.read_bytes()
+
+        assert path.name == f"netvis-standalone.{hashlib.sha256(data).hexdigest()[:12]}.min.js"
+        digest = base64.b64encode(hashlib.sha384(data).digest()).decode("ascii")
+        assert exporter.bundle_integrity() == f"sha384-{digest}"
+        assert exporter.write_bundle(tmp_path / "assets") == path
+        assert [p.name for p in path.parent.iterdir()] == [path.name]
+
+    def test_bundle_src_emits_script_reference(
+        self, exporter: HTMLExporter, sample_scene: Scene
+    ) -> None:
+        """Verify a bundle_src replaces the inline bundle with <script src>."""
+        html = exporter.export(sample_scene, ExportOptions(bundle_src="js/netvis.js"))
+
+        assert exporter._js_bundle not in html
+        assert (
+            f'<script src="js/netvis.js" integrity="{exporter.bundle_integrity()}" '
+            'crossorigin="anonymous"></script>'
+        ) in html
+
+        plain = exporter.export(
+            sample_scene, ExportOptions(bundle_src="netvis.js", bundle_integrity=False)
+        )
+        assert '<script src="netvis.js"></script>' in plain
+
+    def test_plotter_linked_exports_share_one_asset(
+        self, sample_plotter: Plotter, tmp_path: Path
+    ) -> None:
+        """Verify linked exports write the bundle once beside the files."""
+        first = sample_plotter.export_html(tmp_path / "a.html", bundle="linked")
+        second = sample_plotter.export_html(tmp_path / "b.html", bundle="linked")
+
+        assets = list(tmp_path.glob("netvis-standalone.*.min.js"))
+        assert len(assets) == 1
+        for path in (first, second):
+            html = path.read_text(encoding="utf-8")
+            assert f'<script src="{assets[0].name}"></script>' in html
+            assert len(html) < 20_000
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="chmod doesn't work the same on Windows")
+    def test_write_bundle_uses_default_file_mode(
+        self, exporter: HTMLExporter, tmp_path: Path
+    ) -> None:
+        """Verify the bundle is readable like any new file, not 0600."""
+        umask = os.umask(0o022)
+        try:
+            path = exporter.write_bundle(tmp_path)
+        finally:
+            os.umask(umask)
+
+        assert path.stat().st_mode & 0o777 == 0o644
+
+    def test_plotter_bundle_integrity(self, sample_plotter: Plotter, tmp_path: Path) -> None:
+        """Verify SRI is added for hosted bundles, or when requested."""
+        integrity = HTMLExporter.shared().bundle_integrity()
+
+        hosted = sample_plotter.export_html(bundle_url="https://example.org/netvis.js")
+        assert f'integrity="{integrity}" crossorigin="anonymous"' in hosted
+        plain = sample_plotter.export_html(
+            bundle_url="https://example.org/netvis.js", bundle_integrity=False
+        )
+        assert "integrity=" not in plain
+
+        path = sample_plotter.export_html(
+            tmp_path / "a.html", bundle="linked", bundle_integrity=True
+        )
+        assert f'integrity="{integrity}"' in path.read_text(encoding="utf-8")
+
+    def test_plotter_bundle_url_and_validation(self, sample_plotter: Plotter) -> None:
+        """Verify hosted bundle URLs and invalid bundle modes."""
+        html = sample_plotter.export_html(bundle_url="https://example.org/netvis.js")
+        assert 'src="https://example.org/netvis.js"' in html
+
+        with pytest.raises(ValueError, match="needs a filepath"):
+            sample_plotter.export_html(bundle="linked")
+        with pytest.raises(ValueError, match="bundle must be one of"):
+            sample_plotter.export_html(bundle="cdn")
+
+
+class TestStreamingWriter:
+    """Tests for writing HTML without building the whole document."""
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_write_matches_export(
+        self, exporter: HTMLExporter, sample_scene: Scene, compress: bool
+    ) -> None:
+        """Verify the streamed document equals the string export."""
+        options = ExportOptions(compress=compress, description="Streamed")
+        fp = io.StringIO()
+
+        exporter.write(sample_scene, fp, options)
+
+        assert fp.getvalue() == exporter.export(sample_scene, options)
+
+    def test_compressed_chunks_round_trip(self, exporter: HTMLExporter) -> None:
+        """Verify base64 stays aligned when compressing many small chunks."""
+        chunks = [f'{{"id": "{i}"}},' for i in range(5000)]
+
+        literal = "".join(exporter._iter_compressed(chunks))
+
+        data = gzip.decompress(base64.b64decode(json.loads(literal)))
+        assert data.decode("utf-8") == "".join(chunks)
+
+    def test_template_escapes_and_braces(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify $$ and ${name} placeholders behave as in Template.substitute."""
+        monkeypatch.setattr(
+            HTMLExporter, "_load_template", lambda self: Template("$$5 <${title}>$data_encoding")
+        )
+
+        assert HTMLExporter().export(Scene(title="T")) == "$5 <T>json"
+
+    def test_template_segments_cached_per_template(
+        self, monkeypatch: pytest.MonkeyPatch, sample_scene: Scene
+    ) -> None:
+        """Verify each template is loaded and split once across exports."""
+        calls: list[str] = []
+        load = HTMLExporter._load_template
+        monkeypatch.setattr(
+            HTMLExporter,
+            "_load_template",
+            lambda self, name="standalone.html": calls.append(name) or load(self, name),
+        )
+        exporter = HTMLExporter()
+
+        for _ in range(3):
+            exporter.export(sample_scene)
+            exporter.export_dashboard([("graph", sample_scene)])
+
+        assert sorted(calls) == ["dashboard.html", "standalone.html"]
+        assert sorted(exporter._segments_cache) == ["dashboard.html", "standalone.html"]
+
+    def test_plotter_streams_to_file(
+        self, monkeypatch: pytest.MonkeyPatch, sample_plotter: Plotter, tmp_path: Path
+    ) -> None:
+        """Verify export_html with a filepath never builds the document string."""
+        expected = sample_plotter.export_html(compress=True)
+        monkeypatch.setattr(HTMLExporter, "export", None)
+
+        path = sample_plotter.export_html(tmp_path / "graph.html", compress=True)
+
+        assert path.read_text(encoding="utf-8") == expected
+
+
 class TestEdgeCases:
     """Tests for edge cases (Phase 7 - T055-T058)."""
 
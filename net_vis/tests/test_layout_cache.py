@@ -0,0 +1,287 @@
+"""Tests for the layout cache."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Skip all tests if networkx is not installed
+pytest.importorskip("networkx")
+
+import networkx as nx
+
+from net_vis import Plotter
+from net_vis.adapters import LayoutCache, NetworkXAdapter
+
+
+class TestLayoutCacheFingerprint:
+    """Tests for structural fingerprints."""
+
+    def test_fingerprint_ignores_styling_attributes(self):
+        """Test node/edge attributes other than weight do not change the key."""
+        G = nx.path_graph(4)
+        key = LayoutCache.fingerprint(G, "spring", {"seed": 1})
+
+        G.nodes[0]["color"] = "red"
+        G.edges[0, 1]["label"] = "x"
+
+        assert LayoutCache.fingerprint(G, "spring", {"seed": 1}) == key
+
+    def test_fingerprint_changes_with_structure_and_options(self):
+        """Test topology, weights, layout name and options change the key."""
+        G = nx.path_graph(4)
+        key = LayoutCache.fingerprint(G, "spring", {"seed": 1})
+
+        assert LayoutCache.fingerprint(G, "spring", {"seed": 2}) != key
+        assert LayoutCache.fingerprint(G, "circular", {"seed": 1}) != key
+
+        H = G.copy()
+        H.add_edge(3, 0)
+        assert LayoutCache.fingerprint(H, "spring", {"seed": 1}) != key
+
+        W = G.copy()
+        W.edges[0, 1]["weight"] = 5.0
+        assert LayoutCache.fingerprint(W, "spring", {"seed": 1}) != key
+
+    def test_fingerprint_hashes_named_weight_attribute(self):
+        """Test the edge attribute named by the 'weight' option is part of the key."""
+        G = nx.path_graph(4)
+        options = {"seed": 1, "weight": "capacity"}
+        key = LayoutCache.fingerprint(G, "spring", options)
+
+        G.edges[0, 1]["capacity"] = 5.0
+        assert LayoutCache.fingerprint(G, "spring", options) != key
+
+        unweighted = LayoutCache.fingerprint(G, "spring", {"seed": 1, "weight": None})
+        G.edges[0, 1]["weight"] = 5.0
+        G.edges[1, 2]["capacity"] = 2.0
+        assert LayoutCache.fingerprint(G, "spring", {"seed": 1, "weight": None}) == unweighted
+
+
+class TestLayoutCacheStorage:
+    """Tests for LRU eviction, disk store and invalidation."""
+
+    def test_lru_eviction_by_entries(self):
+        """Test least recently used entries are evicted first."""
+        cache = LayoutCache(max_entries=2)
+        cache.put("a", np.zeros((1, 2)))
+        cache.put("b", np.zeros((1, 2)))
+        cache.get("a")
+        cache.put("c", np.zeros((1, 2)))
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert len(cache) == 2
+
+    def test_eviction_by_bytes(self):
+        """Test the total in-memory size stays within max_bytes."""
+        cache = LayoutCache(max_bytes=3 * 16 * 10)
+        for key in "abcd":
+            cache.put(key, np.zeros((10, 2)))
+
+        assert len(cache) == 3
+
+    def test_cached_arrays_are_read_only(self):
+        """Test cached coordinates cannot be modified in place."""
+        cache = LayoutCache()
+        cache.put("a", np.zeros((2, 2)))
+
+        with pytest.raises(ValueError):
+            cache.get("a")[0, 0] = 1.0
+
+    def test_disk_store_round_trip(self, tmp_path: Path):
+        """Test layouts persist across cache instances via the directory."""
+        coords = np.arange(6, dtype=float).reshape(3, 2)
+        LayoutCache(directory=tmp_path).put("f" * 40, coords)
+
+        reloaded = LayoutCache(directory=tmp_path).get("f" * 40)
+
+        assert reloaded is not None
+        assert reloaded.tolist() == coords.tolist()
+
+    def test_disk_eviction(self, tmp_path: Path):
+        """Test the disk store keeps at most max_disk_entries files."""
+        cache = LayoutCache(directory=tmp_path, max_disk_entries=2)
+        for char in "abc":
+            cache.put(char * 40, np.zeros((1, 2)))
+
+        assert len(list(tmp_path.glob("*.npy"))) == 2
+
+    def test_invalidate_and_clear(self, tmp_path: Path):
+        """Test explicit invalidation removes memory and disk entries."""
+        G = nx.path_graph(3)
+        cache = LayoutCache(directory=tmp_path)
+        key = LayoutCache.fingerprint(G, "circular")
+        cache.put(key, np.zeros((3, 2)))
+
+        assert cache.invalidate(G, "circular")
+        assert key not in cache
+        assert not cache.invalidate(G, "circular")
+
+        cache.put(key, np.zeros((3, 2)))
+        cache.clear()
+        assert len(cache) == 0
+        assert list(tmp_path.glob("*.npy")) == []
+
+
+class TestLayoutCacheIntegration:
+    """Tests for cache use during layout computation."""
+
+    def test_compute_layout_reuses_cached_positions(self, monkeypatch: pytest.MonkeyPatch):
+        """Test a second layout of the same topology does not recompute."""
+        calls = []
+        original = NetworkXAdapter._apply_spring_layout
+
+        def counting_spring(graph, **options):
+            calls.append(options)
+            return original(graph, **options)
+
+        monkeypatch.setattr(NetworkXAdapter, "_apply_spring_layout", staticmethod(counting_spring))
+        cache = LayoutCache()
+        G = nx.cycle_graph(6)
+
+        first = NetworkXAdapter._compute_layout(G, "spring", {"seed": 3}, cache=cache)
+        G.nodes[0]["color"] = "blue"
+        second = NetworkXAdapter._compute_layout(G, "spring", {"seed": 3}, cache=cache)
+
+        assert len(calls) == 1
+        assert calls[0] == {"seed": 3}
+        np.testing.assert_array_equal(first, second)
+
+    def test_layout_name_case_shares_cache_entry(self):
+        """Test layout names differing only in case hit the same entry."""
+        cache = LayoutCache()
+        G = nx.cycle_graph(6)
+
+        NetworkXAdapter._compute_layout(G, "Circular", {}, cache=cache)
+        NetworkXAdapter._compute_layout(G, "circular", {}, cache=cache)
+
+        assert len(cache) == 1
+        assert LayoutCache.fingerprint(G, "circular", {}) in cache
+
+    def test_unseeded_random_layouts_are_not_reused(self):
+        """Test stochastic layouts without a seed give fresh positions each time."""
+        cache = LayoutCache()
+        G = nx.path_graph(6)
+
+        for layout in ("random", "spring"):
+            first = NetworkXAdapter._compute_layout(G, layout, cache=cache)
+            second = NetworkXAdapter._compute_layout(G, layout, cache=cache)
+            assert not np.array_equal(first, second)
+
+        seeded = NetworkXAdapter._compute_layout(G, "random", {"seed": 1}, cache=cache)
+        np.testing.assert_array_equal(
+            NetworkXAdapter._compute_layout(G, "random", {"seed": 1}, cache=cache), seeded
+        )
+
+    def test_fallback_results_are_not_cached(self):
+        """Test unknown layouts (spring fallback) are not stored."""
+        cache = LayoutCache()
+        G = nx.path_graph(3)
+
+        with pytest.warns(UserWarning, match="Unknown layout"):
+            NetworkXAdapter._compute_layout(G, "no_such_layout", cache=cache)
+
+        assert len(cache) == 0
+
+    def test_plotter_layout_cache_option(self):
+        """Test Plotter.add_networkx uses a given cache and can disable caching."""
+        cache = LayoutCache()
+        G = nx.path_graph(5)
+        plotter = Plotter()
+
+        plotter.add_networkx(G, layout="circular", layout_cache=cache)
+        assert len(cache) == 1
+
+        plotter.add_networkx(G, layout="random", layout_cache=False)
+        assert len(cache) == 1
+
+        layers = plotter._scene.layers
+        assert len(layers) == 2
+
+
+class TestIncrementalLayout:
+    """Tests for warm-started (incremental) layouts."""
+
+    def test_fix_unchanged_keeps_prior_positions(self):
+        """Test nodes from the previous layer keep their positions when fixed."""
+        G1 = nx.path_graph(5)
+        G2 = G1.copy()
+        G2.add_edge(4, 5)
+
+        plotter = Plotter()
+        first = plotter.add_networkx(G1, layout="spring", layout_options={"seed": 1})
+        plotter.add_networkx(G2, layout="spring", warm_start=first, fix_unchanged=True)
+
+        old, new = plotter._scene.layers
+        for node_old, node_new in zip(old.nodes, new.nodes, strict=False):
+            assert node_new.x == pytest.approx(node_old.x)
+            assert node_new.y == pytest.approx(node_old.y)
+        assert len(new.nodes) == 6
+
+    def test_new_nodes_start_near_neighbours(self):
+        """Test a new leaf is placed near its neighbour rather than far away."""
+        G = nx.star_graph(4)
+        prior = {node: (float(node), 0.0) for node in G}
+        G.add_edge(4, 99)
+
+        positions = NetworkXAdapter._apply_incremental_layout(
+            G, prior, fix_unchanged=True, seed=0, iterations=1
+        )
+
+        assert abs(positions[99][0] - 4.0) < 2.0
+
+    def test_warm_start_from_previous_graph_uses_cache(self):
+        """Test a previous snapshot's cached layout seeds the new layout."""
+        cache = LayoutCache()
+        G1 = nx.cycle_graph(6)
+        NetworkXAdapter.convert_graph(G1, layout="spring", layout_cache=cache)
+
+        initial = NetworkXAdapter._resolve_warm_start(G1, G1, "spring", None, cache)
+
+        assert initial is not None
+        assert set(initial) == set(G1.nodes())
+
+    def test_warm_start_chains_across_snapshots(self, recwarn: pytest.WarningsRecorder):
+        """Test each snapshot warm-starts from the incremental layout before it."""
+        cache = LayoutCache()
+        G1 = nx.path_graph(5)
+        G2 = G1.copy()
+        G2.add_edge(4, 5)
+        G3 = G2.copy()
+        G3.add_edge(5, 6)
+
+        layers = [NetworkXAdapter.convert_graph(G1, layout="spring", layout_cache=cache)]
+        for previous, graph in ((G1, G2), (G2, G3)):
+            layers.append(
+                NetworkXAdapter.convert_graph(
+                    graph,
+                    layout="spring",
+                    layout_cache=cache,
+                    warm_start=previous,
+                    fix_unchanged=True,
+                )
+            )
+
+        assert not [w for w in recwarn if "warm start" in str(w.message)]
+        for old, new in zip(layers, layers[1:], strict=False):
+            for node_old, node_new in zip(old.nodes, new.nodes, strict=False):
+                assert node_new.x == pytest.approx(node_old.x)
+                assert node_new.y == pytest.approx(node_old.y)
+
+    def test_warm_start_true_uses_pos_attribute(self):
+        """Test warm_start=True seeds the layout from 'pos' attributes."""
+        G = nx.path_graph(3)
+        for node in G:
+            G.nodes[node]["pos"] = (float(node), 0.0)
+
+        layer = NetworkXAdapter.convert_graph(
+            G, layout="spring", warm_start=True, fix_unchanged=True
+        )
+
+        assert [node.x for node in layer.nodes] == [0.0, 1.0, 2.0]
+
+    def test_warm_start_unknown_layer_raises(self):
+        """Test an unknown layer ID is rejected."""
+        with pytest.raises(ValueError, match="Unknown layer"):
+            Plotter().add_networkx(nx.path_graph(2), warm_start="missing")
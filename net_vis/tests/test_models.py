@@ -0,0 +1,191 @@
+"""Tests for graph data models."""
+
+import numpy as np
+import pytest
+
+from net_vis.models import (
+    Edge,
+    EdgeColumns,
+    GraphLayer,
+    LayerColumns,
+    Node,
+    NodeColumns,
+    Scene,
+    StringTable,
+    _ColumnView,
+)
+
+
+@pytest.fixture
+def columns() -> LayerColumns:
+    """Create columnar storage for a 3-node path graph."""
+    strings = StringTable()
+    nodes = NodeColumns(
+        ids=np.array([strings.intern(s) for s in ("a", "b", "c")], dtype=np.int32),
+        x=np.array([0.0, 1.0, 2.0]),
+        y=np.array([0.0, 0.5, 1.0]),
+        labels=np.array([strings.intern("A"), -1, -1], dtype=np.int32),
+        colors=np.array([strings.intern("red"), strings.intern("red"), -1], dtype=np.int32),
+        attrs={"value": {0: 10, 2: 30}},
+    )
+    edges = EdgeColumns(
+        source=np.array([0, 1], dtype=np.int32),
+        target=np.array([1, 2], dtype=np.int32),
+        labels=np.array([strings.intern("ab"), -1], dtype=np.int32),
+        weight=np.array([2.5, np.nan]),
+        attrs={"kind": {1: "strong"}},
+        shared_attrs={"directed": True},
+    )
+    return LayerColumns(strings=strings, nodes=nodes, edges=edges)
+
+
+class TestStringTable:
+    """Tests for StringTable interning."""
+
+    def test_intern_deduplicates(self):
+        """Test the same string is stored once."""
+        strings = StringTable()
+        assert strings.intern("x") == strings.intern("x") == 0
+        assert strings.intern("y") == 1
+        assert len(strings) == 2
+
+    def test_none_maps_to_minus_one(self):
+        """Test None is interned as -1 and resolves back to None."""
+        strings = StringTable()
+        assert strings.intern(None) == -1
+        assert strings.get(-1) is None
+        assert strings.resolve(np.array([-1, strings.intern("x")])) == [None, "x"]
+
+
+class TestColumnarLayer:
+    """Tests for column-backed GraphLayer."""
+
+    def test_lazy_node_view(self, columns: LayerColumns):
+        """Test nodes are materialised as Node objects on access."""
+        layer = GraphLayer.from_columns("layer_0", columns)
+
+        assert len(layer.nodes) == 3
+        assert layer.nodes[0] == Node(
+            id="a", label="A", x=0.0, y=0.0, color="red", metadata={"value": 10}
+        )
+        assert layer.nodes[-1].id == "c"
+        assert layer.nodes[1].metadata == {}
+        assert [n.id for n in layer.nodes] == ["a", "b", "c"]
+
+        with pytest.raises(IndexError):
+            layer.nodes[3]
+
+    def test_lazy_edge_view(self, columns: LayerColumns):
+        """Test edges are materialised with node IDs, weights and shared attributes."""
+        layer = GraphLayer.from_columns("layer_0", columns)
+
+        assert len(layer.edges) == 2
+        assert layer.edges[0] == Edge(
+            source="a", target="b", label="ab", weight=2.5, metadata={"directed": True}
+        )
+        assert layer.edges[1].weight is None
+        assert layer.edges[1].metadata == {"kind": "strong", "directed": True}
+
+    def test_column_view_requires_build_and_len(self, columns: LayerColumns):
+        """Test a view subclass missing _build or __len__ cannot be created."""
+
+        class LengthOnly(_ColumnView):
+            def __len__(self) -> int:
+                return 0
+
+        with pytest.raises(TypeError, match="_build"):
+            LengthOnly(columns)
+
+    def test_views_reject_mutation(self, columns: LayerColumns):
+        """Test list mutators on column views raise instead of being ignored."""
+        layer = GraphLayer.from_columns("layer_0", columns)
+
+        with pytest.raises(TypeError, match="materialise"):
+            layer.nodes.append(Node(id="d"))
+        with pytest.raises(TypeError, match="read-only"):
+            layer.edges[0] = Edge(source="a", target="c")
+        with pytest.raises(TypeError, match="read-only"):
+            del layer.nodes[0]
+
+        assert len(layer.nodes) == 3
+
+    def test_materialise(self, columns: LayerColumns):
+        """Test a materialised layer is list-backed, editable and unchanged otherwise."""
+        layer = GraphLayer.from_columns("layer_0", columns)
+        before = Scene(layers=[layer]).to_dict()
+
+        layer.materialise()
+
+        assert layer.columns is None
+        assert isinstance(layer.nodes, list)
+        assert Scene(layers=[layer]).to_dict() == before
+
+        layer.nodes[0].label = "renamed"
+        layer.nodes.append(Node(id="d"))
+        data = Scene(layers=[layer]).to_dict()
+        assert data["nodes"][0]["name"] == "renamed"
+        assert data["nodes"][-1]["id"] == "d"
+
+    def test_assigning_records_detaches_columns(self, columns: LayerColumns):
+        """Test assigned node lists are serialised instead of the columns."""
+        layer = GraphLayer.from_columns("layer_0", columns)
+
+        layer.nodes = [Node(id="a"), Node(id="b"), Node(id="c")]
+
+        assert layer.columns is None
+        assert [n["id"] for n in Scene(layers=[layer]).to_dict()["nodes"]] == ["a", "b", "c"]
+        assert len(Scene(layers=[layer]).to_dict()["links"]) == 2
+
+    def test_to_dict_matches_object_layer(self, columns: LayerColumns):
+        """Test column-backed and object-backed layers serialise identically."""
+        columnar = GraphLayer.from_columns("layer_0", columns)
+        objects = GraphLayer(
+            layer_id="layer_0", nodes=list(columnar.nodes), edges=list(columnar.edges)
+        )
+
+        assert Scene(layers=[columnar]).to_dict() == Scene(layers=[objects]).to_dict()
+
+    def test_to_dict_record_format(self, columns: LayerColumns):
+        """Test column records use netvis field names."""
+        data = Scene(layers=[GraphLayer.from_columns("layer_0", columns)]).to_dict()
+
+        assert data["nodes"][0] == {
+            "id": "a",
+            "x": 0.0,
+            "y": 0.0,
+            "name": "A",
+            "category": "red",
+            "value": 10,
+        }
+        assert data["links"][0] == {
+            "source": "a",
+            "target": "b",
+            "label": "ab",
+            "value": 2.5,
+            "directed": True,
+        }
+
+    def test_to_dict_link_index(self, columns: LayerColumns):
+        """Test links reference scene-wide node indices in both layer kinds."""
+        columnar = GraphLayer.from_columns("layer_0", columns)
+        objects = GraphLayer(
+            layer_id="layer_1", nodes=list(columnar.nodes), edges=list(columnar.edges)
+        )
+
+        data = Scene(layers=[columnar, objects]).to_dict(link_index=True)
+
+        assert data["linkIndex"] is True
+        assert [(link["source"], link["target"]) for link in data["links"]] == [
+            (0, 1),
+            (1, 2),
+            (3, 4),
+            (4, 5),
+        ]
+        assert data["links"][0]["label"] == "ab"
+
+    def test_to_dict_link_index_rejects_unknown_node(self):
+        """Test index references need the edge's nodes in the same layer."""
+        layer = GraphLayer(layer_id="a", nodes=[Node(id="1")], edges=[Edge(source="1", target="2")])
+
+        with pytest.raises(ValueError, match="unknown node"):
+            Scene(layers=[layer]).to_dict(link_index=True)
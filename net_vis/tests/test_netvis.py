@@ -1,3 +1,6 @@
+import io
+import json
+
 import pytest
 
 from ..netvis import NetVis
@@ -9,8 +12,14 @@ def test_netvis_creation_blank():
 
 
 def test_netvis_creation_with_dict():
-    # 0.4.0: ValueError (not TraitError) because __init__ validates before super().__init__
-    with pytest.raises(ValueError, match="Value must be a string"):
+    # Mappings are validated in place and serialised only when displayed
+    data = {"nodes": [{"id": "A"}], "links": []}
+    w = NetVis(value=data)
+    assert w._text is None
+    assert w.graph_data == data
+    assert json.loads(w._repr_mimebundle_()["application/vnd.netvis+json"]["data"]) == data
+
+    with pytest.raises(ValueError, match="must contain 'nodes' array"):
         NetVis(value={"a": 1})
 
 
@@ -231,3 +240,186 @@ def test_special_characters_in_node_id():
         bundle = w._repr_mimebundle_()
         assert "application/vnd.netvis+json" in bundle
         assert bundle["application/vnd.netvis+json"]["data"] == data
+
+
+def test_parsed_graph_data_is_cached():
+    """Test validation parses once and keeps the parsed structure."""
+    data = '{"nodes": [{"id": "A"}, {"id": "B"}], "links": [{"source": "A", "target": "B"}]}'
+    w = NetVis(value=data)
+
+    assert w.graph_data == {
+        "nodes": [{"id": "A"}, {"id": "B"}],
+        "links": [{"source": "A", "target": "B"}],
+    }
+    assert w.graph_data is w.graph_data
+    assert NetVis(value="").graph_data is None
+
+
+def test_streaming_validation_accepts_valid_data():
+    """Test the streaming parser accepts data in any key order and parses lazily."""
+    data = '{"links": [{"source": "A", "target": "B"}], "meta": {"x": [1, 2]}, "nodes": [{"id": "A"}, {"id": "B"}]}'
+    w = NetVis(value=data, streaming=True)
+
+    assert w._graph_data is None
+    assert w.graph_data["nodes"][1] == {"id": "B"}
+
+
+@pytest.mark.parametrize(
+    ("data", "message"),
+    [
+        ("invalid json", "Invalid JSON format"),
+        ("[1, 2]", "must be a JSON object"),
+        ('{"nodes": [{"id": "A"}], "links": []} x', "Invalid JSON format"),
+        ('{"nodes": [{"id": "A"}, {"id": "A"}], "links": []}', "Duplicate node ID"),
+        (
+            '{"links": [{"source": "A", "target": "B"}], "nodes": [{"id": "A"}]}',
+            "does not exist in nodes",
+        ),
+        ('{"nodes": {}, "links": []}', "'nodes' must be an array"),
+        ('{"links": []}', "must contain 'nodes' array"),
+        ('{"nodes": [{"id": "A"}, ', "Invalid JSON format"),
+    ],
+)
+def test_streaming_validation_errors(data, message):
+    """Test the streaming parser reports the same errors as full parsing."""
+    with pytest.raises(ValueError, match=message):
+        NetVis(value=data, streaming=True)
+
+
+def test_streaming_validation_reads_files_in_chunks():
+    """Test values split across chunk boundaries are decoded correctly."""
+    from ..validation import validate_graph_stream
+
+    nodes = ", ".join(f'{{"id": {i}, "weight": 12345.678}}' for i in range(200))
+    links = ", ".join(f'{{"source": {i}, "target": {i + 1}}}' for i in range(199))
+    data = f'{{"nodes": [{nodes}], "links": [{links}]}}'
+
+    validate_graph_stream(io.StringIO(data), chunk_size=7)
+    with pytest.raises(ValueError, match="does not exist in nodes"):
+        validate_graph_stream(
+            io.StringIO(data.replace('"target": 199', '"target": 999')), chunk_size=7
+        )
+
+
+def test_netvis_creation_with_bytes_and_file():
+    """Test bytes and open files are accepted without a str round trip."""
+    data = b'{"nodes": [{"id": "A"}], "links": []}'
+
+    from_bytes = NetVis(value=data)
+    assert from_bytes.graph_data == {"nodes": [{"id": "A"}], "links": []}
+    assert from_bytes.value == data.decode()
+
+    assert NetVis(value=io.BytesIO(data)).value == data.decode()
+    assert NetVis(value=io.StringIO(data.decode()), streaming=True).graph_data["nodes"] == [
+        {"id": "A"}
+    ]
+    with pytest.raises(ValueError, match="does not exist in nodes"):
+        NetVis(value=b'{"nodes": [], "links": [{"source": 1, "target": 2}]}', streaming=True)
+
+
+def test_netvis_creation_with_path(tmp_path):
+    """Test JSON files are validated via a memory map and read when displayed."""
+    path = tmp_path / "graph.json"
+    path.write_text(
+        '{"nodes": [{"id": "A"}, {"id": "B"}], "links": [{"source": "A", "target": "B"}]}'
+    )
+
+    w = NetVis(value=path, streaming=True)
+    assert w._text is None
+    assert w.graph_data["links"] == [{"source": "A", "target": "B"}]
+    bundle = w._repr_mimebundle_()
+    assert bundle["application/vnd.netvis+json"]["data"] == path.read_text()
+
+    assert NetVis(value=path).graph_data["nodes"][0] == {"id": "A"}
+
+    path.write_text('{"nodes": [{"id": "A"}], "links": [{"source": "A", "target": "C"}]}')
+    with pytest.raises(ValueError, match="does not exist in nodes"):
+        NetVis(value=path, streaming=True)
+
+
+def test_netvis_creation_with_open_file(tmp_path):
+    """Test open files are validated like their path or while they are read."""
+    path = tmp_path / "graph.json"
+    data = '{"nodes": [{"id": "A"}, {"id": "B"}], "links": [{"source": "A", "target": "B"}]}'
+    path.write_text(data)
+
+    with path.open("rb") as fp:
+        w = NetVis(value=fp, streaming=True)
+    assert w._path == path
+    assert w.value == data
+
+    class ChunkedStream(io.BytesIO):
+        def read(self, size=-1):
+            assert size >= 0, "read the whole stream at once"
+            return super().read(size)
+
+    w = NetVis(value=ChunkedStream(data.encode()))
+    assert w._graph_data is None
+    assert w.graph_data["links"] == [{"source": "A", "target": "B"}]
+    assert NetVis(value=io.StringIO(data)).value == data
+
+    with pytest.raises(ValueError, match="does not exist in nodes"):
+        NetVis(value=io.StringIO(data.replace('"target": "B"', '"target": "C"')))
+
+
+def test_validation_levels():
+    """Test lighter validation levels skip the per-element checks."""
+    dangling = '{"nodes": [{"id": "A"}], "links": [{"source": "A", "target": "Z"}]}'
+
+    with pytest.raises(ValueError, match="does not exist in nodes"):
+        NetVis(value=dangling, validation_level="full")
+    assert NetVis(value=dangling, validation_level="structural").graph_data["links"]
+
+    with pytest.raises(ValueError, match="must contain 'links' array"):
+        NetVis(value='{"nodes": []}', validation_level="structural")
+
+    w = NetVis(value="not json", validation_level="none")
+    assert w.value == "not json"
+
+    with pytest.raises(ValueError, match="Validation level"):
+        NetVis(value=dangling, validation_level="partial")
+
+
+def test_sampled_validation_checks_link_subset():
+    """Test sampled validation catches duplicates and dangling sampled links."""
+    from ..validation import validate_graph_data
+
+    nodes = [{"id": i} for i in range(100)]
+    links = [{"source": i, "target": i + 1} for i in range(99)]
+    validate_graph_data({"nodes": nodes, "links": links}, "sampled", sample_size=10)
+
+    with pytest.raises(ValueError, match="Duplicate node ID"):
+        validate_graph_data({"nodes": nodes + [{"id": 5}], "links": links}, "sampled")
+
+    # Every link is sampled when the sample is at least as large as the link list
+    broken = links + [{"source": 0, "target": 999}]
+    with pytest.raises(ValueError, match="does not exist in nodes"):
+        validate_graph_data({"nodes": nodes, "links": broken}, "sampled", sample_size=100)
+
+
+def test_module_default_validation_level(monkeypatch):
+    """Test the module-wide default applies when no level is given."""
+    from .. import validation
+
+    monkeypatch.setattr(validation, "_default_level", "full")
+    validation.set_default_level("structural")
+
+    dangling = '{"nodes": [], "links": [{"source": "A", "target": "B"}]}'
+    assert NetVis(value=dangling).graph_data["nodes"] == []
+    with pytest.raises(ValueError, match="does not exist in nodes"):
+        NetVis(value=dangling, validation_level="full")
+
+    with pytest.raises(ValueError, match="Validation level"):
+        validation.set_default_level("lax")
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_index_referenced_links(streaming):
+    """Test links given as node indices are checked against the node count."""
+    data = '{"linkIndex": true, "nodes": [{"id": "A"}, {"id": "B"}], "links": [{"source": 0, "target": 1}]}'
+    assert NetVis(value=data, streaming=streaming).graph_data["links"][0]["target"] == 1
+
+    with pytest.raises(ValueError, match="does not exist in nodes"):
+        NetVis(value=data.replace('"target": 1', '"target": 2'), streaming=streaming)
+    with pytest.raises(ValueError, match="does not exist in nodes"):
+        NetVis(value=data.replace('"target": 1', '"target": "B"'), streaming=streaming)
@@ -1,5 +1,6 @@
 """Tests for NetworkXAdapter conversion functionality."""
 
+import numpy as np
 import pytest
 
 # Skip all tests if networkx is not installed
@@ -7,7 +8,10 @@ pytest.importorskip("networkx")
 
 import networkx as nx
 
+from net_vis.adapters import AttributeFilter, BatchMapping
+from net_vis.adapters.mapping import attribute_column
 from net_vis.adapters.networkx_adapter import NetworkXAdapter
+from net_vis.models import StringTable
 
 
 class TestNetworkXAdapterConversion:
@@ -36,6 +40,20 @@ class TestNetworkXAdapterConversion:
         assert len(layer.nodes) == 0
         assert len(layer.edges) == 0
 
+    def test_convert_graph_produces_columnar_layer(self):
+        """Test NetworkXAdapter stores nodes/edges in shared columns."""
+        G = nx.Graph()
+        G.add_edge("a", "b")
+        G.add_edge("b", "c")
+
+        layer = NetworkXAdapter.convert_graph(G)
+
+        assert layer.columns is not None
+        assert len(layer.columns.nodes) == 3
+        assert layer.columns.edges.source.tolist() == [0, 1]
+        assert layer.columns.edges.target.tolist() == [1, 2]
+        assert layer.columns.strings.strings == ["a", "b", "c"]
+
 
 class TestNetworkXAdapterAttributes:
     """Tests for attribute preservation."""
@@ -69,6 +87,57 @@ class TestNetworkXAdapterAttributes:
         assert edge2.metadata == {"weight": 3.0, "label": "links"}
 
 
+class TestNetworkXAdapterAttributeProjection:
+    """Tests for node_attrs/edge_attrs projections."""
+
+    def test_node_attrs_include_list(self):
+        """Test a list of names exports only those node attributes."""
+        G = nx.Graph()
+        G.add_node(1, name="A", embedding=[0.1] * 100, club="x")
+
+        layer = NetworkXAdapter.convert_graph(G, node_attrs=["name", "club"])
+
+        assert layer.nodes[0].metadata == {"name": "A", "club": "x"}
+
+    def test_mapping_uses_unexported_attributes(self):
+        """Test color/label mapping still sees attributes that are not exported."""
+        G = nx.Graph()
+        G.add_node(1, name="A", color="red")
+
+        layer = NetworkXAdapter.convert_graph(
+            G, node_color="color", node_label="name", node_attrs=[]
+        )
+
+        assert layer.nodes[0].color == "red"
+        assert layer.nodes[0].label == "A"
+        assert layer.nodes[0].metadata == {}
+
+    def test_edge_attrs_exclude_keeps_derived_fields(self):
+        """Test excluded edge attributes are dropped but edge_key/directed remain."""
+        G = nx.MultiDiGraph()
+        G.add_edge(1, 2, weight=1.0, text="long description")
+
+        layer = NetworkXAdapter.convert_graph(G, edge_attrs=AttributeFilter(exclude=["text"]))
+
+        assert layer.edges[0].metadata == {"weight": 1.0, "edge_key": 0, "directed": True}
+
+    def test_size_cap_and_json_filter(self):
+        """Test max_size and json_only drop oversized and non-JSON values."""
+        G = nx.Graph()
+        G.add_node(1, short="ok", long="x" * 50, obj=object(), nested={"a": [1, 2]})
+
+        layer = NetworkXAdapter.convert_graph(
+            G, node_attrs=AttributeFilter(max_size=10, json_only=True)
+        )
+
+        assert layer.nodes[0].metadata == {"short": "ok", "nested": {"a": [1, 2]}}
+
+    def test_attribute_filter_rejects_plain_string(self):
+        """Test include/exclude given as a bare string are rejected."""
+        with pytest.raises(TypeError, match="collections of attribute names"):
+            AttributeFilter(exclude="text")
+
+
 class TestNetworkXAdapterLayout:
     """Tests for layout computation."""
 
@@ -243,6 +312,88 @@ class TestNetworkXAdapterStyling:
         assert node2.color == "red"
 
 
+class TestNetworkXAdapterBatchMapping:
+    """Tests for column-wise (vectorised) style mapping."""
+
+    def test_batch_node_color_receives_numeric_column(self):
+        """Test a BatchMapping with an attribute gets one NumPy array."""
+        G = nx.path_graph(4)
+        for node in G:
+            G.nodes[node]["score"] = node * 10
+        calls = []
+
+        def color_fn(score):
+            calls.append(score)
+            return np.where(score > 15, "red", "blue")
+
+        layer = NetworkXAdapter.convert_graph(
+            G, node_color=BatchMapping(color_fn, attribute="score")
+        )
+
+        assert len(calls) == 1
+        assert calls[0].tolist() == [0, 10, 20, 30]
+        assert [n.color for n in layer.nodes] == ["blue", "blue", "red", "red"]
+
+    def test_batch_edge_label_receives_records(self):
+        """Test a BatchMapping without an attribute gets the attribute dicts."""
+        G = nx.MultiDiGraph()
+        G.add_edge("a", "b", relation="x")
+        G.add_edge("a", "b", relation="y")
+
+        layer = NetworkXAdapter.convert_graph(
+            G,
+            edge_label=BatchMapping(
+                lambda records: [f"{r['relation']}{r['edge_key']}" for r in records]
+            ),
+        )
+
+        assert [e.label for e in layer.edges] == ["x0", "y1"]
+
+    def test_batch_none_results_leave_elements_unmapped(self):
+        """Test None entries in batch results map to no label."""
+        G = nx.path_graph(3)
+
+        layer = NetworkXAdapter.convert_graph(
+            G, node_label=BatchMapping(lambda records: ["a", None, "c"])
+        )
+
+        assert [n.label for n in layer.nodes] == ["a", None, "c"]
+
+    def test_batch_result_length_mismatch_raises(self):
+        """Test batch functions must return one value per element."""
+        with pytest.raises(ValueError, match="must return 3 values"):
+            NetworkXAdapter.convert_graph(
+                nx.path_graph(3), node_label=BatchMapping(lambda records: ["a"])
+            )
+
+    def test_attribute_column_types(self):
+        """Test numeric columns become numeric arrays, others object arrays."""
+        assert attribute_column([{"v": 1}, {"v": 2.5}], "v").dtype == np.float64
+        assert attribute_column([{"v": 1}, {}], "v").tolist() == [1, None]
+        assert attribute_column([{"v": True}, {"v": 2}], "v").dtype == object
+
+    def test_interned_strings_match_per_element_conversion(self):
+        """Test values are stringified exactly like str(), keeping types apart."""
+        strings = StringTable()
+        values = [1, 1.0, True, "1", None, [1]]
+
+        ids = NetworkXAdapter._intern_values(values, strings)
+
+        assert [strings.get(i) for i in ids] == ["1", "1.0", "True", "1", None, "[1]"]
+        numeric = NetworkXAdapter._intern_values(np.array([2.0, 0.5, 2.0]), strings)
+        assert [strings.get(i) for i in numeric] == ["2.0", "0.5", "2.0"]
+
+    def test_callable_errors_map_to_none(self):
+        """Test per-element callables that raise leave the element unmapped."""
+        G = nx.Graph()
+        G.add_node(1, value=1)
+        G.add_node(2)
+
+        layer = NetworkXAdapter.convert_graph(G, node_label=lambda d: str(d["value"]))
+
+        assert [n.label for n in layer.nodes] == ["1", None]
+
+
 class TestNetworkXAdapterLayouts:
     """Tests for layout algorithms."""
 
@@ -383,6 +534,16 @@ class TestNetworkXAdapterLayouts:
         assert isinstance(node1.x, float)
         assert isinstance(node1.y, float)
 
+    def test_unsupported_layout_options_are_dropped(self):
+        """Test options a layout does not accept are ignored, not a random fallback."""
+        G = nx.cycle_graph(4)
+
+        with pytest.warns(UserWarning, match=r"does not accept options \['seed'\]"):
+            coords = NetworkXAdapter._compute_layout(G, "circular", {"seed": 1, "scale": 2})
+
+        expected = nx.circular_layout(G, scale=2)
+        np.testing.assert_allclose(coords, [expected[node] for node in G])
+
     def test_layout_failure_falls_back_to_random_with_warning(self):
         """Test layout failure (NaN, inf) falls back to random with warning."""
         import warnings
@@ -412,6 +573,37 @@ class TestNetworkXAdapterLayouts:
             assert not math.isnan(node.y)
 
 
+class TestNetworkXAdapterPositions:
+    """Tests for vectorized position packing and validation."""
+
+    def test_pack_positions_follows_graph_node_order(self):
+        """Test positions are packed into an (n, 2) array in node order."""
+        G = nx.Graph()
+        G.add_nodes_from(["b", "a", "c"])
+
+        coords = NetworkXAdapter._pack_positions(G, {"a": (1.0, 2.0), "b": (3.0, 4.0)})
+
+        assert coords.shape == (3, 2)
+        # Missing node "c" defaults to (0, 0)
+        assert coords.tolist() == [[3.0, 4.0], [1.0, 2.0], [0.0, 0.0]]
+
+    def test_validate_positions_detects_non_finite_values(self):
+        """Test NaN and inf are rejected for arrays and dicts."""
+        import numpy as np
+
+        assert NetworkXAdapter._validate_positions(np.array([[0.0, 1.0], [2.0, 3.0]]))
+        assert not NetworkXAdapter._validate_positions(np.array([[0.0, np.inf]]))
+        assert not NetworkXAdapter._validate_positions({1: (float("nan"), 0.0)})
+
+    def test_compute_layout_returns_coordinate_array(self):
+        """Test _compute_layout returns one row per node."""
+        G = nx.path_graph(5)
+
+        coords = NetworkXAdapter._compute_layout(G, layout="circular")
+
+        assert coords.shape == (5, 2)
+
+
 class TestNetworkXAdapterMultipleGraphTypes:
     """Tests for all NetworkX graph types support."""
 
@@ -548,3 +740,17 @@ class TestNetworkXAdapterMultipleGraphTypes:
         # Each edge should have unique edge_key
         edge_keys = [edge.metadata["edge_key"] for edge in layer.edges]
         assert len(set(edge_keys)) == 3  # All keys should be unique
+
+    def test_edge_label_mapping_sees_derived_fields(self):
+        """Test edge label functions receive 'edge_key' and 'directed' fields."""
+        G = nx.MultiDiGraph()
+        G.add_edge(1, 2, key="k1", relation="friend")
+
+        layer = NetworkXAdapter.convert_graph(
+            G, edge_label=lambda d: f"{d['relation']}:{d['edge_key']}:{d['directed']}"
+        )
+
+        assert layer.edges[0].label == "friend:k1:True"
+        assert layer.edges[0].metadata == {"relation": "friend", "edge_key": "k1", "directed": True}
+        # Source graph attributes are not modified
+        assert G.edges[1, 2, "k1"] == {"relation": "friend"}
@@ -9,7 +9,7 @@ pytest.importorskip("networkx")
 
 import networkx as nx
 
-from net_vis import Plotter
+from net_vis import AttributeFilter, Plotter
 
 
 def parse_mime_data(bundle: dict) -> dict:
@@ -116,6 +116,155 @@ class TestPlotterReprMimeBundle:
         assert len(data["links"]) == 1  # Edge 1-2
 
 
+class TestPlotterPayloadCache:
+    """Tests for caching the encoded scene between displays and exports."""
+
+    def test_repeated_display_encodes_once(self, monkeypatch: pytest.MonkeyPatch):
+        """Test an unchanged plotter reuses one encoding for MIME and HTML."""
+        from net_vis.models import GraphLayer
+
+        calls = []
+        original = GraphLayer.iter_node_records
+
+        def counting_records(layer):
+            calls.append(layer.layer_id)
+            return original(layer)
+
+        monkeypatch.setattr(GraphLayer, "iter_node_records", counting_records)
+        plotter = Plotter()
+        plotter.add_networkx(nx.path_graph(3), layout="circular")
+
+        first = plotter._repr_mimebundle_()
+        second = plotter._repr_mimebundle_()
+        html = plotter.export_html()
+
+        assert calls == ["layer_0"]
+        assert first == second
+        assert first["application/vnd.netvis+json"]["data"] in html
+
+    def test_only_mime_fragments_are_kept(self):
+        """Test other encodings do not leave fragments on the layers."""
+        plotter = Plotter()
+        plotter.add_networkx(nx.path_graph(3), layout="circular")
+
+        plotter.to_json()
+        plotter.to_json(link_index=True)
+        plotter._repr_mimebundle_()
+
+        layer = plotter._scene.layers[0]
+        assert {key[1:3] for key in layer._fragments} == {(None, False)}
+        assert plotter._payloads == {}
+
+    def test_in_place_edits_of_object_layers_are_encoded(self):
+        """Test editing Node objects after display shows up in every output."""
+        from net_vis.models import GraphLayer, Node
+        from net_vis.serializer import SceneJSONEncoder
+
+        plotter = Plotter()
+        plotter._scene.layers.append(GraphLayer(layer_id="a", nodes=[Node(id="1", label="old")]))
+        plotter._repr_mimebundle_()
+
+        plotter._scene.layers[0].nodes[0].label = "new"
+
+        assert parse_mime_data(plotter._repr_mimebundle_())["nodes"][0]["name"] == "new"
+        assert '"name": "new"' in plotter.export_html()
+        assert json.loads(SceneJSONEncoder().encode(plotter._scene))["nodes"][0]["name"] == "new"
+        assert json.loads(plotter.to_json())["nodes"][0]["name"] == "new"
+
+    def test_add_networkx_invalidates_payload(self):
+        """Test adding a layer re-encodes the scene."""
+        plotter = Plotter()
+        plotter.add_networkx(nx.path_graph(2), layout="circular")
+        before = parse_mime_data(plotter._repr_mimebundle_())
+
+        plotter.add_networkx(nx.path_graph(3), layout="circular")
+        after = parse_mime_data(plotter._repr_mimebundle_())
+
+        assert len(before["nodes"]) == 2
+        assert len(after["nodes"]) == 5
+
+    def test_to_json_matches_streamed_text(self):
+        """Test to_json returns the same text it writes to files."""
+        import io
+
+        plotter = Plotter(title="Cached")
+        plotter.add_networkx(nx.path_graph(3), layout="circular")
+        text = plotter.to_json()
+        buffer = io.StringIO()
+        plotter.to_json(buffer)
+
+        assert buffer.getvalue() == text
+
+        plotter._scene.title = "Renamed"
+        assert json.loads(plotter.to_json())["title"] == "Renamed"
+
+
+class TestPlotterLinkIndex:
+    """Tests for exporting links by node index."""
+
+    def test_to_json_link_index(self):
+        """Test to_json references nodes by index when asked."""
+        plotter = Plotter()
+        plotter.add_networkx(nx.path_graph(3), layout="circular")
+
+        data = json.loads(plotter.to_json(link_index=True))
+
+        assert data["linkIndex"] is True
+        assert [link["source"] for link in data["links"]] == [0, 1]
+        assert "linkIndex" not in json.loads(plotter.to_json())
+
+    def test_export_html_link_index(self):
+        """Test export_html embeds index-referenced links."""
+        plotter = Plotter()
+        plotter.add_networkx(nx.path_graph(3), layout="circular")
+
+        html = plotter.export_html(link_index=True)
+
+        assert '"linkIndex": true' in html
+        assert '"source": 0' in html
+
+
+class TestPlotterWireFormat:
+    """Tests for choosing between the JSON and binary MIME payloads."""
+
+    def test_json_is_default(self, monkeypatch: pytest.MonkeyPatch):
+        """Test large scenes stay in the JSON format unless binary is requested."""
+        monkeypatch.setattr("net_vis.plotter._BINARY_MIN_NODES", 2)
+        plotter = Plotter()
+        plotter.add_networkx(nx.path_graph(3), layout="circular")
+
+        assert list(plotter._repr_mimebundle_()) == ["application/vnd.netvis+json", "text/plain"]
+
+    def test_auto_format(self, monkeypatch: pytest.MonkeyPatch):
+        """Test auto mode sends only large scenes in the binary format."""
+        monkeypatch.setattr("net_vis.plotter._BINARY_MIN_NODES", 3)
+        plotter = Plotter(wire_format="auto")
+        plotter.add_networkx(nx.path_graph(2), layout="circular")
+
+        assert "application/vnd.netvis+json" in plotter._repr_mimebundle_()
+
+        plotter.add_networkx(nx.path_graph(2), layout="circular")
+        assert "application/vnd.netvis.binary+json" in plotter._repr_mimebundle_()
+
+    def test_binary_format(self):
+        """Test the binary payload is sent unless the frontend excludes it."""
+        plotter = Plotter(wire_format="binary")
+        plotter.add_networkx(nx.path_graph(3), layout="circular")
+
+        bundle = plotter._repr_mimebundle_()
+        payload = bundle["application/vnd.netvis.binary+json"]["data"]
+        assert payload["nodes"]["count"] == 3
+        assert plotter._repr_mimebundle_()["application/vnd.netvis.binary+json"]["data"] is payload
+
+        fallback = plotter._repr_mimebundle_(exclude=["application/vnd.netvis.binary+json"])
+        assert len(parse_mime_data(fallback)["nodes"]) == 3
+
+    def test_invalid_wire_format_raises(self):
+        """Test unknown wire formats are rejected."""
+        with pytest.raises(ValueError, match="wire_format"):
+            Plotter(wire_format="msgpack")
+
+
 class TestPlotterIntegration:
     """Integration tests for Plotter with real NetworkX graphs."""
 
@@ -155,6 +304,20 @@ class TestPlotterIntegration:
         assert "nodes" in data
         assert "links" in data
 
+    def test_plotter_to_json_streams_to_file_object(self):
+        """Test Plotter.to_json writes JSON into a file object."""
+        import io
+
+        plotter = Plotter(title="Streamed")
+        G = nx.Graph()
+        G.add_edge(1, 2)
+        plotter.add_networkx(G)
+
+        buffer = io.StringIO()
+        assert plotter.to_json(buffer) is None
+        assert buffer.getvalue() == plotter.to_json()
+        assert json.loads(buffer.getvalue())["title"] == "Streamed"
+
 
 class TestPlotterStyling:
     """Tests for Plotter styling parameters."""
@@ -188,6 +351,22 @@ class TestPlotterStyling:
         assert len(data["links"]) == 1
         assert data["links"][0]["label"] == "connects"
 
+    def test_add_networkx_with_attribute_projection(self):
+        """Test node_attrs/edge_attrs limit metadata in the MIME payload."""
+        plotter = Plotter()
+        G = nx.Graph()
+        G.add_node(1, name="A", embedding=list(range(1000)))
+        G.add_node(2, name="B", embedding=list(range(1000)))
+        G.add_edge(1, 2, relation="knows", raw=b"bytes")
+
+        plotter.add_networkx(G, node_attrs=["name"], edge_attrs=AttributeFilter(json_only=True))
+        data = parse_mime_data(plotter._repr_mimebundle_())
+
+        assert all("embedding" not in node for node in data["nodes"])
+        assert data["nodes"][0]["name"] == "A"
+        assert data["links"][0]["relation"] == "knows"
+        assert "raw" not in data["links"][0]
+
 
 class TestPlotterMultipleGraphTypes:
     """Tests for Plotter with all NetworkX graph types."""
@@ -0,0 +1,258 @@
+"""Tests for streaming scene JSON serialization."""
+
+import base64
+import io
+import json
+
+import numpy as np
+import pytest
+
+from net_vis.models import Edge, GraphLayer, Node, Scene
+from net_vis.serializer import SceneBinaryEncoder, SceneJSONEncoder, _object_columns
+
+
+@pytest.fixture
+def scene() -> Scene:
+    """Create a two-layer scene with metadata and non-ASCII text."""
+    first = GraphLayer(
+        layer_id="a",
+        nodes=[Node(id="1", label="Ärger", x=0.5, y=1.0, metadata={"v": [1, 2]})],
+        edges=[Edge(source="1", target="1", weight=2.0)],
+    )
+    second = GraphLayer(
+        layer_id="b",
+        nodes=[Node(id=str(i), color="c") for i in range(2, 9)],
+        edges=[Edge(source=str(i), target=str(i + 1), label="e") for i in range(2, 8)],
+    )
+    return Scene(layers=[first, second], title="Stream")
+
+
+@pytest.fixture
+def columnar_scene(scene: Scene) -> Scene:
+    """Create the same scene with column-backed layers."""
+    layers = [
+        GraphLayer.from_columns(layer.layer_id, _object_columns(layer)) for layer in scene.layers
+    ]
+    return Scene(layers=layers, title=scene.title)
+
+
+class TestSceneJSONEncoder:
+    """Tests for SceneJSONEncoder."""
+
+    @pytest.mark.parametrize("indent", [None, 2])
+    @pytest.mark.parametrize("ensure_ascii", [True, False])
+    @pytest.mark.parametrize("batch_size", [1, 3, 1000])
+    def test_matches_json_dumps(self, scene: Scene, indent, ensure_ascii, batch_size):
+        """Test streamed output is byte-identical to json.dumps(scene.to_dict())."""
+        encoder = SceneJSONEncoder(indent=indent, ensure_ascii=ensure_ascii, batch_size=batch_size)
+        expected = json.dumps(scene.to_dict(), indent=indent, ensure_ascii=ensure_ascii)
+
+        assert encoder.encode(scene) == expected
+
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_empty_scene(self, indent):
+        """Test empty scenes encode like json.dumps."""
+        assert SceneJSONEncoder(indent=indent).encode(Scene()) == json.dumps(
+            Scene().to_dict(), indent=indent
+        )
+
+    def test_iter_encode_yields_chunks(self, scene: Scene):
+        """Test records are emitted in several chunks rather than one string."""
+        chunks = list(SceneJSONEncoder(batch_size=2).iter_encode(scene))
+
+        assert len(chunks) > 5
+        assert json.loads("".join(chunks)) == scene.to_dict()
+
+    def test_dump_writes_to_file_object(self, scene: Scene):
+        """Test dump() streams JSON into a text file object."""
+        buffer = io.StringIO()
+        SceneJSONEncoder().dump(scene, buffer)
+
+        assert json.loads(buffer.getvalue()) == scene.to_dict()
+
+    def test_invalid_batch_size_raises(self):
+        """Test non-positive batch sizes are rejected."""
+        with pytest.raises(ValueError, match="batch_size"):
+            SceneJSONEncoder(batch_size=0)
+
+
+class TestLayerFragmentCache:
+    """Tests for per-layer caching of encoded records."""
+
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_cached_fragments_match_fresh_encoding(self, columnar_scene: Scene, indent):
+        """Test assembling cached fragments gives the same document."""
+        encoder = SceneJSONEncoder(indent=indent, cache_fragments=True)
+        first = encoder.encode(columnar_scene)
+        second = encoder.encode(columnar_scene)
+
+        assert first == second == json.dumps(columnar_scene.to_dict(), indent=indent)
+
+    def test_only_new_layers_are_encoded(
+        self, columnar_scene: Scene, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test adding a layer re-encodes that layer only."""
+        encoder = SceneJSONEncoder(cache_fragments=True)
+        encoder.encode(columnar_scene)
+
+        encoded = []
+        original = GraphLayer.iter_node_records
+
+        def tracking(layer):
+            encoded.append(layer.layer_id)
+            return original(layer)
+
+        monkeypatch.setattr(GraphLayer, "iter_node_records", tracking)
+        columnar_scene.layers.append(GraphLayer(layer_id="c", nodes=[Node(id="9")]))
+        text = encoder.encode(columnar_scene)
+
+        assert encoded == ["c"]
+        assert json.loads(text) == columnar_scene.to_dict()
+
+    def test_mutation_invalidates_fragments(self, columnar_scene: Scene):
+        """Test reassigning or invalidating a layer drops stale fragments."""
+        encoder = SceneJSONEncoder(cache_fragments=True)
+        encoder.encode(columnar_scene)
+
+        first, second = columnar_scene.layers
+        first.edges = []
+        assert json.loads(encoder.encode(columnar_scene)) == columnar_scene.to_dict()
+
+        second.columns.nodes.x[0] = 42.0
+        second.invalidate()
+        assert json.loads(encoder.encode(columnar_scene)) == columnar_scene.to_dict()
+
+    def test_list_backed_layers_are_not_cached(self, scene: Scene):
+        """Test in-place edits of Node objects show up without invalidate()."""
+        SceneJSONEncoder(cache_fragments=True).encode(scene)
+
+        scene.layers[0].nodes[0].label = "renamed"
+        scene.layers[1].nodes.append(Node(id="new"))
+
+        for encoder in (SceneJSONEncoder(cache_fragments=True), SceneJSONEncoder()):
+            assert json.loads(encoder.encode(scene)) == scene.to_dict()
+
+    def test_non_caching_encoder_ignores_fragments(self, columnar_scene: Scene):
+        """Test an encoder without cache_fragments encodes the columns afresh."""
+        SceneJSONEncoder(cache_fragments=True).encode(columnar_scene)
+
+        columnar_scene.layers[0].columns.nodes.x[0] = 42.0
+
+        assert json.loads(SceneJSONEncoder().encode(columnar_scene)) == columnar_scene.to_dict()
+
+
+class TestLinkIndex:
+    """Tests for index-referenced links."""
+
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_matches_to_dict(self, scene: Scene, indent):
+        """Test the streamed document equals dumping Scene.to_dict(link_index=True)."""
+        encoder = SceneJSONEncoder(indent=indent, link_index=True, batch_size=2)
+
+        assert encoder.encode(scene) == json.dumps(scene.to_dict(link_index=True), indent=indent)
+
+    def test_cached_fragments_track_offsets(self):
+        """Test a cached layer reused at another position gets fresh indices."""
+        objects = GraphLayer(
+            layer_id="a", nodes=[Node(id="x"), Node(id="y")], edges=[Edge(source="x", target="y")]
+        )
+        layer = GraphLayer.from_columns("a", _object_columns(objects))
+        other = GraphLayer(layer_id="b", nodes=[Node(id="z")])
+        encoder = SceneJSONEncoder(link_index=True, cache_fragments=True)
+
+        encoder.encode(Scene(layers=[layer]))
+        links = json.loads(encoder.encode(Scene(layers=[other, layer])))["links"]
+
+        assert links == [{"source": 1, "target": 2}]
+
+
+def decode_binary(payload: dict) -> dict:
+    """Rebuild netvis JSON records from a binary payload (as the frontend does)."""
+
+    def column(encoded: str, dtype: str) -> list:
+        return np.frombuffer(base64.b64decode(encoded), dtype=dtype).tolist()
+
+    strings = payload["strings"]
+    nodes = [
+        {"id": strings[i], "x": x, "y": y}
+        for i, x, y in zip(
+            column(payload["nodes"]["id"], "<i4"),
+            column(payload["nodes"]["x"], "<f4"),
+            column(payload["nodes"]["y"], "<f4"),
+            strict=True,
+        )
+    ]
+    for node, name, category in zip(
+        nodes,
+        column(payload["nodes"]["name"], "<i4"),
+        column(payload["nodes"]["category"], "<i4"),
+        strict=True,
+    ):
+        if name >= 0:
+            node["name"] = strings[name]
+        if category >= 0:
+            node["category"] = strings[category]
+    links = [
+        {"source": nodes[s]["id"], "target": nodes[t]["id"]}
+        for s, t in zip(
+            column(payload["links"]["source"], "<u4"),
+            column(payload["links"]["target"], "<u4"),
+            strict=True,
+        )
+    ]
+    for link, label, value in zip(
+        links,
+        column(payload["links"]["label"], "<i4"),
+        column(payload["links"]["value"], "<f4"),
+        strict=True,
+    ):
+        if label >= 0:
+            link["label"] = strings[label]
+        if value == value:
+            link["value"] = value
+    for records, key in ((nodes, "nodes"), (links, "links")):
+        for name, attr in payload[key]["attrs"].items():
+            for row, value in zip(column(attr["rows"], "<u4"), attr["values"], strict=True):
+                records[row][name] = value
+    return {"nodes": nodes, "links": links}
+
+
+class TestSceneBinaryEncoder:
+    """Tests for the compact binary wire format."""
+
+    def test_round_trip_matches_records(self, scene: Scene):
+        """Test decoding the payload reproduces the JSON records."""
+        payload = SceneBinaryEncoder().encode(scene)
+        decoded = decode_binary(payload)
+        expected = scene.to_dict()
+
+        assert payload["title"] == "Stream"
+        assert decoded["links"] == expected["links"]
+        assert [node["id"] for node in decoded["nodes"]] == [
+            node["id"] for node in expected["nodes"]
+        ]
+        assert decoded["nodes"][0]["name"] == "Ärger"
+        assert decoded["nodes"][0]["v"] == [1, 2]
+
+    def test_column_backed_layers_are_offset(self):
+        """Test links of later layers point at their own layer's nodes."""
+        pytest.importorskip("networkx")
+        import networkx as nx
+
+        from net_vis.adapters import NetworkXAdapter
+
+        G = nx.DiGraph([(0, 1)])
+        layers = [NetworkXAdapter.convert_graph(G, layout="circular") for _ in range(2)]
+        payload = SceneBinaryEncoder().encode(Scene(layers=layers))
+
+        targets = np.frombuffer(base64.b64decode(payload["links"]["target"]), "<u4")
+        assert payload["nodes"]["count"] == 4
+        assert targets.tolist() == [1, 3]
+        assert decode_binary(payload)["links"][1]["directed"] is True
+
+    def test_dangling_edge_raises(self):
+        """Test object-backed edges to unknown nodes are rejected."""
+        layer = GraphLayer(layer_id="a", nodes=[Node(id="1")], edges=[Edge(source="1", target="2")])
+
+        with pytest.raises(ValueError, match="unknown node"):
+            SceneBinaryEncoder().encode(Scene(layers=[layer]))
@@ -0,0 +1,420 @@
+"""Validation of GraphData JSON consumed by the NetVis MIME renderer."""
+
+import codecs
+import json
+import mmap
+import os
+import random
+import re
+from typing import IO, Any, TextIO
+
+# Strings at least this long are validated with the streaming parser by default
+STREAMING_THRESHOLD = 64 * 1024 * 1024
+
+# How thoroughly graph data is checked:
+# - full: structure, every node and every link reference
+# - structural: top-level object with 'nodes' and 'links' arrays only
+# - sampled: structural, node IDs, and references of a random subset of links
+# - none: no checks (JSON text is not even parsed)
+VALIDATION_LEVELS = ("full", "structural", "sampled", "none")
+
+# Number of links (and nodes) checked individually at the 'sampled' level
+SAMPLE_SIZE = 1000
+
+_default_level = "full"
+
+# Characters read from a file per refill of the streaming parser
+_CHUNK_SIZE = 1024 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _GraphChecker:
+    """Checks nodes and links one at a time.
+
+    Node IDs are collected in a set; links seen before the node list is
+    complete only keep their (source, target) pair until it is. With
+    ``link_index`` set, link endpoints are positions in the node list.
+    """
+
+    def __init__(self, link_index: bool = False) -> None:
+        self.node_ids: set[Any] = set()
+        self.nodes_done = False
+        self.link_index = link_index
+        self._pending: list[tuple[Any, Any]] = []
+
+    def add_node(self, node: Any) -> None:
+        if not isinstance(node, dict):
+            raise ValueError("Each node must be an object")
+        if "id" not in node:
+            raise ValueError("Each node must have an 'id' field")
+
+        node_id = node["id"]
+        if node_id in self.node_ids:
+            raise ValueError(f"Duplicate node ID: {node_id}")
+        self.node_ids.add(node_id)
+
+    def add_link(self, link: Any) -> None:
+        if not isinstance(link, dict):
+            raise ValueError("Each link must be an object")
+        if "source" not in link:
+            raise ValueError("Each link must have a 'source' field")
+        if "target" not in link:
+            raise ValueError("Each link must have a 'target' field")
+
+        if self.nodes_done:
+            self._check_references(link["source"], link["target"])
+        else:
+            self._pending.append((link["source"], link["target"]))
+
+    def finish_nodes(self) -> None:
+        self.nodes_done = True
+        for source, target in self._pending:
+            self._check_references(source, target)
+        self._pending.clear()
+
+    def _has_node(self, ref: Any) -> bool:
+        if not self.link_index:
+            return ref in self.node_ids
+        # Node IDs are unique, so the set size is the node count
+        return type(ref) is int and 0 <= ref < len(self.node_ids)
+
+    def _check_references(self, source: Any, target: Any) -> None:
+        if not self._has_node(source):
+            raise ValueError(f"Link source '{source}' does not exist in nodes")
+        if not self._has_node(target):
+            raise ValueError(f"Link target '{target}' does not exist in nodes")
+
+
+def get_default_level() -> str:
+    """Return the validation level used when NetVis is given none."""
+    return _default_level
+
+
+def set_default_level(level: str) -> None:
+    """Set the module-wide default validation level.
+
+    Args:
+        level: One of VALIDATION_LEVELS
+
+    Raises:
+        ValueError: If the level is unknown
+
+    Examples:
+        Trust upstream data in a notebook loop that redisplays large graphs:
+            >>> from net_vis import validation
+            >>> validation.set_default_level("sampled")
+    """
+    global _default_level
+    _default_level = resolve_level(level)
+
+
+def resolve_level(level: str | None) -> str:
+    """Return a checked validation level, substituting the default for None.
+
+    Raises:
+        ValueError: If the level is unknown
+    """
+    if level is None:
+        return _default_level
+    if level not in VALIDATION_LEVELS:
+        raise ValueError(f"Validation level must be one of {VALIDATION_LEVELS}, got {level!r}")
+    return level
+
+
+def validate_graph_data(
+    parsed: Any,
+    level: str = "full",
+    sample_size: int = SAMPLE_SIZE,
+    seed: int | None = None,
+) -> None:
+    """Validate an already parsed GraphData structure.
+
+    Args:
+        parsed: Decoded JSON value
+        level: One of VALIDATION_LEVELS
+        sample_size: Number of links checked at the 'sampled' level
+        seed: Random seed for choosing the sample
+
+    Raises:
+        ValueError: If nodes/links are missing or data is inconsistent
+    """
+    if level == "none":
+        return
+
+    if not isinstance(parsed, dict):
+        raise ValueError("GraphData must be a JSON object")
+
+    if "nodes" not in parsed:
+        raise ValueError("GraphData must contain 'nodes' array")
+
+    if "links" not in parsed:
+        raise ValueError("GraphData must contain 'links' array")
+
+    nodes = parsed["nodes"]
+    links = parsed["links"]
+
+    if not isinstance(nodes, list):
+        raise ValueError("'nodes' must be an array")
+
+    if not isinstance(links, list):
+        raise ValueError("'links' must be an array")
+
+    link_index = parsed.get("linkIndex", False)
+    if not isinstance(link_index, bool):
+        raise ValueError("'linkIndex' must be a boolean")
+
+    if level == "structural":
+        return
+
+    checker = _GraphChecker(link_index)
+    if level == "sampled":
+        _check_sample(checker, nodes, links, sample_size, random.Random(seed))
+        return
+
+    for node in nodes:
+        checker.add_node(node)
+    checker.finish_nodes()
+    for link in links:
+        checker.add_link(link)
+
+
+def _check_sample(
+    checker: _GraphChecker,
+    nodes: list[Any],
+    links: list[Any],
+    sample_size: int,
+    rng: random.Random,
+) -> None:
+    """Check node IDs in bulk and a random subset of nodes and links."""
+    for index in rng.sample(range(len(nodes)), min(sample_size, len(nodes))):
+        checker.add_node(nodes[index])
+    try:
+        node_ids = {node["id"] for node in nodes}
+    except (KeyError, TypeError):
+        raise ValueError("Each node must be an object with an 'id' field") from None
+    if len(node_ids) != len(nodes):
+        raise ValueError("Duplicate node ID")
+    checker.node_ids = node_ids
+    checker.finish_nodes()
+    for index in rng.sample(range(len(links)), min(sample_size, len(links))):
+        checker.add_link(links[index])
+
+
+def parse_graph_data(data: str | bytes, level: str = "full") -> dict[str, Any]:
+    """Parse and validate GraphData JSON in one pass.
+
+    Args:
+        data: JSON text with 'nodes' and 'links'
+        level: One of VALIDATION_LEVELS
+
+    Returns:
+        Parsed GraphData
+
+    Raises:
+        ValueError: If JSON is invalid, nodes/links are missing, or data is inconsistent
+    """
+    try:
+        parsed = json.loads(data)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON format: {e}") from None
+    validate_graph_data(parsed, level)
+    return parsed
+
+
+class _JSONStream:
+    """Iterative reader decoding one JSON value at a time.
+
+    Text is consumed from a string in place or from a file in chunks; only
+    the unconsumed tail of the file and the value being decoded are held
+    in memory.
+    """
+
+    def __init__(self, source: str | TextIO, chunk_size: int = _CHUNK_SIZE) -> None:
+        if isinstance(source, str):
+            self._buffer, self._file = source, None
+        else:
+            self._buffer, self._file = "", source
+        self._pos = 0
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Append the next chunk of the file; False at end of input."""
+        if self._file is None:
+            return False
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._file = None
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of input)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consume one of ``chars`` and return it."""
+        char = self.peek()
+        if not char or char not in chars:
+            found = repr(char) if char else "end of input"
+            raise ValueError(f"Invalid JSON format: expected one of {chars!r}, found {found}")
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                # The value may continue in the next chunk
+                if self._fill():
+                    continue
+                raise ValueError(f"Invalid JSON format: {e}") from None
+            # A number ending the buffer may be cut off mid-digits
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def array(self) -> Any:
+        """Yield the elements of the array starting at the current position."""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(",]") == "]":
+                return
+
+
+def validate_graph_stream(source: str | TextIO, chunk_size: int = _CHUNK_SIZE) -> None:
+    """Validate GraphData JSON without building the parsed document.
+
+    Nodes and links are decoded and checked one element at a time, so
+    memory stays bounded by the node ID set rather than the size of the
+    document.
+
+    Args:
+        source: JSON string or text file object
+        chunk_size: Characters read per refill when reading from a file
+
+    Raises:
+        ValueError: If JSON is invalid, nodes/links are missing, or data is inconsistent
+    """
+    stream = _JSONStream(source, chunk_size)
+    if stream.peek() != "{":
+        # Decode the value only to report invalid JSON or the wrong type
+        stream.value()
+        raise ValueError("GraphData must be a JSON object")
+
+    checker = _GraphChecker()
+    seen: set[str] = set()
+    stream.expect("{")
+    if stream.peek() == "}":
+        stream.expect("}")
+    else:
+        while True:
+            key = stream.value()
+            if not isinstance(key, str):
+                raise ValueError("Invalid JSON format: object keys must be strings")
+            stream.expect(":")
+            if key == "linkIndex":
+                link_index = stream.value()
+                if not isinstance(link_index, bool):
+                    raise ValueError("'linkIndex' must be a boolean")
+                if "links" in seen and link_index:
+                    raise ValueError("'linkIndex' must precede 'links' for streaming validation")
+                checker.link_index = link_index
+            elif key in ("nodes", "links"):
+                if stream.peek() != "[":
+                    stream.value()
+                    raise ValueError(f"'{key}' must be an array")
+                add = checker.add_node if key == "nodes" else checker.add_link
+                for item in stream.array():
+                    add(item)
+                if key == "nodes":
+                    checker.finish_nodes()
+                seen.add(key)
+            else:
+                stream.value()
+            if stream.expect(",}") == "}":
+                break
+
+    if stream.peek():
+        raise ValueError("Invalid JSON format: extra data after GraphData object")
+    if "nodes" not in seen:
+        raise ValueError("GraphData must contain 'nodes' array")
+    if "links" not in seen:
+        raise ValueError("GraphData must contain 'links' array")
+
+
+class _TeeReader:
+    """File wrapper keeping a copy of everything read through it."""
+
+    def __init__(self, source: IO[Any]) -> None:
+        self._source = source
+        self.text: list[str] = []
+        self.raw = bytearray()
+
+    def read(self, size: int = -1) -> Any:
+        chunk = self._source.read(size)
+        if isinstance(chunk, str):
+            self.text.append(chunk)
+        else:
+            self.raw += chunk
+        return chunk
+
+
+def read_graph_stream(source: IO[Any], chunk_size: int = _CHUNK_SIZE) -> str | bytearray:
+    """Read GraphData JSON from a file object, validating it as it is read.
+
+    The content is read once, in chunks, and never parsed as a whole.
+
+    Args:
+        source: Readable text or binary (UTF-8) file object
+        chunk_size: Characters read per refill of the streaming parser
+
+    Returns:
+        Everything read from the file: text for text files, bytes otherwise
+
+    Raises:
+        ValueError: If JSON is invalid, nodes/links are missing, or data is inconsistent
+    """
+    tee = _TeeReader(source)
+    first = tee.read(0)
+    if isinstance(first, str):
+        validate_graph_stream(tee, chunk_size)
+        return "".join(tee.text)
+    validate_graph_stream(codecs.getreader("utf-8-sig")(tee), chunk_size)
+    return tee.raw
+
+
+def validate_graph_file(path: str | os.PathLike) -> None:
+    """Validate a GraphData JSON file through a read-only memory map.
+
+    The file is decoded incrementally from the mapping, so neither its
+    bytes nor the parsed document are copied into memory as a whole.
+
+    Args:
+        path: Path of a UTF-8 encoded JSON file
+
+    Raises:
+        ValueError: If JSON is invalid, nodes/links are missing, or data is inconsistent
+        OSError: If the file cannot be read
+    """
+    with open(path, "rb") as fp:
+        if os.fstat(fp.fileno()).st_size == 0:
+            raise ValueError("Invalid JSON format: file is empty")
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            validate_graph_stream(codecs.getreader("utf-8-sig")(mapped))
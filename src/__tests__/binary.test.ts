@@ -0,0 +1,55 @@
+import { decodeBinaryGraph, BinaryGraphPayload } from '../binary';
+
+// Encoded by SceneBinaryEncoder for nodes A (red, club 'x') and B ('Bee')
+// joined by a link labelled 'ab' with value 2
+const payload: BinaryGraphPayload = {
+  version: 1,
+  strings: ['A', 'B', 'Bee', '#ff0000', 'ab'],
+  nodes: {
+    count: 2,
+    id: 'AAAAAAEAAAA=',
+    x: 'AAAAPwAAAAA=',
+    y: 'AACAvwAAAAA=',
+    name: '/////wIAAAA=',
+    category: 'AwAAAP////8=',
+    attrs: { club: { rows: 'AAAAAA==', values: ['x'] } },
+  },
+  links: {
+    count: 1,
+    source: 'AAAAAA==',
+    target: 'AQAAAA==',
+    label: 'BAAAAA==',
+    value: 'AAAAQA==',
+    attrs: {},
+  },
+};
+
+describe('decodeBinaryGraph', () => {
+  it('should decode nodes from typed array columns', () => {
+    const { nodes } = decodeBinaryGraph(payload);
+
+    expect(nodes).toEqual([
+      { id: 'A', x: 0.5, y: -1, category: '#ff0000', club: 'x' },
+      { id: 'B', x: 0, y: 0, name: 'Bee' },
+    ]);
+  });
+
+  it('should link node objects directly by index', () => {
+    const { nodes, links } = decodeBinaryGraph(payload);
+
+    expect(links).toHaveLength(1);
+    expect(links[0].source).toBe(nodes[0]);
+    expect(links[0].target).toBe(nodes[1]);
+    expect(links[0].label).toBe('ab');
+    expect(links[0].value).toBe(2);
+  });
+
+  it('should reject unsupported versions and truncated columns', () => {
+    expect(() => decodeBinaryGraph({ ...payload, version: 2 })).toThrow(
+      'Unsupported binary graph data version',
+    );
+    expect(() =>
+      decodeBinaryGraph({ ...payload, nodes: { ...payload.nodes, count: 3 } }),
+    ).toThrow("'id' has 2 entries, expected 3");
+  });
+});
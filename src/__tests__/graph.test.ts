@@ -2,6 +2,8 @@
 // These tests verify the API and error handling.
 
 import { renderGraph, GraphData } from '../graph';
+import { Collors } from '../settings';
+import { resolveCategoryColor } from '../utils/string';
 
 describe('D3.js Graph Interactions', () => {
   let container: HTMLElement;
@@ -51,6 +53,22 @@ describe('D3.js Graph Interactions', () => {
 
       expect(() => renderGraph(container, graphData)).not.toThrow();
     });
+
+    it('should resolve index-referenced links to node objects', () => {
+      const graphData: GraphData = {
+        linkIndex: true,
+        nodes: [{ id: 'A' }, { id: 'B' }, { id: 'C' }],
+        links: [
+          { source: 0, target: 1 },
+          { source: 1, target: 2 },
+        ],
+      };
+
+      renderGraph(container, graphData);
+
+      expect(graphData.links[0].source).toBe(graphData.nodes[0]);
+      expect(graphData.links[1].target).toBe(graphData.nodes[2]);
+    });
   });
 
   describe('drag and interaction handlers', () => {
@@ -132,4 +150,21 @@ describe('D3.js Graph Interactions', () => {
       );
     });
   });
+
+  describe('node fill colors', () => {
+    it('should map palette categories to palette colors', () => {
+      expect(resolveCategoryColor('type b', Collors)).toBe('blue');
+    });
+
+    it('should use CSS colors from Python color scales as is', () => {
+      expect(resolveCategoryColor('#1f77b4', Collors)).toBe('#1f77b4');
+      expect(resolveCategoryColor('rgb(0, 0, 255)', Collors)).toBe(
+        'rgb(0, 0, 255)',
+      );
+    });
+
+    it('should fall back to the default key for missing categories', () => {
+      expect(resolveCategoryColor(undefined, Collors, 'TYPE_C')).toBe('green');
+    });
+  });
 });
@@ -115,6 +115,20 @@ describe('generateStandaloneHtml', () => {
     expect(html).toContain('height: 700px');
   });
 
+  it('should convert index-referenced links back to node IDs', () => {
+    const html = generateStandaloneHtml({
+      ...defaultConfig,
+      graphData: {
+        linkIndex: true,
+        nodes: [{ id: 'A' }, { id: 'B' }],
+        links: [{ source: 0, target: 1 }],
+      },
+    });
+
+    expect(html).toContain('"source":"A","target":"B"');
+    expect(html).not.toContain('linkIndex');
+  });
+
   it('should handle empty graph data', () => {
     const html = generateStandaloneHtml({
       ...defaultConfig,
@@ -0,0 +1,171 @@
+import type { GraphData, Link, Node } from './graph';
+
+/**
+ * MIME type for the compact (typed array) NetVis payload
+ */
+export const BINARY_MIME_TYPE = 'application/vnd.netvis.binary+json';
+
+/**
+ * Sparse attribute column: rows holding a value and the values themselves
+ */
+export interface BinaryAttrs {
+  [name: string]: { rows: string; values: any[] };
+}
+
+/**
+ * Compact payload produced by Python's SceneBinaryEncoder.
+ *
+ * Numeric columns are base64 encoded little-endian typed arrays; string
+ * columns hold indices into `strings` (-1 for none).
+ */
+export interface BinaryGraphPayload {
+  version: number;
+  strings: string[];
+  nodes: {
+    count: number;
+    id: string;
+    x: string;
+    y: string;
+    name: string;
+    category: string;
+    attrs: BinaryAttrs;
+  };
+  links: {
+    count: number;
+    source: string;
+    target: string;
+    label: string;
+    value: string;
+    attrs: BinaryAttrs;
+  };
+  title?: string;
+}
+
+/**
+ * Decode base64 into a freshly allocated (hence aligned) byte buffer
+ *
+ * @param encoded
+ * @returns
+ */
+export function decodeBase64(encoded: string): ArrayBuffer {
+  const binary = atob(encoded);
+  const bytes = new Uint8Array(binary.length);
+  for (let i = 0; i < binary.length; i++) {
+    bytes[i] = binary.charCodeAt(i);
+  }
+  return bytes.buffer;
+}
+
+/**
+ * Decode a typed array column and check its length
+ */
+function decodeColumn<T extends Int32Array | Uint32Array | Float32Array>(
+  encoded: string,
+  ArrayType: { new (buffer: ArrayBuffer): T },
+  count: number,
+  name: string,
+): T {
+  const column = new ArrayType(decodeBase64(encoded));
+  if (column.length !== count) {
+    throw new Error(
+      `Invalid binary graph data: '${name}' has ${column.length} entries, expected ${count}`,
+    );
+  }
+  return column;
+}
+
+/**
+ * Copy sparse attribute columns onto the decoded records
+ */
+function applyAttrs(records: any[], attrs: BinaryAttrs | undefined): void {
+  for (const [name, column] of Object.entries(attrs || {})) {
+    const rows = new Uint32Array(decodeBase64(column.rows));
+    for (let i = 0; i < rows.length; i++) {
+      records[rows[i]][name] = column.values[i];
+    }
+  }
+}
+
+/**
+ * Decode a binary NetVis payload into graph data.
+ *
+ * Columns are decoded into typed arrays first; links then point at their
+ * node objects directly, so the force layout needs no ID lookup.
+ *
+ * @param payload - Payload from the 'application/vnd.netvis.binary+json' bundle
+ * @returns Graph data with nodes and links arrays
+ */
+export function decodeBinaryGraph(payload: BinaryGraphPayload): GraphData {
+  if (!payload || payload.version !== 1) {
+    throw new Error(
+      `Unsupported binary graph data version: ${payload && payload.version}`,
+    );
+  }
+  const strings = payload.strings;
+  const nodeCount = payload.nodes.count;
+  const linkCount = payload.links.count;
+
+  const ids = decodeColumn(payload.nodes.id, Int32Array, nodeCount, 'id');
+  const xs = decodeColumn(payload.nodes.x, Float32Array, nodeCount, 'x');
+  const ys = decodeColumn(payload.nodes.y, Float32Array, nodeCount, 'y');
+  const names = decodeColumn(payload.nodes.name, Int32Array, nodeCount, 'name');
+  const categories = decodeColumn(
+    payload.nodes.category,
+    Int32Array,
+    nodeCount,
+    'category',
+  );
+
+  const nodes: Node[] = new Array(nodeCount);
+  for (let i = 0; i < nodeCount; i++) {
+    const node: Node = { id: strings[ids[i]], x: xs[i], y: ys[i] };
+    if (names[i] >= 0) {
+      node.name = strings[names[i]];
+    }
+    if (categories[i] >= 0) {
+      node.category = strings[categories[i]];
+    }
+    nodes[i] = node;
+  }
+  applyAttrs(nodes, payload.nodes.attrs);
+
+  const sources = decodeColumn(
+    payload.links.source,
+    Uint32Array,
+    linkCount,
+    'source',
+  );
+  const targets = decodeColumn(
+    payload.links.target,
+    Uint32Array,
+    linkCount,
+    'target',
+  );
+  const labels = decodeColumn(payload.links.label, Int32Array, linkCount, 'label');
+  const values = decodeColumn(
+    payload.links.value,
+    Float32Array,
+    linkCount,
+    'value',
+  );
+
+  const links: Link[] = new Array(linkCount);
+  for (let i = 0; i < linkCount; i++) {
+    const source = nodes[sources[i]];
+    const target = nodes[targets[i]];
+    if (!source || !target) {
+      throw new Error(`Invalid binary graph data: link ${i} references a missing node`);
+    }
+    const link: Link = { source, target };
+    if (labels[i] >= 0) {
+      link.label = strings[labels[i]];
+    }
+    if (!Number.isNaN(values[i])) {
+      link.value = values[i];
+    }
+    links[i] = link;
+  }
+  applyAttrs(links, payload.links.attrs);
+
+  return { nodes, links };
+}
@@ -1,7 +1,7 @@
 import * as d3 from 'd3';
 import { SimulationNodeDatum, SimulationLinkDatum } from 'd3';
 import { Collors, Settings } from './settings';
-import { convertToCategoryKey } from './utils/string';
+import { resolveCategoryColor } from './utils/string';
 
 export interface Node extends SimulationNodeDatum {
   id: string;
@@ -9,8 +9,8 @@ export interface Node extends SimulationNodeDatum {
 }
 
 export interface Link extends SimulationLinkDatum<Node> {
-  source: string | Node;
-  target: string | Node;
+  source: string | number | Node;
+  target: string | number | Node;
   [key: string]: any; // Additional properties can be added
 }
 
@@ -22,6 +22,8 @@ export interface GraphOptions {
 export interface GraphData {
   nodes: Node[];
   links: Link[];
+  /** Link source/target are indices into nodes rather than node IDs */
+  linkIndex?: boolean;
 }
 
 /**
@@ -59,21 +61,24 @@ function adjustLinkPath(d: any) {
  * @param param1
  * @returns
  */
-function Graph(svg: any, { nodes, links }: { nodes: Node[]; links: Link[] }) {
+function Graph(svg: any, { nodes, links, linkIndex }: GraphData) {
   const markerId = `arrowhead-${Math.random().toString(36).substring(2, 8)}`;
 
   const g = svg.append('g');
 
+  const linkForce = d3.forceLink<Node, Link>(links);
+  if (!linkIndex) {
+    linkForce.id((d: any) => {
+      // Safely access id with null check
+      const node = d as Node;
+      return node && node.id ? String(node.id) : '';
+    });
+  }
+  // With linkIndex, d3's default accessor resolves source/target by node index
+
   const simulation = d3
     .forceSimulation(nodes)
-    .force(
-      'link',
-      d3.forceLink(links).id((d: any) => {
-        // Safely access id with null check
-        const node = d as Node;
-        return node && node.id ? String(node.id) : '';
-      }),
-    )
+    .force('link', linkForce)
     .force('charge', d3.forceManyBody())
     .force('center', d3.forceCenter(400, 400));
 
@@ -119,15 +124,8 @@ function Graph(svg: any, { nodes, links }: { nodes: Node[]; links: Link[] }) {
           : Settings.DEFAULT_NODE_SIZE) || Settings.DEFAULT_NODE_SIZE;
       return d.radius;
     })
-    .attr(
-      'fill',
-      (d: any) =>
-        Collors[
-          convertToCategoryKey(
-            d.category,
-            Settings.DEFAULT_COLOR,
-          ) as keyof typeof Collors
-        ],
+    .attr('fill', (d: any) =>
+      resolveCategoryColor(d.category, Collors, Settings.DEFAULT_COLOR),
     )
     .classed('circle', true);
 
@@ -21,6 +21,7 @@ export interface ExportConfig {
   graphData: {
     nodes: any[];
     links: any[];
+    linkIndex?: boolean;
   };
 }
 
@@ -34,20 +35,27 @@ export interface ExportConfig {
  * @param graphData - Graph data potentially containing object references
  * @returns Normalized graph data with IDs for source/target
  */
-function normalizeGraphData(graphData: { nodes: any[]; links: any[] }): {
+function normalizeGraphData(graphData: {
+  nodes: any[];
+  links: any[];
+  linkIndex?: boolean;
+}): {
   nodes: any[];
   links: any[];
 } {
-  // Normalize links: convert source/target objects back to IDs
+  // Normalize links: convert source/target objects (or node indices) back to IDs
+  const toId = (ref: any) => {
+    if (typeof ref === 'object' && ref !== null) {
+      return ref.id;
+    }
+    if (graphData.linkIndex && typeof ref === 'number') {
+      return graphData.nodes[ref]?.id;
+    }
+    return ref;
+  };
   const normalizedLinks = graphData.links.map((link) => {
-    const source =
-      typeof link.source === 'object' && link.source !== null
-        ? link.source.id
-        : link.source;
-    const target =
-      typeof link.target === 'object' && link.target !== null
-        ? link.target.id
-        : link.target;
+    const source = toId(link.source);
+    const target = toId(link.target);
 
     // Keep other link properties (weight, etc.) but exclude D3 simulation props
     const { index: _index, ...rest } = link;
@@ -8,5 +8,10 @@ export {
   validateVersion,
 } from './mimePlugin';
 
+export {
+  BINARY_MIME_TYPE,
+  decodeBase64,
+  decodeBinaryGraph,
+} from './binary';
 export * from './renderer';
 export * from './version';
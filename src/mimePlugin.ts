@@ -2,6 +2,7 @@ import { IRenderMime } from '@jupyterlab/rendermime-interfaces';
 import { Widget } from '@lumino/widgets';
 import packageJson from '../package.json';
 import { createDownloadButton } from './htmlExport';
+import { BINARY_MIME_TYPE, decodeBinaryGraph } from './binary';
 
 /**
  * MIME type for NetVis graph data
@@ -107,8 +108,11 @@ export class NetVisMimeRenderer
       // Validate version compatibility
       validateVersion(data.version);
 
-      // Parse graph data (handles empty strings)
-      const graphData = parseGraphData(data.data || '');
+      // Decode typed-array payloads, parse JSON ones (handles empty strings)
+      const graphData =
+        this._mimeType === BINARY_MIME_TYPE
+          ? decodeBinaryGraph(data.data)
+          : parseGraphData(data.data || '');
 
       // Import graph rendering dynamically to avoid circular dependencies
       const { renderGraph } = await import('./graph');
@@ -200,7 +204,7 @@ export class NetVisMimeRenderer
 const rendererFactory: IRenderMime.IRendererFactory & { defaultRank?: number } =
   {
     safe: true,
-    mimeTypes: [MIME_TYPE],
+    mimeTypes: [BINARY_MIME_TYPE, MIME_TYPE],
     // Explicit default rank to match JupyterLab 4 expectations and avoid
     // `defaultRank` lookups on undefined.
     defaultRank: 0,
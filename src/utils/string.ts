@@ -15,3 +15,29 @@ export function convertToCategoryKey(
     return str.replace(/\s+/g, '_').toUpperCase();
   }
 }
+
+const CSS_COLOR = /^(#[0-9a-f]{3,8}|(rgb|rgba|hsl|hsla)\(.*\))$/i;
+
+/**
+ * Category To Fill Color
+ *
+ * Categories naming a palette key (e.g. "type_b") use the palette color;
+ * CSS colors such as the hex colors produced by Python-side color scales
+ * are used as is. Missing categories use the default palette key.
+ *
+ * @param category
+ * @param palette
+ * @param defaultKey
+ * @returns
+ */
+export function resolveCategoryColor(
+  category: unknown,
+  palette: Record<string, string>,
+  defaultKey: string = 'TYPE_A',
+): string | undefined {
+  if (typeof category === 'string' && CSS_COLOR.test(category.trim())) {
+    return category.trim();
+  }
+  const key = convertToCategoryKey(category, defaultKey);
+  return palette[key];
+}